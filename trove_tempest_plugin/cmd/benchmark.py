@@ -0,0 +1,453 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Benchmark the Trove API through the plugin's database clients.
+
+Example::
+
+    trove-tempest-benchmark api --url http://trove:8779/v1.0/$PROJECT_ID \
+        --token $OS_TOKEN --concurrency 8 --duration 30
+
+The report is written as JSON, one entry per benchmarked operation. With
+``--fake`` the benchmark runs against an in-process fake Trove API instead,
+which measures the overhead of the clients themselves::
+
+    trove-tempest-benchmark api --fake --fake-catalog-size 10000 \
+        --fake-route show_flavor=0.01,0.005,0.01
+
+``fake-server`` serves the same fake API in the foreground, ``startup``
+measures the import-time cost the plugin adds to tempest commands, and
+``soak`` repeats the calls of the smoke tests for a long time and checks the
+latency and memory of every window for upward drift, exiting with status 1
+when it finds some::
+
+    trove-tempest-benchmark soak --url $TROVE_URL --token $OS_TOKEN \
+        --duration 3600 --window 60
+
+``decode`` compares the JSON decoders on a synthetic flavor catalog,
+``records`` compares the memory it takes as dicts and as typed records, and
+``memory`` profiles the memory the flavors calls hold on a large one.
+"""
+
+import argparse
+import collections
+import functools
+import json
+import os
+import sys
+
+from trove_tempest_plugin.common import auth
+from trove_tempest_plugin.common import benchmark
+from trove_tempest_plugin.common import fake_server
+from trove_tempest_plugin.common import flavors
+from trove_tempest_plugin.common import soak
+from trove_tempest_plugin.common import startup
+from trove_tempest_plugin.services.database import decoders
+from trove_tempest_plugin.services.database import memory
+from trove_tempest_plugin.services.database import records
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import limits_client
+from trove_tempest_plugin.services.database.json import versions_client
+
+API_OPERATIONS = ('list_db_flavors', 'show_db_flavor', 'list_db_limits',
+                  'list_db_versions')
+MEMORY_OPERATIONS = ('iter_db_flavors', 'iter_db_flavors_incremental',
+                     'list_db_flavors')
+
+
+def _build_clients(args, pool_maxsize=1):
+    provider = auth.StaticAuthProvider(args.url, args.token)
+    params = {
+        'disable_ssl_certificate_validation': args.insecure,
+        'http_timeout': args.timeout,
+        'pool_maxsize': max(pool_maxsize, 1),
+    }
+    return {
+        'flavors': flavors_client.DatabaseFlavorsClient(
+            provider, 'database', args.region, **params),
+        'limits': limits_client.DatabaseLimitsClient(
+            provider, 'database', args.region, **params),
+        'versions': versions_client.DatabaseVersionsClient(
+            provider, 'database', args.region, **params),
+    }
+
+
+def _api_operations(args):
+    clients = _build_clients(args, args.concurrency)
+    return {
+        'list_db_flavors': clients['flavors'].list_db_flavors,
+        'show_db_flavor': functools.partial(
+            clients['flavors'].show_db_flavor, args.flavor_ref),
+        'list_db_limits': clients['limits'].list_db_limits,
+        'list_db_versions': clients['versions'].list_db_versions,
+    }
+
+
+def _fake_server(args):
+    return fake_server.FakeTroveServer(
+        host=args.fake_host, port=args.fake_port,
+        catalog_size=args.fake_catalog_size,
+        profiles=dict(args.fake_route), seed=args.fake_seed)
+
+
+def run_api(args):
+    server = None
+    if args.fake:
+        server = _fake_server(args).start()
+        args.url = server.endpoint
+    try:
+        operations = _api_operations(args)
+        report = {}
+        for name in args.operations:
+            report[name] = benchmark.measure(operations[name],
+                                             concurrency=args.concurrency,
+                                             duration=args.duration)
+    finally:
+        if server is not None:
+            server.stop()
+    return report
+
+
+def _smoke_operations(args):
+    """Return the calls and checks of the flavors, limits and versions
+    smoke tests.
+    """
+    clients = _build_clients(args)
+
+    def find_flavor():
+        if flavors.find_db_flavor(clients['flavors'].iter_db_flavors(),
+                                  args.flavor_ref) is None:
+            raise LookupError("flavor %s not listed" % args.flavor_ref)
+
+    def absolute_limits():
+        limits = clients['limits'].list_db_limits()['limits']
+        if len([lim for lim in limits if lim['verb'] == 'ABSOLUTE']) != 1:
+            raise ValueError("expected one ABSOLUTE limit")
+
+    def current_version():
+        versions = clients['versions'].list_db_versions()['versions']
+        if len([v for v in versions if v['status'] == 'CURRENT']) != 1:
+            raise ValueError("expected one CURRENT version")
+
+    return collections.OrderedDict([
+        ('flavors', find_flavor),
+        ('limits', absolute_limits),
+        ('versions', current_version),
+    ])
+
+
+def run_soak(args):
+    server = None
+    if args.fake:
+        server = _fake_server(args).start()
+        args.url = server.endpoint
+
+    def progress(window):
+        latencies = "  ".join("%s p95 %s ms" % (name, op.get('p95'))
+                              for name, op in
+                              sorted(window['operations'].items()))
+        sys.stderr.write("%8.1f s  rss %d  %s\n"
+                         % (window['end'], window['rss_bytes'], latencies))
+    try:
+        return soak.run(_smoke_operations(args), duration=args.duration,
+                        iterations=args.iterations, window=args.window,
+                        alpha=args.alpha, min_slope=args.min_slope,
+                        warmup_windows=args.warmup_windows,
+                        on_window=progress)
+    finally:
+        if server is not None:
+            server.stop()
+
+
+def run_fake_server(args):
+    server = _fake_server(args)
+    sys.stderr.write("Serving fake Trove API at %s\n" % server.endpoint)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return {'requests': server.api.requests}
+
+
+def run_startup(args):
+    return dict((scenario, startup.measure(scenario, repeat=args.repeat))
+                for scenario in args.scenarios or startup.scenarios())
+
+
+def run_decode(args):
+    body = json.dumps(
+        {'flavors': fake_server.make_catalog(args.catalog_size)}
+    ).encode('utf-8')
+    report = {'catalog_size': args.catalog_size, 'body_bytes': len(body),
+              'decoders': {}}
+    for name in args.decoders or decoders.available():
+        loads = decoders.get_decoder(name)[1]
+        report['decoders'][name] = benchmark.measure_call(
+            functools.partial(loads, body), repeat=args.repeat)
+    if decoders.ijson is not None:
+        def incremental():
+            for _ in decoders.iter_items(body, 'flavors'):
+                pass
+        report['decoders']['ijson-incremental'] = benchmark.measure_call(
+            incremental, repeat=args.repeat)
+    return report
+
+
+def run_records(args):
+    body = json.dumps(
+        {'flavors': fake_server.make_catalog(args.catalog_size)}
+    ).encode('utf-8')
+    loads = decoders.get_decoder(decoders.AUTO)[1]
+    record_types = {'flavors': records.Flavor}
+    variants = {
+        'dicts': lambda: loads(body),
+        'records': lambda: records.convert(loads(body), record_types),
+    }
+    report = {'catalog_size': args.catalog_size, 'body_bytes': len(body)}
+    for name, func in variants.items():
+        report[name] = benchmark.measure_retained(func)
+        report[name]['time_ms'] = benchmark.measure_call(
+            func, repeat=args.repeat)['time_ms']
+    if report['dicts']['retained_bytes']:
+        retained = float(report['records']['retained_bytes'])
+        report['retained_ratio'] = round(
+            retained / report['dicts']['retained_bytes'], 3)
+    return report
+
+
+def run_memory(args):
+    if not memory.enable(args.frames):
+        raise SystemExit("tracemalloc is not available")
+    server = fake_server.FakeTroveServer(
+        catalog_size=args.catalog_size).start()
+    try:
+        client = flavors_client.DatabaseFlavorsClient(
+            auth.StaticAuthProvider(server.endpoint), 'database', '')
+        report = {'catalog_size': args.catalog_size, 'operations': {}}
+        operations = {
+            'list_db_flavors': client.list_db_flavors,
+            'iter_db_flavors': lambda: sum(1 for _ in
+                                           client.iter_db_flavors()),
+            'iter_db_flavors_incremental': lambda: sum(
+                1 for _ in client.iter_db_flavors(incremental=True)),
+        }
+        for name in args.operations or MEMORY_OPERATIONS:
+            mark = memory.class_start()
+            result = operations[name]()
+            report['operations'][name] = memory.class_report(
+                name, mark, args.top)
+            del result
+    finally:
+        server.stop()
+        memory.disable()
+    return report
+
+
+def _route_profile(value):
+    """Parse ROUTE=LATENCY[,JITTER[,ERROR_RATE]] into a RouteProfile."""
+    route, sep, spec = value.partition('=')
+    if not sep or route not in fake_server.ROUTES:
+        raise argparse.ArgumentTypeError(
+            "expected ROUTE=LATENCY[,JITTER[,ERROR_RATE]] with ROUTE one "
+            "of: %s" % ', '.join(fake_server.ROUTES))
+    try:
+        values = [float(v) for v in spec.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid numbers in %r" % value)
+    if not 1 <= len(values) <= 3:
+        raise argparse.ArgumentTypeError("invalid route profile %r" % value)
+    return route, fake_server.RouteProfile(*values)
+
+
+def _add_fake_server_arguments(parser):
+    parser.add_argument('--fake-host', default='127.0.0.1',
+                        help="Address the fake Trove API listens on.")
+    parser.add_argument('--fake-port', type=int, default=0,
+                        help="Port of the fake Trove API, 0 for any.")
+    parser.add_argument('--fake-catalog-size', type=int, default=100,
+                        help="Number of flavors of the fake Trove API.")
+    parser.add_argument('--fake-route', type=_route_profile, default=[],
+                        action='append',
+                        help="Latency and jitter in seconds and error rate "
+                             "of a fake route, as "
+                             "ROUTE=LATENCY[,JITTER[,ERROR_RATE]]. Routes: "
+                             "%s. May be repeated."
+                             % ', '.join(fake_server.ROUTES))
+    parser.add_argument('--fake-seed', type=int, default=None,
+                        help="Seed of the fake jitter and error injection.")
+
+
+def _add_target_arguments(parser):
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--url',
+                        help="Versioned database endpoint, e.g. "
+                             "http://trove:8779/v1.0/<project_id>.")
+    target.add_argument('--fake', action='store_true',
+                        help="Use an in-process fake Trove API.")
+    parser.add_argument('--token', default=os.environ.get('OS_TOKEN'),
+                        help="Keystone token, defaults to $OS_TOKEN.")
+    parser.add_argument('--region', default='',
+                        help="Region of the database endpoint.")
+    parser.add_argument('--insecure', action='store_true',
+                        help="Do not verify the endpoint's TLS "
+                             "certificate.")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="HTTP timeout in seconds.")
+    parser.add_argument('--flavor-ref', default='1',
+                        help="Flavor used by the flavor calls.")
+    _add_fake_server_arguments(parser)
+
+
+def _choice(choices):
+    # NOTE: argparse rejects an empty positional list when nargs='*' is
+    # combined with choices, so the choices are checked here instead.
+    def check(value):
+        if value not in choices:
+            raise argparse.ArgumentTypeError(
+                "invalid choice %r, expected one of: %s"
+                % (value, ', '.join(choices)))
+        return value
+    return check
+
+
+def _operation_list(value):
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = set(names) - set(API_OPERATIONS)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            "unknown operation(s): %s" % ', '.join(sorted(unknown)))
+    return names
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Trove API through the tempest plugin's "
+                    "database clients.")
+    parser.add_argument('--output', '-o', default='-',
+                        help="File the JSON report is written to, "
+                             "'-' for stdout.")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    api = subparsers.add_parser(
+        'api', help="Measure latency and throughput of Trove read calls.")
+    _add_target_arguments(api)
+    api.add_argument('--concurrency', type=int, default=1,
+                     help="Number of concurrent clients per operation.")
+    api.add_argument('--duration', type=float, default=10.0,
+                     help="Seconds spent on each operation.")
+    api.add_argument('--operations', type=_operation_list,
+                     default=list(API_OPERATIONS),
+                     help="Comma separated operations to run, out of: %s."
+                          % ', '.join(API_OPERATIONS))
+    api.set_defaults(func=run_api)
+
+    fake = subparsers.add_parser(
+        'fake-server', help="Serve a fake Trove API until interrupted.")
+    _add_fake_server_arguments(fake)
+    fake.set_defaults(func=run_fake_server)
+
+    soak_parser = subparsers.add_parser(
+        'soak', help="Repeat the smoke test calls and check latency and "
+                     "memory for upward drift.")
+    _add_target_arguments(soak_parser)
+    limit = soak_parser.add_mutually_exclusive_group(required=True)
+    limit.add_argument('--duration', type=float,
+                       help="Seconds to run for.")
+    limit.add_argument('--iterations', type=int,
+                       help="Number of times each smoke call is made.")
+    soak_parser.add_argument('--window', type=float, default=60.0,
+                             help="Length of a summary window, in seconds.")
+    soak_parser.add_argument('--alpha', type=float,
+                             default=soak.DEFAULT_ALPHA,
+                             help="Significance level of the trend test.")
+    soak_parser.add_argument('--min-slope', type=float,
+                             default=soak.DEFAULT_MIN_SLOPE,
+                             help="Smallest increase per window, relative "
+                                  "to the median, reported as drift.")
+    soak_parser.add_argument('--warmup-windows', type=int, default=1,
+                             help="Number of first windows left out of the "
+                                  "trend tests.")
+    soak_parser.set_defaults(func=run_soak)
+
+    start = subparsers.add_parser(
+        'startup', help="Measure the import-time cost of the plugin, in "
+                        "milliseconds.")
+    start.add_argument('--repeat', type=int, default=5,
+                       help="Number of runs of each scenario.")
+    start.add_argument('scenarios', nargs='*',
+                       type=_choice(startup.scenarios()),
+                       help="Scenarios to run, out of: %s. All by default."
+                            % ', '.join(startup.scenarios()))
+    start.set_defaults(func=run_startup)
+
+    decode = subparsers.add_parser(
+        'decode', help="Compare decode time and peak memory of the JSON "
+                       "decoders on a synthetic flavor catalog.")
+    decode.add_argument('--catalog-size', type=int, default=10000,
+                        help="Number of flavors in the decoded body.")
+    decode.add_argument('--repeat', type=int, default=5,
+                        help="Number of timed decodes per decoder.")
+    decode.add_argument('decoders', nargs='*',
+                        type=_choice(decoders.PREFERRED),
+                        help="Decoders to compare, out of: %s. All "
+                             "installed ones by default."
+                             % ', '.join(decoders.PREFERRED))
+    decode.set_defaults(func=run_decode)
+
+    rec = subparsers.add_parser(
+        'records', help="Compare the memory held by a synthetic flavor "
+                        "catalog decoded into dicts and into typed "
+                        "records.")
+    rec.add_argument('--catalog-size', type=int, default=50000,
+                     help="Number of flavors in the decoded body.")
+    rec.add_argument('--repeat', type=int, default=3,
+                     help="Number of timed decodes per variant.")
+    rec.set_defaults(func=run_records)
+
+    mem = subparsers.add_parser(
+        'memory', help="Profile the memory held by the flavors calls on a "
+                       "large fake flavor catalog.")
+    mem.add_argument('--catalog-size', type=int, default=50000,
+                     help="Number of flavors of the fake Trove API.")
+    mem.add_argument('--frames', type=int, default=5,
+                     help="Stack frames kept per traced allocation.")
+    mem.add_argument('--top', type=int, default=5,
+                     help="Allocation sites reported per operation.")
+    mem.add_argument('operations', nargs='*',
+                     type=_choice(MEMORY_OPERATIONS),
+                     help="Operations to profile, out of: %s. All by "
+                          "default." % ', '.join(MEMORY_OPERATIONS))
+    mem.set_defaults(func=run_memory)
+    return parser
+
+
+def write_report(report, output):
+    data = json.dumps(report, indent=2, sort_keys=True)
+    if output == '-':
+        sys.stdout.write(data + '\n')
+    else:
+        with open(output, 'w') as f:
+            f.write(data + '\n')
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    report = args.func(args)
+    write_report(report, args.output)
+    return 1 if report.get('drift_detected') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Write an stestr worker file from recorded test durations.
+
+The durations recorded through ``[database] test_durations_file`` are used
+to spread the test classes of a run over the stestr workers, so that the
+workers finish at about the same time::
+
+    stestr list trove_tempest_plugin > tests.txt
+    trove-tempest-schedule --durations durations.json --workers 4 \
+        --worker-file workers.yaml tests.txt
+    stestr run --worker-file workers.yaml trove_tempest_plugin
+
+A JSON summary of the expected load of each worker is written to stdout.
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+
+from trove_tempest_plugin.common import durations
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        description="Write an stestr worker file that balances the recorded "
+                    "durations of the test classes over the workers.")
+    parser.add_argument('--durations', required=True,
+                        help="Durations file recorded through [database] "
+                             "test_durations_file.")
+    parser.add_argument('--workers', type=int,
+                        default=multiprocessing.cpu_count(),
+                        help="Number of stestr workers, the number of CPUs "
+                             "by default.")
+    parser.add_argument('--worker-file', required=True,
+                        help="Path of the stestr worker file to write.")
+    parser.add_argument('tests', nargs='?', type=argparse.FileType('r'),
+                        default=sys.stdin,
+                        help="File listing the test ids to schedule, as "
+                             "printed by 'stestr list'; stdin by default.")
+    return parser
+
+
+def schedule(args):
+    test_ids = [line.strip() for line in args.tests if line.strip()]
+    store = durations.DurationStore(args.durations)
+    groups = durations.partition(test_ids, args.workers, store.durations(),
+                                 store.setup_durations())
+    with open(args.worker_file, 'w') as f:
+        f.write(durations.worker_file(groups))
+    return {'worker_file': args.worker_file,
+            'workers': [{'expected_seconds': load, 'tests': len(tests)}
+                        for load, tests in groups]}
+
+
+def main(argv=None):
+    report = schedule(get_parser().parse_args(argv))
+    sys.stdout.write(json.dumps(report, indent=2, sort_keys=True) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
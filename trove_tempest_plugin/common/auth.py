@@ -0,0 +1,49 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from six.moves.urllib import parse as urlparse
+
+
+class StaticAuthProvider(object):
+    """Auth provider for a known endpoint and an optional fixed token.
+
+    It lets the database clients run outside of a tempest run, for instance
+    from the benchmark tools, without a Keystone catalog.
+
+    :param endpoint: versioned database endpoint, e.g.
+                     ``http://trove:8779/v1.0/<project_id>``
+    :param token: token sent as ``X-Auth-Token``, if any
+    """
+
+    def __init__(self, endpoint, token=None):
+        self.endpoint = endpoint.rstrip('/')
+        self.token = token
+
+    def get_token(self):
+        return self.token
+
+    def base_url(self, filters, auth_data=None):
+        if filters.get('skip_path'):
+            parts = urlparse.urlparse(self.endpoint)
+            return '%s://%s' % (parts.scheme, parts.netloc)
+        return self.endpoint
+
+    def auth_request(self, method, url, headers=None, body=None,
+                     filters=None):
+        base_url = self.base_url(filters or {})
+        url = '/'.join([base_url, url]) if url else base_url
+        headers = dict(headers or {})
+        if self.token:
+            headers['X-Auth-Token'] = self.token
+        return url, headers, body
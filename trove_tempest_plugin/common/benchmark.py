@@ -0,0 +1,150 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Latency and throughput measurement of database client calls."""
+
+import threading
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from trove_tempest_plugin.common import stats
+
+
+def _ratio(numerator, denominator):
+    if not denominator:
+        return 0.0
+    return round(float(numerator) / denominator, 5)
+
+
+def measure(operation, concurrency=1, duration=10.0):
+    """Call ``operation`` from several threads for a fixed duration.
+
+    :param operation: callable taking no arguments
+    :param concurrency: number of threads calling ``operation`` in a loop
+    :param duration: time in seconds after which no new call is started
+    :return: a dict with the request count, requests per second, error
+             count and rate, errors by exception type and latency
+             percentiles in milliseconds
+    """
+    latencies = []
+    errors = {}
+    lock = threading.Lock()
+    deadline = time.time() + duration
+
+    def worker():
+        own_latencies = []
+        own_errors = {}
+        while time.time() < deadline:
+            start = time.time()
+            try:
+                operation()
+            except Exception as e:
+                name = type(e).__name__
+                own_errors[name] = own_errors.get(name, 0) + 1
+            own_latencies.append(time.time() - start)
+        with lock:
+            latencies.extend(own_latencies)
+            for name, count in own_errors.items():
+                errors[name] = errors.get(name, 0) + count
+
+    started = time.time()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - started
+
+    requests = len(latencies)
+    error_count = sum(errors.values())
+    return {
+        'concurrency': concurrency,
+        'duration': round(elapsed, 3),
+        'requests': requests,
+        'requests_per_second': _ratio(requests, elapsed),
+        'errors': error_count,
+        'error_rate': _ratio(error_count, requests),
+        'errors_by_type': errors,
+        'latency_ms': stats.summarize(latencies),
+    }
+
+
+def sample(operation, count, warmup=0):
+    """Call ``operation`` ``count`` times in a row and summarize latency.
+
+    :param warmup: number of untimed calls made first, e.g. to open
+                   connections
+    :return: latency percentiles in milliseconds, see
+             :func:`trove_tempest_plugin.common.stats.summarize`
+    """
+    for _ in range(warmup):
+        operation()
+    latencies = []
+    for _ in range(count):
+        start = time.time()
+        operation()
+        latencies.append(time.time() - start)
+    return stats.summarize(latencies)
+
+
+def measure_retained(func):
+    """Return the memory still held by the result of a function call.
+
+    :return: a dict with the retained and peak memory of the call in bytes,
+             None without tracemalloc
+    """
+    if tracemalloc is None:
+        return {'retained_bytes': None, 'peak_bytes': None}
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {'retained_bytes': current - before, 'peak_bytes': peak - before}
+
+
+def measure_call(func, repeat=5):
+    """Measure the time and peak memory of a function call.
+
+    The call is timed ``repeat`` times, then run once more under
+    tracemalloc, when available, to record the peak memory it allocates.
+
+    :return: a dict with the median time in milliseconds and the peak
+             memory in bytes (None without tracemalloc)
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        durations.append(time.time() - start)
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {
+        'time_ms': stats.summarize(durations)['p50'],
+        'peak_bytes': peak,
+    }
@@ -0,0 +1,167 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Bulk deletion of the database resources created by a test class.
+
+Resources are tracked together with the resources that may only be deleted
+after them, e.g. a backup before the instance it was taken from. The
+:class:`CleanupRegistry` sorts them into dependency levels, sends the
+delete requests of a level concurrently, and waits for each kind of
+resource of that level to be gone with one batched waiter before moving on
+to the next level. Teardown time therefore grows with the depth of the
+dependency graph rather than with the number of resources.
+"""
+
+import collections
+from concurrent import futures
+import threading
+
+from oslo_log import log as logging
+from tempest.lib import exceptions as lib_exc
+
+from trove_tempest_plugin import exceptions
+
+LOG = logging.getLogger(__name__)
+
+ResourceKind = collections.namedtuple('ResourceKind',
+                                      ['delete', 'wait_deleted'])
+
+
+class CleanupRegistry(object):
+    """Resources to delete, by kind and dependency.
+
+    Resources may be tracked from several threads at once.
+
+    :param max_workers: maximum number of concurrent delete requests
+    """
+
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        self._kinds = {}
+        # (kind, id) -> keys of the resources it must be deleted before
+        self._resources = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def register_kind(self, kind, delete, wait_deleted=None):
+        """Declare how a kind of resource is deleted.
+
+        :param delete: callable taking a resource id and sending its delete
+                       request; ``NotFound`` errors are ignored
+        :param wait_deleted: callable taking a list of ids and returning
+                             once all of them are gone, if deletion is
+                             asynchronous
+        """
+        self._kinds[kind] = ResourceKind(delete, wait_deleted)
+
+    def track(self, kind, resource_id, before=()):
+        """Track a resource for deletion.
+
+        :param before: ``(kind, id)`` pairs of tracked resources that may
+                       only be deleted once this one is gone
+        """
+        if kind not in self._kinds:
+            raise ValueError("Unknown resource kind %r" % kind)
+        with self._lock:
+            self._resources.setdefault((kind, resource_id), set()).update(
+                tuple(key) for key in before)
+
+    def untrack(self, kind, resource_id):
+        """Forget a resource, e.g. because the test deleted it already."""
+        with self._lock:
+            self._resources.pop((kind, resource_id), None)
+
+    def __len__(self):
+        return len(self._resources)
+
+    def levels(self):
+        """Return the tracked resources grouped by deletion order.
+
+        Resources of a level only have to wait for those of earlier levels.
+        """
+        with self._lock:
+            resources = collections.OrderedDict(
+                (key, set(befores))
+                for key, befores in self._resources.items())
+        after = dict((key, set()) for key in resources)
+        for key, befores in resources.items():
+            for other in befores:
+                if other in after:
+                    after[other].add(key)
+        depth = {}
+
+        def level(key, path=()):
+            if key in path:
+                raise ValueError("Cyclic cleanup dependency: %s" % (
+                    ' -> '.join('%s %s' % k for k in path + (key,))))
+            if key not in depth:
+                depth[key] = 1 + max([level(k, path + (key,))
+                                      for k in after[key]] or [-1])
+            return depth[key]
+
+        levels = collections.defaultdict(list)
+        for key in resources:
+            levels[level(key)].append(key)
+        return [levels[i] for i in sorted(levels)]
+
+    def _delete(self, key):
+        kind, resource_id = key
+        try:
+            self._kinds[kind].delete(resource_id)
+        except lib_exc.NotFound:
+            pass
+
+    def cleanup(self):
+        """Delete all tracked resources, level by level.
+
+        Every resource is attempted even if others fail to be deleted.
+
+        :raises DatabaseCleanupException: if any resource could not be
+                                          deleted or waited for
+        """
+        levels = self.levels()
+        with self._lock:
+            for keys in levels:
+                for key in keys:
+                    self._resources.pop(key, None)
+        failed = []
+        with futures.ThreadPoolExecutor(
+                max_workers=max(1, self.max_workers)) as executor:
+            for keys in levels:
+                deletes = dict((executor.submit(self._delete, key), key)
+                               for key in keys)
+                deleted = collections.defaultdict(list)
+                for future, key in deletes.items():
+                    try:
+                        future.result()
+                    except Exception:
+                        LOG.exception("Failed to delete %s %s", *key)
+                        failed.append(key)
+                    else:
+                        deleted[key[0]].append(key[1])
+                waits = dict(
+                    (executor.submit(self._kinds[kind].wait_deleted, ids),
+                     (kind, ids))
+                    for kind, ids in deleted.items()
+                    if self._kinds[kind].wait_deleted is not None)
+                for future, (kind, ids) in waits.items():
+                    try:
+                        future.result()
+                    except Exception:
+                        LOG.exception("Failed waiting for the deletion of "
+                                      "%s %s", kind, ', '.join(map(str, ids)))
+                        failed.extend((kind, i) for i in ids)
+        if failed:
+            raise exceptions.DatabaseCleanupException(
+                count=len(failed),
+                resources=', '.join('%s %s' % key for key in failed))
@@ -0,0 +1,200 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Per-test durations across runs, and worker schedules built from them.
+
+Test durations are stored in a small JSON file keyed by the idempotent id
+of each test, which stays the same when a test is renamed or moved, along
+with the setup time of each test class, keyed by the class name. Every
+test worker merges its own durations into the file at the end of each test
+class, under an exclusive lock, as a moving average over the runs.
+
+:func:`partition` uses the stored durations to spread the test classes of
+a run over stestr workers, longest first, and :func:`worker_file` renders
+the result as an stestr ``--worker-file``. Classes are never split, so
+each class is set up by a single worker.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Weight of the latest run in the moving average of a test's duration.
+SMOOTHING = 0.3
+
+_ID_ATTR = re.compile(r'\bid-([0-9a-fA-F-]{36})\b')
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def split_test_id(test_id):
+    """Split a test id into its name and its idempotent id, if any.
+
+    ``pkg.Class.test_x[id-<uuid>,smoke]`` gives ``('pkg.Class.test_x',
+    '<uuid>')``.
+    """
+    name, sep, attrs = test_id.partition('[')
+    match = _ID_ATTR.search(attrs) if sep else None
+    return name, match.group(1) if match else None
+
+
+class DurationStore(object):
+    """Durations recorded by this process, merged into a file on flush.
+
+    :param path: JSON file mapping idempotent ids to the test name, the
+                 number of recorded runs and the average duration in
+                 seconds, and test class names to the same for the class
+                 setup, flagged with ``setup``
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def record(self, idempotent_id, test_id, duration):
+        """Record the duration of a test run."""
+        with self._lock:
+            self._pending.setdefault(
+                idempotent_id, (test_id, False, []))[2].append(duration)
+
+    def record_setup(self, class_id, duration):
+        """Record the time a test class took to set up."""
+        with self._lock:
+            self._pending.setdefault(
+                class_id, (class_id, True, []))[2].append(duration)
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def flush(self):
+        """Merge the pending durations into the file and forget them."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        with open(self.path + '.lock', 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            data = self.load()
+            for key, (test_id, setup, durations) in pending.items():
+                entry = data.get(key)
+                for duration in durations:
+                    if entry is None:
+                        entry = {'runs': 0, 'duration': duration}
+                    previous = (1 - SMOOTHING) * entry['duration']
+                    entry['duration'] = round(
+                        previous + SMOOTHING * duration, 4)
+                    entry['runs'] += 1
+                entry['test'] = test_id
+                if setup:
+                    entry['setup'] = True
+                data[key] = entry
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, sort_keys=True, separators=(',', ':'))
+            os.rename(tmp, self.path)
+
+    def durations(self):
+        """Return the stored average duration per idempotent id."""
+        return dict((key, entry['duration'])
+                    for key, entry in self.load().items()
+                    if not entry.get('setup'))
+
+    def setup_durations(self):
+        """Return the stored average setup time per test class name."""
+        return dict((key, entry['duration'])
+                    for key, entry in self.load().items()
+                    if entry.get('setup'))
+
+
+def shared_store(path):
+    """Return the process-wide duration store, creating it on first call."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = DurationStore(path)
+        return _shared
+
+
+def class_id(test_id):
+    """Return the name of the class of a test id."""
+    return split_test_id(test_id)[0].rsplit('.', 1)[0]
+
+
+def partition(test_ids, workers, durations, setup_durations=None,
+              default=None):
+    """Spread test classes over workers so that they finish together.
+
+    The cost of a class is its setup time plus the duration of its tests.
+    Classes are handed out costliest first to the least loaded worker.
+    Tests without a stored duration are assumed to take ``default``
+    seconds, the median of the known durations by default.
+
+    :param test_ids: test ids as listed by ``stestr list``
+    :param workers: number of workers
+    :param durations: average duration per idempotent id
+    :param setup_durations: average setup time per test class name
+    :return: a list of ``(expected_seconds, [test_id, ...])`` per worker
+    """
+    setup_durations = setup_durations or {}
+    known = sorted(durations.values())
+    if default is None:
+        default = known[len(known) // 2] if known else 1.0
+    classes = {}
+    for test_id in test_ids:
+        idempotent_id = split_test_id(test_id)[1]
+        entry = classes.setdefault(class_id(test_id), [0.0, []])
+        entry[0] += durations.get(idempotent_id, default)
+        entry[1].append(test_id)
+    weighted = [(cost + setup_durations.get(name, 0.0), name, tests)
+                for name, (cost, tests) in classes.items()]
+    weighted.sort(key=lambda item: (-item[0], item[1]))
+    groups = [[0.0, []] for _ in range(max(workers, 1))]
+    for cost, _, tests in weighted:
+        group = min(groups, key=lambda g: g[0])
+        group[0] += cost
+        group[1].extend(tests)
+    return [(round(load, 3), sorted(tests)) for load, tests in groups]
+
+
+def worker_file(groups):
+    """Render worker groups as the YAML of an stestr ``--worker-file``.
+
+    Each worker gets one regex per test class, so the file selects every
+    test of those classes; pass ``stestr run`` the filters the test list
+    was made with.
+    """
+    lines = []
+    for _, test_ids in groups:
+        if not test_ids:
+            continue
+        lines.append('- worker:')
+        for name in sorted(set(class_id(test_id) for test_id in test_ids)):
+            # JSON strings are valid YAML scalars.
+            lines.append('  - %s' % json.dumps('^%s\\.' % re.escape(name)))
+    return '\n'.join(lines) + '\n'
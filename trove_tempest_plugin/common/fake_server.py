@@ -0,0 +1,323 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-process stand-in for the Trove read API.
+
+:class:`FakeTroveAPI` answers the requests of the flavors, limits and
+versions clients from a synthetic flavor catalog of configurable size, with
+per-route latency, jitter and error injection. :class:`FakeTroveServer`
+serves it over keep-alive HTTP/1.1 from a background thread, which is
+enough to measure the client-side overhead of the plugin and how it scales
+with catalog size and concurrency without a real Trove deployment::
+
+    with fake_server.FakeTroveServer(catalog_size=10000) as server:
+        client = flavors_client.DatabaseFlavorsClient(
+            auth.StaticAuthProvider(server.endpoint), 'database', '')
+        client.list_db_flavors()
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse as urlparse
+
+ROUTES = ('versions', 'list_flavors', 'show_flavor', 'limits')
+
+API_VERSION = 'v1.0'
+DEFAULT_PROJECT = 'fake-project'
+
+_PATH_RE = re.compile(r'^/(?P<version>v[\d.]+)/(?P<project>[^/]+)/'
+                      r'(?P<collection>flavors|limits)(?:/(?P<id>[^/]+))?/?$')
+
+_STATUS_ERRORS = {
+    400: 'badRequest',
+    404: 'itemNotFound',
+    413: 'overLimit',
+    500: 'computeFault',
+    503: 'serviceUnavailable',
+}
+
+
+class RouteProfile(object):
+    """Latency and failure behaviour of a route.
+
+    :param latency: seconds added to every response
+    :param jitter: up to this many seconds are randomly added to or removed
+                   from ``latency``
+    :param error_rate: fraction of requests answered with ``error_status``
+    :param error_status: HTTP status of injected errors
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0,
+                 error_status=503):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+    def delay(self, rand):
+        if not self.latency and not self.jitter:
+            return 0.0
+        return max(0.0, self.latency + rand.uniform(-self.jitter,
+                                                    self.jitter))
+
+
+def make_flavor(flavor_id, base_url, project=DEFAULT_PROJECT):
+    """Return a synthetic Trove flavor."""
+    href = '%s/%s/%s/flavors/%s' % (base_url, API_VERSION, project,
+                                    flavor_id)
+    return {
+        'id': flavor_id,
+        'str_id': str(flavor_id),
+        'name': 'fake.flavor-%d' % flavor_id,
+        'ram': 512 * (1 + flavor_id % 64),
+        'vcpus': 1 + flavor_id % 16,
+        'disk': 10 * (1 + flavor_id % 20),
+        'ephemeral': 0,
+        'links': [
+            {'href': href, 'rel': 'self'},
+            {'href': '%s/flavors/%s' % (base_url, flavor_id),
+             'rel': 'bookmark'},
+        ],
+    }
+
+
+def make_catalog(size, base_url='http://localhost'):
+    """Return ``size`` synthetic flavors with ids 1 to ``size``."""
+    return [make_flavor(i, base_url) for i in range(1, size + 1)]
+
+
+class FakeTroveAPI(object):
+    """Request handler of the fake Trove API.
+
+    It is usable as a WSGI application, and through :meth:`handle` by
+    :class:`FakeTroveServer`.
+
+    :param catalog_size: number of synthetic flavors
+    :param profiles: dict mapping route names from :data:`ROUTES` to
+                     :class:`RouteProfile`
+    :param base_url: URL the API is reachable at, used in links
+    :param seed: seed of the latency jitter and error injection
+    """
+
+    def __init__(self, catalog_size=100, profiles=None,
+                 base_url='http://localhost', seed=None):
+        self.base_url = base_url.rstrip('/')
+        self.catalog_size = catalog_size
+        self.profiles = dict((route, RouteProfile()) for route in ROUTES)
+        self.profiles.update(profiles or {})
+        self.requests = dict((route, 0) for route in ROUTES)
+        self.not_modified = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.set_catalog(make_catalog(catalog_size, self.base_url))
+
+    def set_catalog(self, flavors):
+        self.flavors = flavors
+        self._positions = dict((str(f['id']), i)
+                               for i, f in enumerate(flavors))
+        self._all_flavors = self._dump({'flavors': flavors})
+
+    @staticmethod
+    def _dump(body):
+        return json.dumps(body).encode('utf-8')
+
+    def _route(self, path):
+        if path.rstrip('/') == '':
+            return 'versions', None
+        match = _PATH_RE.match(path)
+        if match is None:
+            return None, None
+        if match.group('collection') == 'limits':
+            return 'limits', match
+        if match.group('id') is not None:
+            return 'show_flavor', match
+        return 'list_flavors', match
+
+    def _error(self, status, message):
+        fault = _STATUS_ERRORS.get(status, 'fault')
+        body = {fault: {'code': status, 'message': message}}
+        return status, self._dump(body)
+
+    def handle(self, method, path, query='', headers=None):
+        """Answer a request.
+
+        Successful responses carry an ``ETag``; a request whose
+        ``If-None-Match`` header matches it is answered with ``304``.
+
+        :param headers: request headers, with lower case names
+        :return: a tuple ``(status, headers, body)``
+        """
+        route, match = self._route(path)
+        if route is None:
+            status, body = self._error(404, 'No route for %s' % path)
+        elif method != 'GET':
+            status, body = self._error(405, 'Method %s not allowed' % method)
+        else:
+            profile = self.profiles[route]
+            with self._lock:
+                self.requests[route] += 1
+                delay = profile.delay(self._random)
+                failed = self._random.random() < profile.error_rate
+            if delay:
+                time.sleep(delay)
+            if failed:
+                status, body = self._error(profile.error_status,
+                                           'Injected failure')
+            else:
+                params = dict(urlparse.parse_qsl(query))
+                status, body = getattr(self, '_' + route)(match, params)
+        resp_headers = [('Content-Type', 'application/json'),
+                        ('X-OpenStack-Request-ID', 'req-%s' % uuid.uuid4())]
+        if status == 200:
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            resp_headers.append(('ETag', etag))
+            if (headers or {}).get('if-none-match') == etag:
+                with self._lock:
+                    self.not_modified += 1
+                status, body = 304, b''
+        resp_headers.append(('Content-Length', str(len(body))))
+        return status, resp_headers, body
+
+    def _versions(self, match, params):
+        return 200, self._dump({'versions': [{
+            'id': API_VERSION,
+            'status': 'CURRENT',
+            'updated': '2012-08-01T00:00:00Z',
+            'links': [{'href': '%s/%s/' % (self.base_url, API_VERSION),
+                       'rel': 'self'}],
+        }]})
+
+    def _limits(self, match, params):
+        limits = [{'verb': 'ABSOLUTE', 'max_instances': 5,
+                   'max_backups': 50, 'max_volumes': 20}]
+        for verb in ('POST', 'PUT', 'DELETE', 'GET'):
+            limits.append({'verb': verb, 'uri': '*', 'regex': '.*',
+                           'value': 200, 'remaining': 200, 'unit': 'MINUTE',
+                           'nextAvailable': '2012-08-01T00:00:00Z'})
+        return 200, self._dump({'limits': limits})
+
+    def _show_flavor(self, match, params):
+        position = self._positions.get(match.group('id'))
+        if position is None:
+            return self._error(404, 'Flavor %s could not be found'
+                               % match.group('id'))
+        return 200, self._dump({'flavor': self.flavors[position]})
+
+    def _list_flavors(self, match, params):
+        if 'limit' not in params and 'marker' not in params:
+            return 200, self._all_flavors
+        try:
+            limit = int(params.get('limit', len(self.flavors)))
+        except ValueError:
+            return self._error(400, 'Invalid limit')
+        start = 0
+        if 'marker' in params:
+            if params['marker'] not in self._positions:
+                return self._error(400, 'Invalid marker')
+            start = self._positions[params['marker']] + 1
+        page = self.flavors[start:start + limit]
+        body = {'flavors': page}
+        if page and start + limit < len(self.flavors):
+            query = urlparse.urlencode({'limit': limit,
+                                        'marker': page[-1]['id']})
+            body['links'] = [{'rel': 'next', 'href': '%s%s?%s' % (
+                self.base_url, match.group(0), query)}]
+        return 200, self._dump(body)
+
+    def __call__(self, environ, start_response):
+        headers = {}
+        if 'HTTP_IF_NONE_MATCH' in environ:
+            headers['if-none-match'] = environ['HTTP_IF_NONE_MATCH']
+        status, headers, body = self.handle(environ['REQUEST_METHOD'],
+                                            environ.get('PATH_INFO', '/'),
+                                            environ.get('QUERY_STRING', ''),
+                                            headers)
+        reason = BaseHTTPServer.BaseHTTPRequestHandler.responses.get(
+            status, ('',))[0]
+        start_response('%d %s' % (status, reason), headers)
+        return [body]
+
+
+class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        parts = urlparse.urlsplit(self.path)
+        status, headers, body = self.server.api.handle(
+            self.command, parts.path, parts.query,
+            dict((k.lower(), v) for k, v in self.headers.items()))
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeTroveServer(object):
+    """Serve a :class:`FakeTroveAPI` from a background thread.
+
+    Extra keyword arguments are passed to :class:`FakeTroveAPI`. Use
+    :attr:`endpoint` as the database endpoint of the clients.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, project=DEFAULT_PROJECT,
+                 **kwargs):
+        self._httpd = _HTTPServer((host, port), _RequestHandler)
+        self.host, self.port = self._httpd.server_address[:2]
+        self.url = 'http://%s:%d' % (self.host, self.port)
+        self.endpoint = '%s/%s/%s' % (self.url, API_VERSION, project)
+        kwargs.setdefault('base_url', self.url)
+        self.api = self._httpd.api = FakeTroveAPI(**kwargs)
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
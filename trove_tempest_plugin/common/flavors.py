@@ -0,0 +1,179 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+
+# Fields that must match between a Trove flavor and its Nova counterpart.
+COMPARED_FIELDS = ('name', 'ram', 'vcpus', 'disk')
+# Nova fields that Trove is expected not to expose.
+OS_ONLY_FIELDS = ('swap',)
+
+# Placeholder for a field that is absent from one side of a comparison.
+ABSENT = object()
+
+Mismatch = collections.namedtuple(
+    'Mismatch', ['flavor_id', 'field', 'db_value', 'os_value'])
+
+
+def db_flavor_id(db_flavor):
+    """Return the id a Trove flavor is known by, as a string.
+
+    Trove reports flavors with non-integer ids through ``str_id`` and leaves
+    ``id`` empty.
+    """
+    if db_flavor.get('id'):
+        return str(db_flavor['id'])
+    return db_flavor.get('str_id')
+
+
+def index_db_flavors(db_flavors, duplicates=None):
+    """Index Trove flavors by their string id in a single pass.
+
+    The first flavor listed under an id wins. If ``duplicates`` is a list,
+    the ids listed more than once are appended to it, once each.
+    """
+    index = {}
+    for flavor in db_flavors:
+        flavor_id = db_flavor_id(flavor)
+        if flavor_id not in index:
+            index[flavor_id] = flavor
+        elif duplicates is not None and flavor_id not in duplicates:
+            duplicates.append(flavor_id)
+    return index
+
+
+def find_db_flavor(db_flavors, flavor_id):
+    """Return the first Trove flavor with the given id, or None.
+
+    ``db_flavors`` may be any iterable, such as the generator returned by
+    ``iter_db_flavors``; it is consumed only up to the match.
+    """
+    flavor_id = str(flavor_id)
+    for flavor in db_flavors:
+        if db_flavor_id(flavor) == flavor_id:
+            return flavor
+    return None
+
+
+class FlavorDiff(object):
+    """Differences between the Trove and the Nova flavor lists.
+
+    :ivar missing: ids of Nova flavors that Trove does not list
+    :ivar extra: ids of Trove flavors that Nova does not list
+    :ivar mismatched: list of :class:`Mismatch` for flavors known to both
+    :ivar db_duplicates: ids that Trove lists more than once
+    :ivar os_duplicates: ids that Nova lists more than once
+    """
+
+    def __init__(self, missing, extra, mismatched, db_duplicates=(),
+                 os_duplicates=()):
+        self.missing = missing
+        self.extra = extra
+        self.mismatched = mismatched
+        self.db_duplicates = list(db_duplicates)
+        self.os_duplicates = list(os_duplicates)
+
+    def __bool__(self):
+        return any((self.missing, self.extra, self.mismatched,
+                    self.db_duplicates, self.os_duplicates))
+
+    __nonzero__ = __bool__
+
+    def __str__(self):
+        lines = []
+        if self.missing:
+            lines.append("missing from DB: %s" % ', '.join(self.missing))
+        if self.extra:
+            lines.append("not in OS: %s" % ', '.join(self.extra))
+        if self.db_duplicates:
+            lines.append("listed more than once in DB: %s"
+                         % ', '.join(self.db_duplicates))
+        if self.os_duplicates:
+            lines.append("listed more than once in OS: %s"
+                         % ', '.join(self.os_duplicates))
+        for m in self.mismatched:
+            lines.append("flavor %s differs on '%s': DB %s, OS %s"
+                         % (m.flavor_id, m.field, _show(m.db_value),
+                            _show(m.os_value)))
+        return '; '.join(lines) or 'no differences'
+
+
+def _show(value):
+    return 'absent' if value is ABSENT else value
+
+
+def compare_values(flavor_id, names, db_flavor, os_flavor, in_db=True):
+    """Return the fields of a Trove and a Nova flavor that do not match.
+
+    Every field must be in the Nova flavor. With ``in_db``, it must also be
+    in the Trove flavor with the same string value; otherwise it must be
+    absent from the Trove flavor.
+
+    :return: a list of :class:`Mismatch`
+    """
+    mismatches = []
+    for name in names:
+        db_value = db_flavor.get(name, ABSENT)
+        os_value = os_flavor.get(name, ABSENT)
+        if in_db:
+            missing = db_value is ABSENT or os_value is ABSENT
+            matches = not missing and str(db_value) == str(os_value)
+        else:
+            matches = db_value is ABSENT and os_value is not ABSENT
+        if not matches:
+            mismatches.append(Mismatch(flavor_id, name, db_value, os_value))
+    return mismatches
+
+
+def _compare(flavor_id, db_flavor, os_flavor):
+    mismatches = compare_values(flavor_id, COMPARED_FIELDS, db_flavor,
+                                os_flavor)
+    mismatches.extend(compare_values(flavor_id, OS_ONLY_FIELDS, db_flavor,
+                                     os_flavor, in_db=False))
+    return mismatches
+
+
+def diff_flavors(db_flavors, os_flavors):
+    """Compare Trove flavors against detailed Nova flavors.
+
+    Both lists are indexed by id once, so the comparison is linear in the
+    number of flavors and needs no per-flavor show requests. An id listed
+    more than once on either side is reported rather than collapsed.
+
+    :param db_flavors: ``flavors`` list returned by ``list_db_flavors``
+    :param os_flavors: ``flavors`` list returned by
+                       ``list_flavors(detail=True)``
+    :return: a :class:`FlavorDiff`, which is false when the lists match
+    """
+    db_duplicates = []
+    db_index = index_db_flavors(db_flavors, db_duplicates)
+    missing = []
+    mismatched = []
+    os_duplicates = []
+    seen = set()
+    for os_flavor in os_flavors:
+        flavor_id = str(os_flavor['id'])
+        if flavor_id in seen:
+            if flavor_id not in os_duplicates:
+                os_duplicates.append(flavor_id)
+            continue
+        seen.add(flavor_id)
+        db_flavor = db_index.get(flavor_id)
+        if db_flavor is None:
+            missing.append(flavor_id)
+        else:
+            mismatched.extend(_compare(flavor_id, db_flavor, os_flavor))
+    extra = sorted(str(i) for i in db_index if i not in seen)
+    return FlavorDiff(missing, extra, mismatched, db_duplicates,
+                      os_duplicates)
@@ -0,0 +1,193 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Long-running soak of the Trove API with latency and memory drift checks.
+
+A soak calls a set of operations in a loop for a duration or a number of
+iterations, and summarizes every time window: the latency percentiles of
+each operation, its error count, and the resident memory of the client
+process at the end of the window. Once done, the per-window p95 latencies
+and the memory are checked for an upward trend with the Mann-Kendall test,
+and the size of any trend is estimated with the Theil-Sen slope.
+"""
+
+import collections
+import math
+import resource
+import sys
+import time
+
+from trove_tempest_plugin.common import stats
+
+# One-sided significance level of the trend test.
+DEFAULT_ALPHA = 0.05
+# The trend test needs a few windows to say anything.
+MIN_WINDOWS = 4
+# Smallest slope per window, relative to the median, counted as drift.
+# Statistically significant but tiny trends, such as the few pages a
+# process allocates while warming up, are not worth flagging.
+DEFAULT_MIN_SLOPE = 0.001
+
+
+def current_rss():
+    """Return the resident memory of this process, in bytes."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize()
+    except (IOError, OSError, ValueError, IndexError):
+        # Only the peak is available elsewhere; kB on Linux, bytes on macOS.
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def mann_kendall(series):
+    """Mann-Kendall test for an upward trend in ``series``.
+
+    :return: a tuple ``(s, z, p)`` of the S statistic, its normal score and
+             the one-sided p-value of an upward trend
+    """
+    n = len(series)
+    s = 0
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            diff = series[j] - series[i]
+            s += (diff > 0) - (diff < 0)
+    ties = collections.Counter(series).values()
+    tied = sum(t * (t - 1) * (2 * t + 5) for t in ties)
+    variance = (n * (n - 1) * (2 * n + 5) - tied) / 18.0
+    if variance <= 0:
+        return s, 0.0, 1.0
+    if s > 0:
+        z = (s - 1) / math.sqrt(variance)
+    elif s < 0:
+        z = (s + 1) / math.sqrt(variance)
+    else:
+        z = 0.0
+    return s, z, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def theil_sen(series):
+    """Return the median slope of ``series`` per step, or None."""
+    slopes = sorted(float(series[j] - series[i]) / (j - i)
+                    for i in range(len(series) - 1)
+                    for j in range(i + 1, len(series)))
+    if not slopes:
+        return None
+    return stats.percentile(slopes, 50)
+
+
+def trend(series, alpha=DEFAULT_ALPHA, min_slope=DEFAULT_MIN_SLOPE):
+    """Check ``series`` for an upward drift.
+
+    :param min_slope: smallest slope per window, relative to the median of
+                      the series, that counts as drift
+    :return: a dict with the Mann-Kendall statistics, the Theil-Sen slope
+             per window and whether the series drifts upwards
+    """
+    series = [value for value in series if value is not None]
+    if len(series) < MIN_WINDOWS:
+        return {'windows': len(series), 'drift': False}
+    s, z, p = mann_kendall(series)
+    slope = theil_sen(series)
+    median = stats.percentile(sorted(series), 50)
+    return {
+        'windows': len(series),
+        's': s,
+        'z': round(z, 4),
+        'p_value': round(p, 6),
+        'slope_per_window': round(slope, 3),
+        'drift': p < alpha and slope > abs(median) * min_slope,
+    }
+
+
+def run(operations, duration=None, iterations=None, window=60.0,
+        alpha=DEFAULT_ALPHA, min_slope=DEFAULT_MIN_SLOPE, warmup_windows=1,
+        on_window=None):
+    """Call ``operations`` in turn until the duration or iterations run out.
+
+    :param operations: dict of callables taking no arguments, by name
+    :param duration: seconds to run for
+    :param iterations: number of times each operation is called
+    :param window: length of a summary window, in seconds
+    :param warmup_windows: number of first windows left out of the trend
+                           tests, as they include connection setup and
+                           other one-off costs
+    :param on_window: callable given each window summary as it completes
+    :return: a dict with the window summaries, the trend of the p95
+             latency of each operation and of the RSS, and whether any of
+             them drifts upwards
+    """
+    if duration is None and iterations is None:
+        raise ValueError("A duration or a number of iterations is needed")
+    started = time.time()
+    deadline = started + duration if duration is not None else None
+    windows = []
+    latencies = collections.defaultdict(list)
+    errors = collections.Counter()
+    window_start = started
+    iteration = 0
+
+    def close_window(now):
+        summary = {
+            'start': round(window_start - started, 3),
+            'end': round(now - started, 3),
+            'rss_bytes': current_rss(),
+            'operations': dict(
+                (name, dict(stats.summarize(latencies[name]),
+                            errors=errors[name]))
+                for name in operations),
+        }
+        windows.append(summary)
+        latencies.clear()
+        errors.clear()
+        if on_window is not None:
+            on_window(summary)
+
+    def running():
+        if deadline is not None and time.time() >= deadline:
+            return False
+        return iterations is None or iteration < iterations
+
+    while running():
+        for name, operation in operations.items():
+            start = time.time()
+            try:
+                operation()
+            except Exception:
+                errors[name] += 1
+            latencies[name].append(time.time() - start)
+        iteration += 1
+        now = time.time()
+        if now - window_start >= window:
+            close_window(now)
+            window_start = now
+    if latencies:
+        close_window(time.time())
+
+    steady = windows[warmup_windows:]
+    trends = dict(
+        (name, trend([w['operations'][name].get('p95') for w in steady],
+                     alpha, min_slope))
+        for name in operations)
+    trends['rss'] = trend([w['rss_bytes'] for w in steady], alpha,
+                          min_slope)
+    return {
+        'duration': round(time.time() - started, 3),
+        'iterations': iteration,
+        'windows': windows,
+        'trends': trends,
+        'drift_detected': sorted(name for name, result in trends.items()
+                                 if result['drift']),
+    }
@@ -0,0 +1,135 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the import-time cost the plugin adds to tempest commands.
+
+Each scenario runs in a fresh interpreter that first imports what tempest
+itself has loaded by the time it reaches the plugin, then times only the
+plugin's own work:
+
+* ``list-plugins``: loading and instantiating the plugin, as done by every
+  tempest command, including ``tempest list-plugins``.
+* ``register-opts``: registering and listing the plugin options, as done by
+  every tempest command that loads its configuration.
+* ``list-tests``: registering the plugin options and importing its test
+  modules, as done by ``tempest run --list-tests``.
+
+Wall-clock times vary too much on shared machines to gate on, so the
+budgets are only reported against. What gates is :func:`loaded_modules`:
+the plugin modules a scenario imports do not depend on the machine.
+"""
+
+import json
+import subprocess
+import sys
+
+# Budgets, in milliseconds, for the median cost of each scenario.
+BUDGETS_MS = {
+    'list-plugins': 50.0,
+    'register-opts': 50.0,
+    'list-tests': 1000.0,
+}
+
+_SCENARIOS = {
+    'list-plugins': (
+        "import tempest.test_discover.plugins\n",
+        "from trove_tempest_plugin import plugin\n"
+        "plugin.TroveTempestPlugin().load_tests()\n",
+    ),
+    'register-opts': (
+        "from oslo_config import cfg\n"
+        "import tempest.test_discover.plugins\n"
+        "from trove_tempest_plugin import plugin\n",
+        "trove_plugin = plugin.TroveTempestPlugin()\n"
+        "trove_plugin.register_opts(cfg.ConfigOpts())\n"
+        "trove_plugin.get_opt_lists()\n",
+    ),
+    'list-tests': (
+        "from oslo_config import cfg\n"
+        "import tempest.test\n"
+        "from trove_tempest_plugin import plugin\n",
+        "import pkgutil\n"
+        "from trove_tempest_plugin import tests\n"
+        "plugin.TroveTempestPlugin().register_opts(cfg.ConfigOpts())\n"
+        "for _, name, _ in pkgutil.walk_packages(tests.__path__,\n"
+        "                                        tests.__name__ + '.'):\n"
+        "    if name.rsplit('.', 1)[-1].startswith('test_'):\n"
+        "        __import__(name)\n",
+    ),
+}
+
+_TEMPLATE = """import time
+%s
+start = time.time()
+%s
+print(time.time() - start)
+"""
+
+_MODULES_TEMPLATE = """import json
+import sys
+%s
+before = set(sys.modules)
+%s
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def measure(scenario, repeat=5, python=None):
+    """Return the cost of a scenario, in milliseconds, over ``repeat`` runs.
+
+    :return: a dict with the ``median``, all ``samples``, the ``budget`` and
+        whether the median is ``over_budget``, or with the last line of the
+        ``error`` when the scenario fails to run
+    """
+    baseline, code = _SCENARIOS[scenario]
+    script = _TEMPLATE % (baseline, code)
+    samples = []
+    for _ in range(repeat):
+        try:
+            output = subprocess.check_output(
+                [python or sys.executable, '-c', script],
+                stderr=subprocess.PIPE)
+        except subprocess.CalledProcessError as e:
+            lines = e.stderr.decode().strip().splitlines() or ['']
+            return {'error': lines[-1], 'budget': BUDGETS_MS[scenario]}
+        seconds = float(output.decode().strip().splitlines()[-1])
+        samples.append(round(seconds * 1000.0, 3))
+    ordered = sorted(samples)
+    median = ordered[len(ordered) // 2]
+    return {
+        'median': median,
+        'samples': samples,
+        'budget': BUDGETS_MS[scenario],
+        'over_budget': median > BUDGETS_MS[scenario],
+    }
+
+
+def loaded_modules(scenario, python=None):
+    """Return the plugin modules a scenario imports, in a fresh interpreter.
+
+    Only modules of this package are returned; the ones tempest loads on its
+    own are imported before the scenario starts.
+
+    :raises subprocess.CalledProcessError: if the scenario fails to run
+    """
+    baseline, code = _SCENARIOS[scenario]
+    output = subprocess.check_output(
+        [python or sys.executable, '-c', _MODULES_TEMPLATE % (baseline, code)])
+    modules = json.loads(output.decode().strip().splitlines()[-1])
+    return [name for name in modules
+            if name.split('.', 1)[0] == 'trove_tempest_plugin']
+
+
+def scenarios():
+    return sorted(_SCENARIOS)
@@ -0,0 +1,53 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Small statistics helpers for latency samples."""
+
+import math
+
+
+def percentile(samples, pct):
+    """Return the ``pct`` percentile of ``samples``.
+
+    Uses linear interpolation between the closest ranks. ``samples`` must be
+    sorted; None is returned when it is empty.
+    """
+    if not samples:
+        return None
+    rank = (len(samples) - 1) * pct / 100.0
+    low = int(math.floor(rank))
+    high = int(math.ceil(rank))
+    if low == high:
+        return samples[low]
+    return samples[low] + (samples[high] - samples[low]) * (rank - low)
+
+
+def summarize(samples):
+    """Summarize latency samples, in seconds, as milliseconds."""
+    samples = sorted(samples)
+    if not samples:
+        return {'count': 0}
+
+    def ms(value):
+        return round(value * 1000.0, 3)
+
+    return {
+        'count': len(samples),
+        'min': ms(samples[0]),
+        'max': ms(samples[-1]),
+        'mean': ms(sum(samples) / len(samples)),
+        'p50': ms(percentile(samples, 50)),
+        'p95': ms(percentile(samples, 95)),
+        'p99': ms(percentile(samples, 99)),
+    }
@@ -0,0 +1,165 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Provisioning and status polling of database instances.
+
+Rather than polling each instance on a fixed interval, the waiters list all
+instances once per poll and check every pending instance against that
+listing, and the interval between polls grows exponentially up to a cap.
+Bringing up dozens of instances therefore costs one list request per poll
+instead of one show request per instance per poll.
+"""
+
+from concurrent import futures
+import time
+
+from tempest.lib import exceptions as lib_exc
+
+from trove_tempest_plugin import exceptions
+
+ERROR_STATUSES = ('ERROR', 'FAILED')
+
+
+def backoff_intervals(interval, max_interval, factor=2.0):
+    """Yield poll intervals growing from ``interval`` to ``max_interval``."""
+    interval = float(interval)
+    while True:
+        yield interval
+        interval = min(interval * factor, max_interval)
+
+
+def wait_for_db_instances_status(client, instance_ids, status,
+                                 interval=None, max_interval=30,
+                                 timeout=None):
+    """Wait until all the given instances reach a status.
+
+    :param client: a DatabaseInstancesClient
+    :param instance_ids: ids of the instances to wait for
+    :param status: expected status, e.g. ``ACTIVE``
+    :param interval: first poll interval, the client's ``build_interval``
+                     by default
+    :param max_interval: upper bound of the poll interval
+    :param timeout: seconds to wait, the client's ``build_timeout`` by
+                    default
+    :return: dict mapping each instance id to its last listed instance
+    :raises DatabaseInstanceErrorException: if an instance goes to an error
+                                            status
+    :raises TimeoutException: if an instance is not in ``status`` in time
+    """
+    interval = client.build_interval if interval is None else interval
+    timeout = client.build_timeout if timeout is None else timeout
+    pending = set(instance_ids)
+    found = {}
+    start = time.time()
+    for delay in backoff_intervals(interval, max_interval):
+        listed = dict((i['id'], i) for i in client.iter_db_instances()
+                      if i['id'] in pending)
+        for instance_id, instance in listed.items():
+            found[instance_id] = instance
+            if instance['status'] == status:
+                pending.discard(instance_id)
+            elif instance['status'] in ERROR_STATUSES:
+                raise exceptions.DatabaseInstanceErrorException(
+                    instance_id=instance_id, status=instance['status'],
+                    expected=status)
+        if not pending:
+            return found
+        elapsed = time.time() - start
+        if elapsed >= timeout:
+            statuses = ', '.join(
+                '%s: %s' % (i, found[i]['status'] if i in found
+                            else 'not listed') for i in sorted(pending))
+            raise lib_exc.TimeoutException(
+                "Database instances did not reach status %s within the "
+                "required time (%s s). Current statuses: %s"
+                % (status, timeout, statuses))
+        time.sleep(min(delay, timeout - elapsed))
+
+
+def wait_for_db_instances_deletion(client, instance_ids, interval=None,
+                                   max_interval=30, timeout=None):
+    """Wait until none of the given instances is listed any more.
+
+    Polling follows the same batched, exponential scheme as
+    :func:`wait_for_db_instances_status`.
+    """
+    interval = client.build_interval if interval is None else interval
+    timeout = client.build_timeout if timeout is None else timeout
+    pending = set(instance_ids)
+    start = time.time()
+    for delay in backoff_intervals(interval, max_interval):
+        pending &= set(i['id'] for i in client.iter_db_instances())
+        if not pending:
+            return
+        elapsed = time.time() - start
+        if elapsed >= timeout:
+            raise lib_exc.TimeoutException(
+                "Database instances %s were not deleted within the required "
+                "time (%s s)" % (', '.join(sorted(pending)), timeout))
+        time.sleep(min(delay, timeout - elapsed))
+
+
+def create_db_instances(client, count, name_prefix, flavor_ref,
+                        volume_size=None, max_workers=8,
+                        wait_status='ACTIVE', max_interval=30,
+                        on_created=None, **kwargs):
+    """Create several database instances concurrently.
+
+    The create requests are sent from up to ``max_workers`` threads, then
+    all instances are waited for together with
+    :func:`wait_for_db_instances_status`. Extra keyword arguments are
+    passed to ``create_db_instance``.
+
+    :param wait_status: status to wait for, or None not to wait
+    :param on_created: callable taking each instance as soon as its create
+                       request returns, e.g. to schedule its deletion; the
+                       instances are then left to it when a create fails
+    :return: list of the created instances, in creation order
+    :raises: the first create error, after deleting the instances that
+             were created unless ``on_created`` is given
+    """
+    names = ['%s-%d' % (name_prefix, i) for i in range(count)]
+    with futures.ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, count))) as executor:
+        pending = [executor.submit(client.create_db_instance, name,
+                                   flavor_ref, volume_size=volume_size,
+                                   **kwargs)
+                   for name in names]
+        if on_created is not None:
+            for future in futures.as_completed(pending):
+                if future.exception() is None:
+                    on_created(future.result()['instance'])
+    created = []
+    errors = []
+    for future in pending:
+        try:
+            created.append(future.result()['instance'])
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        if on_created is not None:
+            raise errors[0]
+        # Do not leak the instances that were created before failing.
+        for instance in created:
+            try:
+                client.delete_db_instance(instance['id'])
+            except lib_exc.NotFound:
+                pass
+        raise errors[0]
+    if wait_status:
+        found = wait_for_db_instances_status(
+            client, [i['id'] for i in created], wait_status,
+            max_interval=max_interval)
+        created = [found.get(i['id'], i) for i in created]
+    return created
@@ -13,6 +13,7 @@
 #    under the License.
 
 from oslo_config import cfg
+from oslo_config import types
 
 service_option = cfg.BoolOpt('trove',
                              default=True,
@@ -32,4 +33,222 @@ DatabaseGroup = [
     cfg.StrOpt('db_current_version',
                default="v1.0",
                help="Current database version to use in database tests."),
+    cfg.IntOpt('volume_size',
+               default=1,
+               help="Size, in GB, of the volume of database instances "
+                    "created by the tests."),
+    cfg.IntOpt('build_interval',
+               default=1,
+               help="Time in seconds before the first status poll of a "
+                    "database instance being built. Later polls back off "
+                    "exponentially up to max_build_interval."),
+    cfg.IntOpt('max_build_interval',
+               default=30,
+               help="Upper bound, in seconds, of the interval between two "
+                    "status polls of database instances."),
+    cfg.IntOpt('build_timeout',
+               default=1800,
+               help="Timeout in seconds to wait for a database instance to "
+                    "reach a status."),
+    cfg.IntOpt('http_pool_maxsize',
+               default=10,
+               help="Number of keep-alive connections kept open per "
+                    "database endpoint. The pool is shared by all database "
+                    "clients of a test worker."),
+    cfg.StrOpt('json_decoder',
+               default='auto',
+               choices=['auto', 'orjson', 'ujson', 'simplejson',
+                        'jsonutils'],
+               help="JSON decoder of database responses. 'auto' uses the "
+                    "fastest installed one, falling back to "
+                    "oslo.serialization's jsonutils. The decoder in use "
+                    "is logged."),
+    cfg.BoolOpt('typed_records',
+                default=False,
+                help="Decode flavors, limits and versions into compact "
+                     "read-only records with interned strings instead of "
+                     "dicts, which considerably reduces the memory held by "
+                     "large flavor catalogs. The records support the "
+                     "read-only dict lookups."),
+    cfg.IntOpt('response_cache_ttl',
+               default=0,
+               help="Seconds during which the parsed flavors and versions "
+                    "listings are reused without a request. Stale entries "
+                    "are revalidated with a conditional GET when the server "
+                    "supports it. 0 disables the cache."),
+    cfg.IntOpt('response_cache_size',
+               default=128,
+               help="Maximum number of responses kept in the response "
+                    "cache."),
+    cfg.IntOpt('version_cache_ttl',
+               default=3600,
+               help="Seconds during which the API versions discovered at "
+                    "the database endpoint are reused by "
+                    "resolve_db_current_version instead of listed again. "
+                    "0 disables the cache."),
+    cfg.StrOpt('version_cache_file',
+               help="If set, the discovered API versions are also kept in "
+                    "this JSON file, so that all test workers share them."),
+    cfg.BoolOpt('client_rate_limiting',
+                default=False,
+                help="Pace the requests of all database clients of a test "
+                     "worker under the rate limits advertised by the "
+                     "limits API, instead of running into overLimit "
+                     "responses."),
+    cfg.FloatOpt('rate_limit_share',
+                 default=1.0,
+                 min=0.01,
+                 max=1.0,
+                 help="Fraction of each advertised rate limit one test "
+                      "worker may use. Set it to 1/N when N workers send "
+                      "requests with the same credentials."),
+    cfg.BoolOpt('auth_cache',
+                default=False,
+                help="Share tokens and the endpoints resolved from their "
+                     "catalog between all test classes of a test worker "
+                     "that use the same credentials, instead of "
+                     "authenticating again for every class. It only has "
+                     "an effect with preprovisioned or static credentials "
+                     "([auth] use_dynamic_credentials set to False), since "
+                     "dynamic credentials differ for every class."),
+    cfg.IntOpt('auth_cache_expiry_margin',
+               default=300,
+               min=0,
+               help="Seconds before its expiry at which a cached token is "
+                    "replaced by a new one."),
+    cfg.IntOpt('retry_attempts',
+               default=0,
+               min=0,
+               help="How many times a GET request to the database API is "
+                    "retried after a response with one of the "
+                    "retry_status_codes. 0, the default, disables "
+                    "retries."),
+    cfg.ListOpt('retry_status_codes',
+                item_type=types.Integer(min=100, max=599),
+                default=[429, 503],
+                help="Response statuses of GET requests that are treated "
+                     "as transient failures and retried. 413 is ignored, "
+                     "since tempest already retries it as its Retry-After "
+                     "header asks."),
+    cfg.FloatOpt('retry_backoff',
+                 default=0.5,
+                 min=0,
+                 help="Base delay in seconds between retries. Retry n "
+                      "waits a random time of up to retry_backoff * 2^n "
+                      "seconds."),
+    cfg.FloatOpt('retry_max_backoff',
+                 default=30.0,
+                 min=0,
+                 help="Upper bound in seconds of the delay before a retry, "
+                      "including delays asked for with Retry-After."),
+    cfg.BoolOpt('retry_honour_retry_after',
+                default=True,
+                help="Wait for the delay given in the Retry-After header of "
+                     "a response before retrying, instead of the computed "
+                     "backoff."),
+    cfg.BoolOpt('run_scaling_tests',
+                default=False,
+                help="Run the scaling tests. They send as many requests as "
+                     "they can for scaling_step_duration seconds per step, "
+                     "which exceeds Trove's default rate limits and uses up "
+                     "the rate budget of tests running in parallel, so they "
+                     "are skipped unless enabled."),
+    cfg.ListOpt('scaling_concurrency',
+                item_type=types.Integer(min=1),
+                default=[1, 8, 32, 128],
+                help="Numbers of concurrent clients the scaling tests step "
+                     "through."),
+    cfg.IntOpt('scaling_step_duration',
+               default=5,
+               min=1,
+               help="Seconds each concurrency step of the scaling tests "
+                    "sends requests for."),
+    cfg.StrOpt('trace_file',
+               help="If set, every request of the database clients is "
+                    "appended to this file as a JSON line with its start "
+                    "time, duration, method, URL template, status, "
+                    "response size and request id, and the test and "
+                    "idempotent id it was sent for. Spans are written in "
+                    "batches by a background thread."),
+    cfg.StrOpt('memory_profile_file',
+               help="If set, allocations are traced with tracemalloc, and "
+                    "the peak and retained memory of every database client "
+                    "call and test class, along with the allocation sites "
+                    "that grew the most during the class, are appended to "
+                    "this file as one JSON line per test class. Tracing "
+                    "slows the tests down noticeably."),
+    cfg.IntOpt('memory_profile_frames',
+               default=5,
+               min=1,
+               help="Number of stack frames kept per traced allocation."),
+    cfg.IntOpt('memory_profile_top',
+               default=10,
+               min=0,
+               help="Number of allocation sites reported per test class."),
+    cfg.StrOpt('test_durations_file',
+               help="If set, the duration of every database test is "
+                    "averaged over the runs in this JSON file, keyed by "
+                    "idempotent id, along with the setup time of every "
+                    "test class. 'trove-tempest-schedule' turns it into an "
+                    "stestr worker file that spreads the test classes over "
+                    "the workers."),
+    cfg.StrOpt('request_metrics_file',
+               help="If set, the wall time, response size, JSON decode time "
+                    "and status of every database request are recorded "
+                    "per endpoint, and the resulting histograms are "
+                    "appended to this file as JSON lines keyed by test "
+                    "idempotent id."),
+]
+
+database_performance_group = cfg.OptGroup(
+    name='database_performance',
+    title='Database Service Latency Budgets',
+    help="p95 latency budgets of the Trove read endpoints, checked by the "
+         "tests tagged 'performance'.")
+
+DatabasePerformanceGroup = [
+    cfg.BoolOpt('enabled',
+                default=False,
+                help="Run the latency tests. Together they send about 180 "
+                     "GET requests, close to Trove's default limit of 200 "
+                     "per minute, and tempest's retry of 413 responses "
+                     "would inflate the measured latency, so they are "
+                     "skipped unless enabled."),
+    cfg.IntOpt('warmup_requests',
+               default=2,
+               min=0,
+               help="Untimed requests sent to an endpoint before it is "
+                    "sampled."),
+    cfg.FloatOpt('list_db_flavors_p95',
+                 default=1000.0,
+                 help="p95 latency budget of listing the database flavors, "
+                      "in milliseconds."),
+    cfg.IntOpt('list_db_flavors_samples',
+               default=20,
+               min=1,
+               help="Number of timed flavor listings."),
+    cfg.FloatOpt('show_db_flavor_p95',
+                 default=500.0,
+                 help="p95 latency budget of showing a database flavor, in "
+                      "milliseconds."),
+    cfg.IntOpt('show_db_flavor_samples',
+               default=50,
+               min=1,
+               help="Number of timed flavor shows."),
+    cfg.FloatOpt('list_db_limits_p95',
+                 default=500.0,
+                 help="p95 latency budget of listing the database limits, "
+                      "in milliseconds."),
+    cfg.IntOpt('list_db_limits_samples',
+               default=50,
+               min=1,
+               help="Number of timed limits listings."),
+    cfg.FloatOpt('list_db_versions_p95',
+                 default=500.0,
+                 help="p95 latency budget of listing the database API "
+                      "versions, in milliseconds."),
+    cfg.IntOpt('list_db_versions_samples',
+               default=50,
+               min=1,
+               help="Number of timed versions listings."),
 ]
@@ -0,0 +1,25 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tempest.lib import exceptions
+
+
+class DatabaseInstanceErrorException(exceptions.TempestException):
+    message = ("Database instance %(instance_id)s went to status "
+               "%(status)s while waiting for %(expected)s")
+
+
+class DatabaseCleanupException(exceptions.TempestException):
+    message = ("Failed to clean up %(count)d database resource(s): "
+               "%(resources)s")
@@ -17,9 +17,11 @@ import os
 
 from tempest.test_discover import plugins
 
-from trove_tempest_plugin import config as trove_config
-
 
+# NOTE: Every tempest command loads every installed plugin, so this module
+# only imports what tempest has already loaded itself. The option
+# definitions are imported when tempest first asks for them, and the
+# service clients and tests only when tempest discovers the tests.
 class TroveTempestPlugin(plugins.TempestPlugin):
 
     def load_tests(self):
@@ -30,11 +32,20 @@ class TroveTempestPlugin(plugins.TempestPlugin):
         return full_test_dir, base_path
 
     def register_opts(self, conf):
+        from trove_tempest_plugin import config as trove_config
+
         conf.register_group(trove_config.database_group)
         conf.register_opts(trove_config.DatabaseGroup, group='database')
+        conf.register_group(trove_config.database_performance_group)
+        conf.register_opts(trove_config.DatabasePerformanceGroup,
+                           group='database_performance')
         conf.register_opt(trove_config.service_option,
                           group='service_available')
 
     def get_opt_lists(self):
+        from trove_tempest_plugin import config as trove_config
+
         return [('database', trove_config.DatabaseGroup),
+                ('database_performance',
+                 trove_config.DatabasePerformanceGroup),
                 ('service_available', [trove_config.service_option])]
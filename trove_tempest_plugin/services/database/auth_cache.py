@@ -0,0 +1,180 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Process-wide cache of tokens and resolved service endpoints.
+
+Tempest gives every test class its own credentials provider, so each class
+authenticates again and resolves its endpoints from a fresh catalog. The
+:class:`AuthCache` shares the token of a set of credentials between all
+providers built for them in a test worker, together with the endpoints
+resolved from its catalog, and drops both some time before the token
+expires.
+
+Only classes that use the same credentials share a token, so the cache
+helps with preprovisioned or static credentials. Dynamic credentials are
+created for each class and never hit it.
+"""
+
+import hashlib
+import threading
+
+from oslo_utils import timeutils
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def credentials_key(provider):
+    """Return a hashable key for the credentials of ``provider``, or None.
+
+    The key only uses the attributes the credentials were created with, as
+    the rest is filled in from the token. Passwords are only kept hashed.
+    """
+    credentials = getattr(provider, 'credentials', None)
+    if credentials is None:
+        return None
+    attributes = []
+    for name in sorted(credentials.get_init_attributes()):
+        value = getattr(credentials, name)
+        if name == 'password' and value is not None:
+            value = hashlib.sha256(value.encode('utf-8')).hexdigest()
+        attributes.append((name, value))
+    return (type(provider).__name__, getattr(provider, 'auth_url', None),
+            getattr(provider, 'scope', None), tuple(attributes))
+
+
+def token_expiry(auth_data):
+    """Return the naive UTC expiry time of a Keystone token, if known."""
+    _, access = auth_data
+    expires = access.get('expires_at') or access.get('token', {}).get(
+        'expires')
+    if not expires:
+        return None
+    return timeutils.normalize_time(timeutils.parse_isotime(expires))
+
+
+class AuthCache(object):
+    """Tokens per credentials and endpoints per token and filters.
+
+    :param margin: seconds before the expiry of a token at which it is no
+                   longer handed out
+    """
+
+    def __init__(self, margin=300):
+        self.margin = margin
+        self._tokens = {}
+        self._endpoints = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh(self, auth_data):
+        expiry = token_expiry(auth_data)
+        return expiry is None or timeutils.is_newer_than(expiry,
+                                                         self.margin)
+
+    def get_auth(self, key, authenticate):
+        """Return the cached auth data of ``key`` or call ``authenticate``.
+
+        Concurrent callers for the same credentials wait for a single
+        authentication.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            auth_data = self._tokens.get(key)
+            if auth_data is not None and self._fresh(auth_data):
+                with self._lock:
+                    self.hits += 1
+                return auth_data
+            auth_data = authenticate()
+            with self._lock:
+                self.misses += 1
+                if auth_data is not None:
+                    self._drop_endpoints(self._tokens.get(key))
+                    self._tokens[key] = auth_data
+            return auth_data
+
+    def base_url(self, auth_data, filters, resolve):
+        """Return the endpoint ``resolve`` found for the token and filters."""
+        key = (auth_data[0], tuple(sorted(filters.items())))
+        with self._lock:
+            url = self._endpoints.get(key)
+        if url is None:
+            url = resolve()
+            with self._lock:
+                self._endpoints[key] = url
+        return url
+
+    def _drop_endpoints(self, auth_data):
+        if auth_data is None:
+            return
+        for key in [key for key in self._endpoints
+                    if key[0] == auth_data[0]]:
+            del self._endpoints[key]
+
+    def invalidate(self, key):
+        with self._lock:
+            self._drop_endpoints(self._tokens.pop(key, None))
+
+    def install(self, provider):
+        """Route the authentication of ``provider`` through the cache.
+
+        Providers without credentials, such as the static provider of the
+        benchmark tools, are left alone. Returns the provider.
+        """
+        if getattr(provider, '_auth_cache', None) is self:
+            return provider
+        key = credentials_key(provider)
+        if key is None:
+            return provider
+        authenticate = provider._get_auth
+        resolve = provider.base_url
+
+        def _get_auth():
+            return self.get_auth(key, authenticate)
+
+        def base_url(filters, auth_data=None):
+            if auth_data is None:
+                auth_data = provider.get_auth()
+            return self.base_url(
+                auth_data, filters,
+                lambda: resolve(filters, auth_data=auth_data))
+
+        provider._get_auth = _get_auth
+        provider.base_url = base_url
+        provider._auth_cache = self
+        return provider
+
+    def stats(self):
+        with self._lock:
+            return {'tokens': len(self._tokens),
+                    'endpoints': len(self._endpoints),
+                    'hits': self.hits,
+                    'misses': self.misses}
+
+
+def shared_cache(margin=300):
+    """Return the process-wide auth cache, creating it on first call."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = AuthCache(margin)
+        return _shared
+
+
+def shared_stats():
+    """Return the counters of the process-wide cache, if there is one."""
+    return _shared.stats() if _shared is not None else None
@@ -0,0 +1,128 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-memory cache of parsed GET responses.
+
+Flavors and versions rarely change during a test run, so the clients can
+keep their parsed responses in a :class:`ResponseCache`. Entries younger
+than the cache's time to live are served without a request. Older entries
+are revalidated with ``If-None-Match``/``If-Modified-Since`` when the
+server sent an ``ETag`` or ``Last-Modified`` header, and reused as they are
+when the server answers ``304 Not Modified``.
+
+Cached bodies are shared by every caller and must not be modified.
+"""
+
+import collections
+import threading
+import time
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+class Entry(object):
+    __slots__ = ('resp', 'body', 'etag', 'last_modified', 'stored_at')
+
+    def __init__(self, resp, body):
+        self.resp = resp
+        self.body = body
+        self.etag = resp.get('etag')
+        self.last_modified = resp.get('last-modified')
+        self.stored_at = time.time()
+
+    def validators(self):
+        """Return the conditional request headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(object):
+    """LRU cache of parsed responses with a time to live.
+
+    :param maxsize: maximum number of cached responses
+    :param ttl: seconds during which an entry is served without a request
+    """
+
+    def __init__(self, maxsize=128, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        """Return ``(entry, fresh)`` for a key, entry being None if absent.
+
+        A fresh entry is counted as a hit.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            # Move the entry to the most recently used end.
+            del self._entries[key]
+            self._entries[key] = entry
+            fresh = time.time() - entry.stored_at < self.ttl
+            if fresh:
+                self.hits += 1
+            return entry, fresh
+
+    def revalidated(self, entry):
+        """Record that the server confirmed an entry is unchanged."""
+        with self._lock:
+            entry.stored_at = time.time()
+            self.revalidations += 1
+
+    def store(self, key, resp, body):
+        """Cache a parsed response, counted as a miss."""
+        with self._lock:
+            self.misses += 1
+            self._entries.pop(key, None)
+            self._entries[key] = Entry(resp, body)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'revalidations': self.revalidations,
+                'misses': self.misses,
+                'size': len(self._entries),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def shared_cache(maxsize, ttl):
+    """Return the process-wide cache, creating it on first call."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ResponseCache(maxsize=maxsize, ttl=ttl)
+        return _shared
+
+
+def shared_stats():
+    """Return the counters of the process-wide cache, if there is one."""
+    return _shared.stats() if _shared is not None else None
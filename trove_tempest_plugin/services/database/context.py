@@ -0,0 +1,46 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""The test on whose behalf database clients are currently sending requests.
+
+Tempest runs the tests of a worker one at a time, but a test may issue
+requests from several threads, so the current test is tracked per process
+rather than per thread.
+"""
+
+_current = (None, None)
+
+
+def set_test(test_id, idempotent_id=None):
+    """Attribute the following requests to a test."""
+    global _current
+    _current = (test_id, idempotent_id)
+
+
+def clear():
+    set_test(None)
+
+
+def current_test():
+    """Return ``(test_id, idempotent_id)`` of the current test."""
+    return _current
+
+
+def idempotent_id(test):
+    """Return the idempotent id tempest attached to a test case, or None."""
+    test_method = getattr(test, test._testMethodName, None)
+    for attr in getattr(test_method, '__testtools_attrs', ()):
+        if attr.startswith('id-'):
+            return attr[3:]
+    return None
@@ -0,0 +1,173 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Pluggable JSON decoding of response bodies.
+
+The database clients decode bodies with the fastest decoder installed by
+default (``auto``): orjson, ujson or simplejson with its C speedups, and
+oslo.serialization's jsonutils when none of them is. A decoder can also be
+selected by name. :func:`iter_items` decodes the
+items of a large list, such as a flavor catalog, one at a time with ijson
+when it is installed.
+"""
+
+import io
+import threading
+
+from oslo_log import log as logging
+from oslo_serialization import jsonutils
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+LOG = logging.getLogger(__name__)
+
+AUTO = 'auto'
+DEFAULT = AUTO
+# ijson events that complete a value at the prefix they are reported at.
+_VALUE_END_EVENTS = frozenset(('end_map', 'end_array', 'string', 'number',
+                               'boolean', 'null'))
+# Decoders tried by AUTO, fastest first.
+PREFERRED = ('orjson', 'ujson', 'simplejson', 'jsonutils')
+
+
+def _load_orjson():
+    import orjson
+    return orjson.loads
+
+
+def _load_ujson():
+    import ujson
+    return ujson.loads
+
+
+def _load_simplejson():
+    import simplejson
+    # simplejson is only faster than the standard library with its C
+    # speedups.
+    if not simplejson._speedups:
+        raise ImportError("simplejson is installed without its speedups")
+    return simplejson.loads
+
+
+def _load_jsonutils():
+    return jsonutils.loads
+
+
+_LOADERS = {
+    'orjson': _load_orjson,
+    'ujson': _load_ujson,
+    'simplejson': _load_simplejson,
+    'jsonutils': _load_jsonutils,
+}
+
+# Decoders already reported in the log.
+_logged = set()
+_logged_lock = threading.Lock()
+
+
+def available():
+    """Return the names of the decoders that can be loaded."""
+    names = []
+    for name in PREFERRED:
+        try:
+            _LOADERS[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _select(name):
+    if name == AUTO:
+        for candidate in PREFERRED:
+            try:
+                return candidate, _LOADERS[candidate]()
+            except ImportError:
+                continue
+    if name not in _LOADERS:
+        raise ValueError("Unknown JSON decoder %r, expected one of: %s"
+                         % (name, ', '.join((AUTO,) + PREFERRED)))
+    return name, _LOADERS[name]()
+
+
+def get_decoder(name=DEFAULT):
+    """Return ``(name, loads)`` for a decoder.
+
+    The decoder selected for each requested name is logged once.
+
+    :param name: one of :data:`PREFERRED`, or ``auto`` for the fastest
+                 available one
+    :raises ValueError: for an unknown decoder
+    :raises ImportError: if the requested decoder is not installed
+    """
+    selected, loads = _select(name)
+    with _logged_lock:
+        first = (name, selected) not in _logged
+        _logged.add((name, selected))
+    if first:
+        LOG.info("Decoding database responses with %s (requested: %s)",
+                 selected, name)
+    return selected, loads
+
+
+def iter_items(body, key, rest=None, loads=jsonutils.loads):
+    """Yield the items of the list ``key`` of a JSON object body.
+
+    With ijson installed the items are decoded one at a time, so the whole
+    list is never held in memory; otherwise the body is decoded at once
+    with ``loads``.
+
+    :param rest: optional dict filled with the other top-level members of
+                 the object, e.g. pagination ``links``, once the iteration
+                 is complete
+    """
+    if ijson is None:
+        body = loads(body)
+        if rest is not None:
+            rest.update((k, v) for k, v in body.items() if k != key)
+        for item in body.get(key, []):
+            yield item
+        return
+
+    if not isinstance(body, bytes):
+        body = body.encode('utf-8')
+    item_prefix = key + '.item'
+    member = None
+    builder = None
+    for prefix, event, value in ijson.parse(io.BytesIO(body),
+                                            use_float=True):
+        if prefix == '' and event == 'map_key':
+            member = value
+            builder = None if member == key else ijson.ObjectBuilder()
+            continue
+        if member is None or prefix == '':
+            continue
+        if member != key:
+            builder.event(event, value)
+            ended = prefix == member and event in _VALUE_END_EVENTS
+            if ended and rest is not None:
+                rest[member] = builder.value
+            continue
+        if prefix == key:
+            # start_array/end_array of the list itself
+            continue
+        if builder is None:
+            builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        if prefix == item_prefix and event in _VALUE_END_EVENTS:
+            yield builder.value
+            builder = None
@@ -0,0 +1,158 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Cache of the API versions discovered at each database endpoint.
+
+Listing the versions takes a request to the unversioned root of the
+endpoint, which every test class that needs the current API version would
+otherwise repeat. A :class:`VersionCache` keeps the discovered versions per
+endpoint URL, in memory and optionally in a small JSON file shared by the
+test workers, for a time to live. A different endpoint URL is a different
+entry, so moving the endpoint never serves the versions of the old one.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def _plain(version):
+    # Typed records are stored as the dicts they were built from.
+    return version.to_dict() if hasattr(version, 'to_dict') else version
+
+
+def current_version(versions):
+    """Return the id of the version with status CURRENT, or None."""
+    for version in versions:
+        if version.get('status') == 'CURRENT':
+            return version['id']
+    return None
+
+
+class VersionCache(object):
+    """Discovered versions per endpoint URL.
+
+    :param ttl: seconds during which discovered versions are reused
+    :param path: optional JSON file the versions are also kept in, so other
+                 processes can reuse them
+    """
+
+    def __init__(self, ttl=3600, path=None):
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, entry):
+        # Entries of a corrupt or foreign file are misses, not errors.
+        try:
+            stored_at = float(entry['stored_at'])
+            versions = entry['versions']
+        except (KeyError, TypeError, ValueError):
+            return False
+        if not isinstance(versions, list):
+            return False
+        return time.time() - stored_at < self.ttl
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def lookup(self, endpoint):
+        """Return the fresh versions of ``endpoint``, or None."""
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if not self._fresh(entry) and self.path:
+                entry = self._load().get(endpoint)
+                if self._fresh(entry):
+                    self._entries[endpoint] = entry
+            if not self._fresh(entry):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry['versions']
+
+    def store(self, endpoint, versions):
+        entry = {'stored_at': time.time(),
+                 'versions': [_plain(v) for v in versions]}
+        with self._lock:
+            self._entries[endpoint] = entry
+            if self.path:
+                self._save(endpoint, entry)
+
+    def _save(self, endpoint, entry):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        with open(self.path + '.lock', 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            data = dict((key, value) for key, value in self._load().items()
+                        if self._fresh(value))
+            data[endpoint] = entry
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, sort_keys=True)
+            os.rename(tmp, self.path)
+
+    def discover(self, client):
+        """Return the versions of a versions client's endpoint.
+
+        Only lists them when they are not cached yet.
+
+        :param client: a DatabaseVersionsClient
+        """
+        endpoint = client.base_url
+        versions = self.lookup(endpoint)
+        if versions is None:
+            versions = client.list_db_versions()['versions']
+            self.store(endpoint, versions)
+        return versions
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'endpoints': len(self._entries), 'hits': self.hits,
+                    'misses': self.misses}
+
+
+def shared_cache(ttl=3600, path=None):
+    """Return the process-wide version cache, creating it on first call."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = VersionCache(ttl, path)
+        return _shared
+
+
+def shared_stats():
+    """Return the counters of the process-wide cache, if there is one."""
+    return _shared.stats() if _shared is not None else None
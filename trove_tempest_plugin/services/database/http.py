@@ -0,0 +1,127 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Process-wide keep-alive HTTP connection pools for the Trove clients.
+
+Tempest's ``ClosingHttp`` sends ``Connection: close`` and clears its pools
+after every request, so each call to Trove pays for a new TCP connection
+and TLS handshake. The clients in this plugin get their HTTP object from
+:func:`get_http` instead, which hands every client in the process the same
+pool manager, and therefore one pool of reusable connections per endpoint.
+"""
+
+import threading
+
+import urllib3
+
+DEFAULT_POOL_MAXSIZE = 10
+
+_lock = threading.Lock()
+_managers = {}
+
+
+class Response(dict):
+    """Response headers in the form tempest's RestClient expects."""
+
+    def __init__(self, status, reason, version, headers, url):
+        super(Response, self).__init__()
+        for key, value in headers.items():
+            self[str(key).lower()] = value
+        self.status = status
+        self['status'] = str(self.status)
+        self.reason = reason
+        self.version = version
+        self['content-location'] = url
+
+
+class KeepAliveHttp(urllib3.PoolManager):
+    """Drop-in replacement for tempest's ClosingHttp that reuses connections.
+
+    :param maxsize: number of idle connections kept per endpoint
+    """
+
+    def __init__(self, disable_ssl_certificate_validation=False,
+                 ca_certs=None, timeout=None, follow_redirects=True,
+                 maxsize=DEFAULT_POOL_MAXSIZE):
+        self.follow_redirects = follow_redirects
+        kwargs = {}
+
+        if disable_ssl_certificate_validation:
+            urllib3.disable_warnings()
+            kwargs['cert_reqs'] = 'CERT_NONE'
+        elif ca_certs:
+            kwargs['cert_reqs'] = 'CERT_REQUIRED'
+            kwargs['ca_certs'] = ca_certs
+
+        if timeout:
+            kwargs['timeout'] = timeout
+
+        super(KeepAliveHttp, self).__init__(maxsize=maxsize, **kwargs)
+
+    def request(self, url, method, *args, **kwargs):
+        if self.follow_redirects:
+            retry = urllib3.util.Retry(raise_on_redirect=False, redirect=5)
+        else:
+            retry = urllib3.util.Retry(redirect=False)
+        r = super(KeepAliveHttp, self).request(method, url, retries=retry,
+                                               *args, **kwargs)
+        if not kwargs.get('preload_content', True):
+            return r, b''
+        return (Response(r.status, r.reason, r.version, r.getheaders(),
+                         url), r.data)
+
+    def connection_stats(self):
+        """Return connection reuse counters, one entry per endpoint."""
+        stats = []
+        for key in list(self.pools.keys()):
+            pool = self.pools.get(key)
+            if pool is None:
+                continue
+            stats.append({
+                'endpoint': '%s://%s:%s' % (pool.scheme, pool.host,
+                                            pool.port),
+                'connections': pool.num_connections,
+                'requests': pool.num_requests,
+                'reused': max(0, pool.num_requests - pool.num_connections),
+            })
+        return stats
+
+
+def get_http(disable_ssl_certificate_validation=False, ca_certs=None,
+             timeout=None, follow_redirects=True, maxsize=None):
+    """Return the shared pool manager for the given connection settings."""
+    if maxsize is None:
+        maxsize = DEFAULT_POOL_MAXSIZE
+    key = (bool(disable_ssl_certificate_validation), ca_certs, timeout,
+           follow_redirects, maxsize)
+    with _lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = KeepAliveHttp(
+                disable_ssl_certificate_validation=(
+                    disable_ssl_certificate_validation),
+                ca_certs=ca_certs, timeout=timeout,
+                follow_redirects=follow_redirects, maxsize=maxsize)
+            _managers[key] = manager
+    return manager
+
+
+def connection_stats():
+    """Return the reuse counters of every pool created in this process."""
+    with _lock:
+        managers = list(_managers.values())
+    stats = []
+    for manager in managers:
+        stats.extend(manager.connection_stats())
+    return stats
@@ -0,0 +1,173 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""asyncio variants of the database clients.
+
+The clients in this module expose the same methods as their synchronous
+counterparts as coroutines, so a single event loop can keep thousands of
+Trove reads in flight::
+
+    async with aio_clients.AsyncDatabaseFlavorsClient(
+            auth_provider, 'database', region) as client:
+        bodies = await asyncio.gather(
+            *[client.show_db_flavor(i) for i in flavor_ids])
+
+Authentication, endpoint resolution, URL building, status validation and
+error mapping are shared with the synchronous clients; only the transport
+is replaced by an aiohttp session. They require Python 3.5 or later and the
+``asyncio`` extra of this package, so nothing else in the plugin imports
+this module.
+
+Requests sent through the aiohttp session bypass the synchronous request
+path, so the retries, rate limiting, response cache and request metrics
+configured for the synchronous clients do not apply to them. They are
+exported as trace spans when tracing is enabled.
+"""
+
+import ssl
+import time
+
+import aiohttp
+from tempest.lib.common import rest_client
+
+from trove_tempest_plugin.services.database import http
+from trove_tempest_plugin.services.database import metrics
+from trove_tempest_plugin.services.database import records
+from trove_tempest_plugin.services.database import tracing
+from trove_tempest_plugin.services.database.json import base_client
+
+# Maximum number of simultaneous connections of a client's session.
+DEFAULT_CONNECTION_LIMIT = 100
+
+
+class AsyncDatabaseClient(base_client.BaseDatabaseClient):
+    """Base class of the asyncio database clients.
+
+    :param session: aiohttp session to send requests with; by default the
+                    client creates one on first use and closes it in
+                    :meth:`close`
+    :param connection_limit: maximum number of simultaneous connections of
+                             the session the client creates
+    """
+
+    def __init__(self, auth_provider, service, region, session=None,
+                 connection_limit=DEFAULT_CONNECTION_LIMIT, **kwargs):
+        super(AsyncDatabaseClient, self).__init__(
+            auth_provider, service, region, **kwargs)
+        self._session = session
+        self._owns_session = session is None
+        self._connection_limit = connection_limit
+        if kwargs.get('disable_ssl_certificate_validation'):
+            self._ssl = False
+        elif kwargs.get('ca_certs'):
+            self._ssl = ssl.create_default_context(cafile=kwargs['ca_certs'])
+        else:
+            self._ssl = True
+        self._timeout = kwargs.get('http_timeout')
+
+    def _get_session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self._connection_limit,
+                                             ssl=self._ssl)
+            timeout = aiohttp.ClientTimeout(total=self._timeout)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=timeout)
+        return self._session
+
+    async def close(self):
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request_async(self, method, url, headers=None, body=None):
+        """Send an authenticated request and check its response.
+
+        This is the coroutine counterpart of ``RestClient.request``: it
+        raises the same tempest exceptions for error responses.
+
+        NOTE: Authentication itself is synchronous. It only blocks the
+        event loop when the token has to be fetched or renewed.
+        """
+        if headers is None:
+            headers = self.get_headers()
+        req_url, req_headers, req_body = self.auth_provider.auth_request(
+            method, url, headers, body, self.filters)
+        start = time.time()
+        async with self._get_session().request(
+                method, req_url, headers=req_headers, data=req_body) as r:
+            resp_body = await r.read()
+            resp = http.Response(r.status, r.reason, r.version, r.headers,
+                                 req_url)
+        if tracing.enabled:
+            tracing.span(start, time.time() - start, method,
+                         metrics.url_template(url), resp, len(resp_body))
+        self._error_checker(resp, resp_body)
+        return resp, resp_body
+
+    async def get_async(self, url, headers=None):
+        return await self.request_async('GET', url, headers=headers)
+
+
+class AsyncDatabaseFlavorsClient(AsyncDatabaseClient):
+
+    record_types = {'flavors': records.Flavor, 'flavor': records.Flavor}
+
+    async def list_db_flavors(self, params=None):
+        resp, body = await self.get_async(
+            base_client.build_url('flavors', params))
+        self.expected_success(200, resp.status)
+        body = self._json_loads(body)
+        return rest_client.ResponseBody(resp, body)
+
+    async def show_db_flavor(self, db_flavor_id):
+        resp, body = await self.get_async("flavors/%s" % db_flavor_id)
+        self.expected_success(200, resp.status)
+        body = self._json_loads(body)
+        return rest_client.ResponseBody(resp, body)
+
+
+class AsyncDatabaseLimitsClient(AsyncDatabaseClient):
+
+    record_types = {'limits': records.Limit}
+
+    async def list_db_limits(self, params=None):
+        """List all limits."""
+        resp, body = await self.get_async(
+            base_client.build_url('limits', params))
+        self.expected_success(200, resp.status)
+        body = self._json_loads(body)
+        return rest_client.ResponseBody(resp, body)
+
+
+class AsyncDatabaseVersionsClient(AsyncDatabaseClient):
+
+    record_types = {'versions': records.Version}
+
+    def __init__(self, auth_provider, service, region, **kwargs):
+        super(AsyncDatabaseVersionsClient, self).__init__(
+            auth_provider, service, region, **kwargs)
+        self.skip_path()
+
+    async def list_db_versions(self, params=None):
+        """List all versions."""
+        resp, body = await self.get_async(base_client.build_url('', params))
+        self.expected_success(200, resp.status)
+        body = self._json_loads(body)
+        return rest_client.ResponseBody(resp, body)
@@ -0,0 +1,211 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from six.moves.urllib import parse as urllib
+from tempest.lib.common import rest_client
+
+from trove_tempest_plugin.services.database import decoders
+from trove_tempest_plugin.services.database import http
+from trove_tempest_plugin.services.database import memory
+from trove_tempest_plugin.services.database import metrics
+from trove_tempest_plugin.services.database import records
+from trove_tempest_plugin.services.database import tracing
+
+
+def build_url(path, params=None):
+    """Return a relative request URL with its query string."""
+    if params:
+        path += '?%s' % urllib.urlencode(params)
+    return path
+
+
+def next_marker(body, collection):
+    """Return the marker of the next page advertised in a list response.
+
+    Trove advertises the next page in a top-level ``links`` list, Nova
+    style APIs in ``<collection>_links``. None is returned on the last page.
+    """
+    links = body.get('links', []) + body.get('%s_links' % collection, [])
+    for link in links:
+        if link.get('rel') == 'next':
+            query = urllib.urlparse(link['href']).query
+            markers = urllib.parse_qs(query).get('marker')
+            if markers:
+                return markers[0]
+    return None
+
+
+class BaseDatabaseClient(rest_client.RestClient):
+    """Base class for the Trove service clients.
+
+    Unless a proxy is configured, requests go through the process-wide
+    keep-alive connection pool from :mod:`trove_tempest_plugin.services.
+    database.http`, so all Trove clients share their connections.
+
+    When :mod:`trove_tempest_plugin.services.database.metrics` is enabled,
+    every request is timed and attributed to its endpoint; when
+    :mod:`trove_tempest_plugin.services.database.tracing` is enabled, it is
+    also exported as a trace span.
+
+    :param pool_maxsize: number of idle connections kept per endpoint
+    :param response_cache: a :class:`trove_tempest_plugin.services.database.
+                           cache.ResponseCache` used by the calls that go
+                           through :meth:`_cached_get_json`
+    :param json_decoder: name of the JSON decoder of response bodies, see
+                         :mod:`trove_tempest_plugin.services.database.
+                         decoders`; the fastest installed one by default
+    :param rate_limiter: a :class:`trove_tempest_plugin.services.database.
+                         throttle.RateLimiter` every request waits on
+    :param retry_policy: a :class:`trove_tempest_plugin.services.database.
+                         retry.RetryPolicy` for transient failures
+    :param typed_records: decode the members listed in ``record_types`` into
+                          the compact records of :mod:`trove_tempest_plugin.
+                          services.database.records` instead of dicts
+    """
+
+    # Record class of each body member converted with typed_records.
+    record_types = {}
+
+    def __init__(self, auth_provider, service, region, pool_maxsize=None,
+                 response_cache=None, json_decoder=decoders.DEFAULT,
+                 rate_limiter=None, retry_policy=None, typed_records=False,
+                 **kwargs):
+        super(BaseDatabaseClient, self).__init__(
+            auth_provider, service, region, **kwargs)
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.typed_records = typed_records
+        self.json_decoder, self._loads = decoders.get_decoder(json_decoder)
+        if not kwargs.get('proxy_url'):
+            self.http_obj = http.get_http(
+                disable_ssl_certificate_validation=kwargs.get(
+                    'disable_ssl_certificate_validation', False),
+                ca_certs=kwargs.get('ca_certs'),
+                timeout=kwargs.get('http_timeout'),
+                follow_redirects=kwargs.get('follow_redirects', True),
+                maxsize=pool_maxsize)
+        # Per-thread state of the request in flight: the endpoint it was
+        # sent to and its metrics and memory samples, completed by
+        # _json_loads.
+        self._local = threading.local()
+
+    def request(self, method, url, *args, **kwargs):
+        self._local.endpoint = '%s %s' % (method, metrics.url_template(url))
+        self._local.sample = None
+        self._local.memory = (memory.start_call(self._local.endpoint)
+                              if memory.enabled else None)
+        try:
+            result = super(BaseDatabaseClient, self).request(
+                method, url, *args, **kwargs)
+        finally:
+            self._local.endpoint = None
+        if self._local.memory is not None:
+            memory.response_received(self._local.memory)
+        return result
+
+    def raw_request(self, url, method, *args, **kwargs):
+        attempt = 0
+        while True:
+            resp, body = self._send(url, method, *args, **kwargs)
+            if self.retry_policy is None or kwargs.get('chunked'):
+                return resp, body
+            if not self.retry_policy.should_retry(method, resp.status,
+                                                  attempt):
+                return resp, body
+            delay = self.retry_policy.delay(attempt, resp)
+            endpoint = self._endpoint(method, url)
+            self.retry_policy.record(endpoint)
+            self.LOG.info("Retrying %s after a %s response in %.2f s "
+                          "(retry %d of %d)", endpoint, resp.status, delay,
+                          attempt + 1, self.retry_policy.attempts)
+            time.sleep(delay)
+            attempt += 1
+
+    def _endpoint(self, method, url):
+        endpoint = getattr(self._local, 'endpoint', None)
+        return endpoint or '%s %s' % (method, url)
+
+    def _send(self, url, method, *args, **kwargs):
+        throttled = 0.0
+        if self.rate_limiter is not None:
+            throttled = self.rate_limiter.acquire(method, url)
+        if not (metrics.enabled or tracing.enabled):
+            return super(BaseDatabaseClient, self).raw_request(
+                url, method, *args, **kwargs)
+        start = time.time()
+        resp, body = super(BaseDatabaseClient, self).raw_request(
+            url, method, *args, **kwargs)
+        duration = time.time() - start
+        endpoint = self._endpoint(method, url)
+        size = len(body or b'')
+        if metrics.enabled:
+            self._local.sample = metrics.record(
+                endpoint, duration, size, resp.status, throttled=throttled)
+        if tracing.enabled:
+            tracing.span(start, duration, method,
+                         endpoint.split(' ', 1)[-1], resp, size)
+        return resp, body
+
+    def _json_loads(self, body):
+        """Decode a JSON response body."""
+        sample = getattr(self._local, 'sample', None)
+        call = getattr(self._local, 'memory', None)
+        if sample is None and call is None:
+            return self._decode(body)
+        self._local.sample = self._local.memory = None
+        start = time.time()
+        body = self._decode(body)
+        if sample is not None:
+            sample.decode = time.time() - start
+        if call is not None:
+            memory.body_decoded(call)
+        return body
+
+    def _decode(self, body):
+        if self.typed_records:
+            return records.convert(self._loads(body), self.record_types)
+        return self._loads(body)
+
+    def _cached_get_json(self, url):
+        """GET a URL and decode its JSON body, using the response cache.
+
+        Without a response cache this is a plain GET. With one, a fresh
+        cached response is returned without a request, and a stale one is
+        revalidated with a conditional GET and reused on 304.
+
+        :return: a tuple of the response and the decoded body
+        """
+        if self.response_cache is None:
+            resp, body = self.get(url)
+            return resp, self._json_loads(body)
+
+        # Bodies are cached decoded, so clients that decode differently
+        # must not share entries.
+        key = (self.base_url, url, self.json_decoder, self.typed_records)
+        entry, fresh = self.response_cache.lookup(key)
+        if fresh:
+            return entry.resp, entry.body
+        headers = entry.validators() if entry is not None else {}
+        resp, body = self.get(url, headers=headers, extra_headers=True)
+        if resp.status == 304 and entry is not None:
+            self.response_cache.revalidated(entry)
+            return entry.resp, entry.body
+        body = self._json_loads(body)
+        if resp.status == 200:
+            self.response_cache.store(key, resp, body)
+        return resp, body
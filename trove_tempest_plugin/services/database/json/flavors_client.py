@@ -13,25 +13,105 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from oslo_serialization import jsonutils as json
-from six.moves import urllib
+from concurrent import futures
+
 from tempest.lib.common import rest_client
+from tempest.lib import exceptions as lib_exc
+
+from trove_tempest_plugin.services.database import decoders
+from trove_tempest_plugin.services.database import records
+from trove_tempest_plugin.services.database.json import base_client
+
+# Upper bound on concurrent GETs issued by show_db_flavors.
+DEFAULT_MAX_WORKERS = 8
+# Number of flavors requested per page by iter_db_flavors.
+DEFAULT_PAGE_SIZE = 100
+
 
+class DatabaseFlavorsClient(base_client.BaseDatabaseClient):
 
-class DatabaseFlavorsClient(rest_client.RestClient):
+    record_types = {'flavors': records.Flavor, 'flavor': records.Flavor}
 
     def list_db_flavors(self, params=None):
-        url = 'flavors'
-        if params:
-            url += '?%s' % urllib.parse.urlencode(params)
+        resp, body = self._cached_get_json(
+            base_client.build_url('flavors', params))
+        self.expected_success(200, resp.status)
+        return rest_client.ResponseBody(resp, body)
+
+    def iter_db_flavors(self, page_size=DEFAULT_PAGE_SIZE, params=None,
+                        incremental=False):
+        """Iterate over all flavors, fetching them one page at a time.
 
+        Pages are requested with ``limit``/``marker`` and followed through
+        the ``next`` link of each response, so only a single page is held
+        in memory at once. A server that does not paginate returns every
+        flavor in the first page.
+
+        :param incremental: decode the flavors of each page one at a time
+                            (with ijson, when installed) instead of decoding
+                            the whole page first. Pages are then never
+                            served from the response cache.
+        """
+        params = dict(params or {}, limit=page_size)
+        while True:
+            if incremental:
+                page = {}
+                flavors = self._iter_page(
+                    base_client.build_url('flavors', params), page)
+            else:
+                page = self.list_db_flavors(params)
+                flavors = page['flavors']
+            empty = True
+            for flavor in flavors:
+                empty = False
+                yield flavor
+            marker = base_client.next_marker(page, 'flavors')
+            if empty or marker is None or marker == params.get('marker'):
+                return
+            params['marker'] = marker
+
+    def _iter_page(self, url, page):
         resp, body = self.get(url)
         self.expected_success(200, resp.status)
-        body = json.loads(body)
-        return rest_client.ResponseBody(resp, body)
+        flavors = decoders.iter_items(body, 'flavors', rest=page,
+                                      loads=self._json_loads)
+        if self.typed_records:
+            return (records.Flavor.from_dict(f) for f in flavors)
+        return flavors
 
     def show_db_flavor(self, db_flavor_id):
         resp, body = self.get("flavors/%s" % db_flavor_id)
         self.expected_success(200, resp.status)
-        body = json.loads(body)
+        body = self._json_loads(body)
         return rest_client.ResponseBody(resp, body)
+
+    def show_db_flavors(self, db_flavor_ids, max_workers=DEFAULT_MAX_WORKERS):
+        """Show several flavors concurrently.
+
+        The GETs are spread over a pool of at most ``max_workers`` threads.
+        Flavors that do not exist do not abort the batch; their NotFound
+        errors are collected and returned alongside the results instead.
+
+        :param db_flavor_ids: iterable of flavor ids to fetch
+        :param max_workers: maximum number of requests in flight
+        :return: a tuple ``(bodies, not_found)`` where ``bodies`` is a list
+                 of ResponseBody objects in the order of ``db_flavor_ids``
+                 (``None`` for missing flavors) and ``not_found`` maps each
+                 missing flavor id to its NotFound exception
+        """
+        db_flavor_ids = list(db_flavor_ids)
+        bodies = [None] * len(db_flavor_ids)
+        not_found = {}
+        if not db_flavor_ids:
+            return bodies, not_found
+
+        workers = max(1, min(max_workers, len(db_flavor_ids)))
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = [executor.submit(self.show_db_flavor, db_flavor_id)
+                       for db_flavor_id in db_flavor_ids]
+            for index, future in enumerate(pending):
+                try:
+                    bodies[index] = future.result()
+                except lib_exc.NotFound as e:
+                    not_found[db_flavor_ids[index]] = e
+        return bodies, not_found
@@ -0,0 +1,80 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslo_serialization import jsonutils as json
+from tempest.lib.common import rest_client
+from tempest.lib import exceptions as lib_exc
+
+from trove_tempest_plugin.services.database.json import base_client
+
+
+class DatabaseInstancesClient(base_client.BaseDatabaseClient):
+
+    def create_db_instance(self, name, flavor_ref, volume_size=None,
+                           **kwargs):
+        """Create a database instance.
+
+        Extra keyword arguments, such as ``datastore`` or ``nics``, are
+        passed in the ``instance`` request body.
+        """
+        instance = dict(kwargs, name=name, flavorRef=flavor_ref)
+        if volume_size:
+            instance['volume'] = {'size': volume_size}
+        post_body = json.dumps({'instance': instance})
+        resp, body = self.post('instances', post_body)
+        self.expected_success(200, resp.status)
+        body = self._json_loads(body)
+        return rest_client.ResponseBody(resp, body)
+
+    def show_db_instance(self, instance_id):
+        resp, body = self.get('instances/%s' % instance_id)
+        self.expected_success(200, resp.status)
+        body = self._json_loads(body)
+        return rest_client.ResponseBody(resp, body)
+
+    def list_db_instances(self, params=None):
+        resp, body = self.get(base_client.build_url('instances', params))
+        self.expected_success(200, resp.status)
+        body = self._json_loads(body)
+        return rest_client.ResponseBody(resp, body)
+
+    def iter_db_instances(self, params=None):
+        """Iterate over all instances, following the pagination links."""
+        params = dict(params or {})
+        while True:
+            body = self.list_db_instances(params)
+            instances = body['instances']
+            for instance in instances:
+                yield instance
+            marker = base_client.next_marker(body, 'instances')
+            if not instances or marker in (None, params.get('marker')):
+                return
+            params['marker'] = marker
+
+    def delete_db_instance(self, instance_id):
+        resp, body = self.delete('instances/%s' % instance_id)
+        self.expected_success(202, resp.status)
+        return rest_client.ResponseBody(resp, body)
+
+    def is_resource_deleted(self, id):
+        try:
+            self.show_db_instance(id)
+        except lib_exc.NotFound:
+            return True
+        return False
+
+    @property
+    def resource_type(self):
+        """Return the primary type of resource this client works with."""
+        return 'database instance'
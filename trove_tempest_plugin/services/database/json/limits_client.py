@@ -13,19 +13,19 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from oslo_serialization import jsonutils as json
-from six.moves.urllib import parse as urllib
 from tempest.lib.common import rest_client
 
+from trove_tempest_plugin.services.database import records
+from trove_tempest_plugin.services.database.json import base_client
 
-class DatabaseLimitsClient(rest_client.RestClient):
+
+class DatabaseLimitsClient(base_client.BaseDatabaseClient):
+
+    record_types = {'limits': records.Limit}
 
     def list_db_limits(self, params=None):
         """List all limits."""
-        url = 'limits'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
+        resp, body = self.get(base_client.build_url('limits', params))
         self.expected_success(200, resp.status)
-        body = json.loads(body)
+        body = self._json_loads(body)
         return rest_client.ResponseBody(resp, body)
@@ -13,12 +13,15 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from oslo_serialization import jsonutils as json
-from six.moves.urllib import parse as urllib
 from tempest.lib.common import rest_client
 
+from trove_tempest_plugin.services.database import records
+from trove_tempest_plugin.services.database.json import base_client
 
-class DatabaseVersionsClient(rest_client.RestClient):
+
+class DatabaseVersionsClient(base_client.BaseDatabaseClient):
+
+    record_types = {'versions': records.Version}
 
     def __init__(self, auth_provider, service, region, **kwargs):
         super(DatabaseVersionsClient, self).__init__(
@@ -27,11 +30,7 @@ class DatabaseVersionsClient(rest_client.RestClient):
 
     def list_db_versions(self, params=None):
         """List all versions."""
-        url = ''
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-
-        resp, body = self.get(url)
+        resp, body = self._cached_get_json(
+            base_client.build_url('', params))
         self.expected_success(200, resp.status)
-        body = json.loads(body)
         return rest_client.ResponseBody(resp, body)
@@ -0,0 +1,207 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Opt-in tracemalloc profiling of database client calls and test classes.
+
+When enabled, every request sent by a database client records the memory
+allocated since the request started at two points: once the raw response
+body has been read, and once it has been decoded from JSON. The difference
+between the two is the memory held by the parsed body. The peak during the
+call is recorded as well, on Pythons that can reset the tracemalloc peak
+(3.9 and newer).
+
+Per test class, the peak and retained memory over the whole class are
+recorded together with the allocation sites that grew the most, so the code
+paths still holding response bodies at the end of a class can be found.
+:func:`flush` appends one JSON object per test class to a file.
+
+tracemalloc traces the whole process, so the numbers of concurrent calls,
+e.g. those of ``show_db_flavors``, include each other's allocations.
+"""
+
+import collections
+import json
+import os
+import threading
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from trove_tempest_plugin.services.database import context
+
+enabled = False
+
+_lock = threading.Lock()
+_samples = collections.defaultdict(lambda: collections.defaultdict(list))
+_started_tracing = False
+# Highest traced memory seen since the last class_start, kept across the
+# peak resets of individual calls.
+_peak = 0
+
+
+class CallSample(object):
+    __slots__ = ('start', 'peak', 'response', 'decoded')
+
+    def __init__(self, start):
+        self.start = start
+        self.peak = None
+        self.response = None
+        self.decoded = None
+
+
+class ClassMark(object):
+    __slots__ = ('start', 'snapshot')
+
+    def __init__(self, start, snapshot):
+        self.start = start
+        self.snapshot = snapshot
+
+
+def enable(frames=5):
+    """Start tracing allocations, keeping ``frames`` frames per trace.
+
+    :return: False if tracemalloc is not available
+    """
+    global enabled, _started_tracing
+    if tracemalloc is None:
+        return False
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+        _started_tracing = True
+    enabled = True
+    return True
+
+
+def disable():
+    global enabled, _started_tracing
+    enabled = False
+    if _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+def _traced():
+    """Return the traced memory, resetting the peak when possible."""
+    global _peak
+    current, peak = tracemalloc.get_traced_memory()
+    if hasattr(tracemalloc, 'reset_peak'):
+        _peak = max(_peak, peak)
+        tracemalloc.reset_peak()
+        return current, peak
+    return current, None
+
+
+def start_call(endpoint):
+    """Start recording a request to ``endpoint`` and return its sample."""
+    sample = CallSample(_traced()[0])
+    with _lock:
+        _samples[context.current_test()][endpoint].append(sample)
+    return sample
+
+
+def _mark(sample, attr):
+    current, peak = _traced()
+    if peak is not None:
+        sample.peak = max(sample.peak or 0, peak - sample.start)
+    setattr(sample, attr, current - sample.start)
+
+
+def response_received(sample):
+    _mark(sample, 'response')
+
+
+def body_decoded(sample):
+    _mark(sample, 'decoded')
+
+
+def class_start():
+    """Start recording a test class and return its mark."""
+    global _peak
+    current = _traced()[0]
+    _peak = current
+    return ClassMark(current, tracemalloc.take_snapshot())
+
+
+def _summary(values):
+    values = [v for v in values if v is not None]
+    if not values:
+        return {}
+    return {'max': max(values), 'mean': sum(values) // len(values)}
+
+
+def _endpoints(samples):
+    return {
+        'count': len(samples),
+        'peak_bytes': _summary([s.peak for s in samples]),
+        'response_bytes': _summary([s.response for s in samples]),
+        'decoded_bytes': _summary([s.decoded for s in samples]),
+    }
+
+
+def _top_allocations(mark, limit):
+    this_file = os.path.splitext(__file__)[0]
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__),
+         tracemalloc.Filter(False, this_file + '.py*')])
+    top = []
+    for stat in snapshot.compare_to(mark.snapshot, 'traceback'):
+        if len(top) >= limit:
+            break
+        if stat.size_diff <= 0:
+            continue
+        top.append({
+            'size_diff': stat.size_diff,
+            'count_diff': stat.count_diff,
+            'traceback': ['%s:%s' % (frame.filename, frame.lineno)
+                          for frame in stat.traceback],
+        })
+    return top
+
+
+def class_report(test_id, mark, limit=10):
+    """Return the memory profile of a test class and reset the calls.
+
+    :param mark: the mark returned by :func:`class_start`
+    :param limit: number of allocation sites to report
+    """
+    current, peak = _traced()
+    with _lock:
+        recorded = [(test, dict(endpoints))
+                    for test, endpoints in _samples.items()]
+        _samples.clear()
+    return {
+        'test': test_id,
+        'peak_bytes': (max(_peak, peak) - mark.start
+                       if peak is not None else None),
+        'retained_bytes': current - mark.start,
+        'top_allocations': _top_allocations(mark, limit),
+        'calls': [{'id': idempotent_id, 'test': call_test_id,
+                   'endpoints': dict((endpoint, _endpoints(samples))
+                                     for endpoint, samples
+                                     in endpoints.items())}
+                  for (call_test_id, idempotent_id), endpoints in recorded],
+    }
+
+
+def flush(path, test_id, mark, limit=10):
+    """Append the profile of a test class to ``path`` as one JSON line."""
+    line = json.dumps(class_report(test_id, mark, limit),
+                      sort_keys=True) + '\n'
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode('utf-8'))
+    finally:
+        os.close(fd)
@@ -0,0 +1,139 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Opt-in per-endpoint timing of database client requests.
+
+When enabled, every request sent by a database client is recorded with its
+wall time, response size, JSON decode time, status and the time it was held
+back by the client-side rate limiter, grouped by test and
+by endpoint such as ``GET flavors/{id}``. :func:`flush` appends the
+resulting histograms to a file as one JSON object per line, keyed by the
+test's idempotent id.
+"""
+
+import bisect
+import collections
+import json
+import os
+import threading
+
+from trove_tempest_plugin.common import stats
+from trove_tempest_plugin.services.database import context
+
+# Upper bounds, in milliseconds, of the latency histogram buckets.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+enabled = False
+
+_lock = threading.Lock()
+_samples = collections.defaultdict(lambda: collections.defaultdict(list))
+
+
+class Sample(object):
+    __slots__ = ('wall', 'size', 'decode', 'status', 'throttled')
+
+    def __init__(self, wall, size, status, throttled=0.0):
+        self.wall = wall
+        self.size = size
+        self.decode = None
+        self.status = status
+        self.throttled = throttled
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def url_template(url):
+    """Return the path of a relative Trove URL with its ids replaced.
+
+    Trove paths alternate collection names and resource ids, so every
+    second segment is an id: ``flavors/7`` becomes ``flavors/{id}``.
+    """
+    path = url.split('?', 1)[0]
+    segments = [segment for segment in path.split('/') if segment]
+    for index in range(1, len(segments), 2):
+        segments[index] = '{id}'
+    return '/'.join(segments) or '/'
+
+
+def record(endpoint, wall, size, status, throttled=0.0):
+    """Record a request to ``endpoint`` and return its sample."""
+    sample = Sample(wall, size, status, throttled)
+    with _lock:
+        _samples[context.current_test()][endpoint].append(sample)
+    return sample
+
+
+def _histogram(samples):
+    # One count per bucket of LATENCY_BUCKETS_MS, plus one for slower calls.
+    buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    statuses = collections.Counter()
+    for sample in samples:
+        statuses[str(sample.status)] += 1
+        buckets[bisect.bisect_left(LATENCY_BUCKETS_MS,
+                                   sample.wall * 1000.0)] += 1
+    sizes = [sample.size for sample in samples]
+    decodes = [sample.decode for sample in samples
+               if sample.decode is not None]
+    return {
+        'count': len(samples),
+        'status': dict(statuses),
+        'latency_ms': stats.summarize([s.wall for s in samples]),
+        'latency_buckets_ms': list(zip(LATENCY_BUCKETS_MS + ('inf',),
+                                       buckets)),
+        'decode_ms': stats.summarize(decodes),
+        'bytes': {'total': sum(sizes), 'max': max(sizes)},
+        'throttle_wait_ms': stats.summarize(
+            [s.throttled for s in samples if s.throttled]),
+    }
+
+
+def histograms():
+    """Return the histograms recorded so far, one entry per test."""
+    with _lock:
+        recorded = [(test, dict(endpoints))
+                    for test, endpoints in _samples.items()]
+    return [{'id': idempotent_id, 'test': test_id,
+             'endpoints': dict((endpoint, _histogram(samples))
+                               for endpoint, samples in endpoints.items())}
+            for (test_id, idempotent_id), endpoints in recorded]
+
+
+def reset():
+    with _lock:
+        _samples.clear()
+
+
+def flush(path):
+    """Append the recorded histograms to ``path`` and reset them.
+
+    Each test is written with a single ``write`` to a file opened for
+    appending, so several test workers can share the file.
+    """
+    entries = histograms()
+    reset()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        for entry in entries:
+            line = json.dumps(entry, sort_keys=True) + '\n'
+            os.write(fd, line.encode('utf-8'))
+    finally:
+        os.close(fd)
@@ -0,0 +1,196 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compact, read-only records for flavor, limit and version payloads.
+
+Parsed JSON bodies hold one dict per flavor plus one per link, which makes
+up most of the memory of a large flavor catalog. The records here keep the
+known fields of a payload in ``__slots__`` instead, links in tuples of
+:class:`Link` records, and intern the strings that repeat across records,
+such as link relations and version ids. Strings that are unique to a
+record, such as link targets, are not interned: that would only add them
+to the interpreter's intern table. Members the record type does not know
+are kept in a dict, so nothing of the payload is lost.
+
+Records behave like read-only dicts for the usual lookups (``record[key]``,
+``key in record``, ``get``, ``keys``, ``items`` and iteration), and compare
+equal to the dicts they were built from, so tests written against dicts
+keep working.
+"""
+
+import six
+from six.moves import intern
+
+# Value of a known field that is absent from the payload.
+_MISSING = object()
+
+
+def _intern(value):
+    # intern() only takes the native str type, and the JSON decoders return
+    # unicode on Python 2. ASCII values are converted to a native str there
+    # first, which hashes and compares equal to the unicode value; values
+    # that do not encode to ASCII are kept as they are, not interned.
+    if six.PY2 and type(value) is six.text_type:
+        try:
+            value = str(value)
+        except UnicodeEncodeError:
+            return value
+    if type(value) is str:
+        return intern(value)
+    return value
+
+
+class Record(object):
+    """Base class of the records; subclasses set ``__slots__``."""
+
+    __slots__ = ('_extra',)
+    # Names of the fields, in the order of __slots__.
+    _fields = ()
+    # Fields whose string values repeat across records.
+    _interned = frozenset()
+    # Fields holding a list of nested records, by record class.
+    _nested = {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a decoded JSON object."""
+        if isinstance(data, cls):
+            return data
+        record = cls.__new__(cls)
+        extra = None
+        for key, value in six.iteritems(data):
+            if key not in cls._fields:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            if key in cls._nested and isinstance(value, list):
+                value = tuple(cls._nested[key].from_dict(item)
+                              for item in value)
+            elif key in cls._interned:
+                value = _intern(value)
+            setattr(record, key, value)
+        for name in cls._fields:
+            if not hasattr(record, name):
+                setattr(record, name, _MISSING)
+        record._extra = extra
+        return record
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def keys(self):
+        keys = [name for name in self._fields
+                if getattr(self, name) is not _MISSING]
+        if self._extra is not None:
+            keys.extend(self._extra)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def to_dict(self):
+        """Return the payload as plain dicts and lists."""
+        data = {}
+        for key, value in self.items():
+            if key in self._nested and isinstance(value, tuple):
+                value = [item.to_dict() for item in value]
+            data[key] = value
+        return data
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.to_dict()
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self.to_dict() == other
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.to_dict())
+
+
+class Link(Record):
+    __slots__ = _fields = ('href', 'rel')
+    _interned = frozenset(('rel',))
+
+
+class Flavor(Record):
+    __slots__ = _fields = ('id', 'str_id', 'name', 'ram', 'vcpus', 'disk',
+                           'ephemeral', 'links')
+    _nested = {'links': Link}
+
+
+class Limit(Record):
+    __slots__ = _fields = ('verb', 'uri', 'regex', 'value', 'remaining',
+                           'unit', 'nextAvailable', 'max_instances',
+                           'max_volumes', 'max_backups')
+    _interned = frozenset(('verb', 'uri', 'regex', 'unit'))
+
+
+class Version(Record):
+    __slots__ = _fields = ('id', 'status', 'updated', 'links')
+    _interned = frozenset(('id', 'status', 'updated'))
+    _nested = {'links': Link}
+
+
+def convert(body, record_types):
+    """Replace the members of a decoded body by records, in place.
+
+    :param record_types: record class by body member; a member holding a
+                         list is converted item by item
+    :return: ``body``
+    """
+    if not isinstance(body, dict):
+        return body
+    for key, record_type in six.iteritems(record_types):
+        value = body.get(key)
+        if isinstance(value, list):
+            body[key] = [record_type.from_dict(item) for item in value]
+        elif isinstance(value, dict):
+            body[key] = record_type.from_dict(value)
+    return body
@@ -0,0 +1,126 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Retries of idempotent database requests that failed transiently.
+
+Under load Trove answers some requests with ``503`` or ``overLimit``
+responses. A :class:`RetryPolicy` lets the database clients retry such
+responses to ``GET`` requests a few times, waiting with exponential
+backoff and full jitter, or for the delay the server asked for in
+``Retry-After``. Retries are counted per endpoint.
+
+``413`` responses are never retried here: tempest's ``RestClient.request``
+already retries them for the delay given in ``Retry-After``.
+"""
+
+import collections
+import email.utils
+import random
+import threading
+import time
+
+DEFAULT_STATUS_CODES = (429, 503)
+# Statuses that tempest's RestClient.request retries by itself.
+TEMPEST_RETRIED_CODES = frozenset((413,))
+# Only requests that can safely be sent twice are retried.
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD'))
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds a Retry-After header asks for, or None.
+
+    The header holds either a number of seconds or an HTTP date.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(parsed) - time.time())
+
+
+class RetryPolicy(object):
+    """Which responses to retry, how often and how long to wait.
+
+    :param status_codes: response statuses that are retried, except those
+                         in :data:`TEMPEST_RETRIED_CODES`
+    :param attempts: maximum number of retries of a request
+    :param backoff: base delay in seconds; retry ``n`` waits a random time
+                    of up to ``backoff * 2 ** n`` seconds
+    :param max_backoff: upper bound of any delay, in seconds
+    :param honour_retry_after: wait for the delay given in a Retry-After
+                               header instead of the computed backoff
+    """
+
+    def __init__(self, status_codes=DEFAULT_STATUS_CODES, attempts=3,
+                 backoff=0.5, max_backoff=30.0, honour_retry_after=True):
+        self.status_codes = frozenset(status_codes) - TEMPEST_RETRIED_CODES
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.honour_retry_after = honour_retry_after
+        self._retries = collections.Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    def should_retry(self, method, status, attempt):
+        """Whether retry number ``attempt`` (from 0) should be made."""
+        if attempt >= self.attempts:
+            return False
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        return idempotent and status in self.status_codes
+
+    def delay(self, attempt, resp):
+        """Return the seconds to wait before retry number ``attempt``."""
+        if self.honour_retry_after:
+            retry_after = parse_retry_after(resp.get('retry-after'))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff * 2 ** attempt)
+        with self._lock:
+            return self._random.uniform(0, ceiling)
+
+    def record(self, endpoint):
+        with self._lock:
+            self._retries[endpoint] += 1
+
+    def stats(self):
+        """Return the number of retries made per endpoint."""
+        with self._lock:
+            return dict(self._retries)
+
+
+def shared_policy(**kwargs):
+    """Return the process-wide retry policy, creating it on first call.
+
+    The keyword arguments are those of :class:`RetryPolicy` and are only
+    used by the first call.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RetryPolicy(**kwargs)
+        return _shared
+
+
+def shared_stats():
+    """Return the retry counts of the process-wide policy, if there is one."""
+    return _shared.stats() if _shared is not None else None
@@ -0,0 +1,169 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Client-side pacing of database requests under Trove's rate limits.
+
+Trove advertises its rate limits through the limits API as entries such as
+``{"verb": "GET", "regex": ".*", "value": 200, "unit": "MINUTE"}``. A
+:class:`RateLimiter` turns each of them into a token bucket, and the
+database clients sharing it wait for a token before each request instead of
+running into ``413``/``429`` responses. The time spent waiting is counted
+so that the cost of throttling stays visible.
+"""
+
+import re
+import threading
+import time
+
+from oslo_log import log as logging
+from six.moves.urllib import parse as urlparse
+
+LOG = logging.getLogger(__name__)
+
+UNIT_SECONDS = {
+    'SECOND': 1,
+    'MINUTE': 60,
+    'HOUR': 3600,
+    'DAY': 86400,
+}
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+class TokenBucket(object):
+    """Token bucket refilled at ``rate`` tokens per second.
+
+    Tokens are reserved rather than polled for: a reservation may drive the
+    bucket negative, and the caller waits for the time the bucket needs to
+    come back to zero. Concurrent callers are therefore served in order.
+    """
+
+    def __init__(self, rate, capacity, tokens=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = self.capacity if tokens is None else float(tokens)
+        self.updated = time.time()
+
+    def reserve(self):
+        """Take a token and return the seconds to wait before using it."""
+        now = time.time()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter(object):
+    """Token buckets for the rate limits advertised by Trove.
+
+    :param share: fraction of each advertised limit this limiter may use,
+                  e.g. ``1/N`` when N processes share the same project
+    """
+
+    def __init__(self, share=1.0):
+        self.share = share
+        self.seeded = False
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self._buckets = []
+        self._seeder = None
+        self._lock = threading.Lock()
+        # Held while the limits are fetched, so that concurrent requests
+        # wait for the buckets instead of going out unthrottled.
+        self._seed_lock = threading.Lock()
+
+    def seed(self, limits):
+        """Create one bucket per rate limit entry of a limits listing."""
+        buckets = []
+        for limit in limits:
+            unit = UNIT_SECONDS.get(str(limit.get('unit', '')).upper())
+            if limit.get('verb') == 'ABSOLUTE' or not unit:
+                continue
+            capacity = max(1.0, limit['value'] * self.share)
+            tokens = min(capacity,
+                         limit.get('remaining', limit['value']) * self.share)
+            pattern = limit.get('regex') or '.*'
+            buckets.append((limit['verb'].upper(), re.compile(pattern),
+                            TokenBucket(capacity / unit, capacity, tokens)))
+        with self._lock:
+            self._buckets = buckets
+            self.seeded = True
+        LOG.debug("Seeded database rate limiter with %d limit(s)",
+                  len(buckets))
+
+    def set_seeder(self, seeder):
+        """Seed from ``seeder()`` on the first request, unless seeded."""
+        with self._lock:
+            if self._seeder is None:
+                self._seeder = seeder
+
+    def _seed_once(self):
+        with self._seed_lock:
+            with self._lock:
+                seeder, self._seeder = self._seeder, None
+            if seeder is None:
+                return
+            try:
+                self.seed(seeder())
+            except Exception:
+                LOG.exception("Failed to fetch the database rate limits, "
+                              "requests will not be throttled")
+                self.seeded = True
+
+    def acquire(self, method, url):
+        """Wait until a request may be sent and return the time waited."""
+        if not self.seeded:
+            self._seed_once()
+        path = urlparse.urlparse(url).path
+        method = method.upper()
+        with self._lock:
+            wait = 0.0
+            for verb, regex, bucket in self._buckets:
+                if verb == method and regex.match(path):
+                    wait = max(wait, bucket.reserve())
+            if wait:
+                self.waits += 1
+                self.wait_time += wait
+                self.max_wait = max(self.max_wait, wait)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def stats(self):
+        with self._lock:
+            return {
+                'limits': len(self._buckets),
+                'throttled_requests': self.waits,
+                'wait_seconds': round(self.wait_time, 3),
+                'max_wait_seconds': round(self.max_wait, 3),
+            }
+
+
+def shared_limiter(share=1.0):
+    """Return the process-wide rate limiter, creating it on first call."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateLimiter(share)
+        return _shared
+
+
+def shared_stats():
+    """Return the counters of the process-wide limiter, if there is one."""
+    return _shared.stats() if _shared is not None else None
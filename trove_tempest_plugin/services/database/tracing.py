@@ -0,0 +1,220 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Opt-in export of database client requests as trace spans.
+
+When enabled, every HTTP request sent by a database client becomes a span
+with its start time, duration, method, URL template, status, response size
+and the request id Trove returned, attributed to the current test. Spans
+are appended to a file as newline-delimited JSON, so slow tests can be
+lined up with the Trove API logs by request id.
+
+Recording a span only queues a tuple; a background thread turns the spans
+into JSON and appends them in batches, so tracing stays off the request
+path. If writing fails, the error is logged and tracing is turned off
+rather than failing the tests.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+from oslo_log import log as logging
+from six.moves import queue
+
+from trove_tempest_plugin.services.database import context
+
+LOG = logging.getLogger(__name__)
+
+# Response headers carrying the id of the request on the server side.
+REQUEST_ID_HEADERS = ('x-openstack-request-id', 'x-compute-request-id')
+# Spans queued at most before new ones are dropped.
+MAX_QUEUED = 100000
+# Spans written at most per write.
+BATCH_SIZE = 1000
+# Seconds flush() and close() wait for the writer at most.
+WAIT_TIMEOUT = 30.0
+
+enabled = False
+
+_writer = None
+_lock = threading.Lock()
+_STOP = object()
+
+
+class TraceWriter(object):
+    """Background thread appending queued spans to a file.
+
+    The file is opened before the thread starts, so an unusable path
+    raises OSError here instead of in the thread.
+
+    :param path: file the spans are appended to
+    :param flush_interval: longest time in seconds a span waits in the
+                           queue while fewer than ``BATCH_SIZE`` are queued
+    """
+
+    FIELDS = ('start', 'duration', 'method', 'url', 'status', 'bytes',
+              'request_id', 'test', 'id')
+
+    def __init__(self, path, flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.failed = False
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                           0o644)
+        self._queue = queue.Queue(MAX_QUEUED)
+        self._thread = threading.Thread(target=self._run,
+                                        name='database-trace-writer')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def emit(self, span):
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _batch(self):
+        # Block for the first span, then collect spans for up to the flush
+        # interval. None is queued by flush() to cut a batch short.
+        batch = [self._queue.get()]
+        deadline = time.time() + self.flush_interval
+        while len(batch) < BATCH_SIZE and batch[-1] not in (_STOP, None):
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        spans = [span for span in batch
+                 if span is not _STOP and span is not None]
+        if spans:
+            lines = ''.join(
+                json.dumps(dict(zip(self.FIELDS, span)),
+                           sort_keys=True) + '\n'
+                for span in spans)
+            os.write(self._fd, lines.encode('utf-8'))
+
+    def _run(self):
+        global enabled
+        try:
+            while True:
+                batch = self._batch()
+                try:
+                    # After a failure the queue is only drained, so that
+                    # flush() and close() still return.
+                    if not self.failed:
+                        self._write(batch)
+                except Exception:
+                    LOG.exception("Writing database trace spans to %s "
+                                  "failed, tracing is disabled", self.path)
+                    self.failed = True
+                    enabled = False
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if batch[-1] is _STOP:
+                    return
+        finally:
+            os.close(self._fd)
+
+    def flush(self, timeout=WAIT_TIMEOUT):
+        """Wait until every queued span is written.
+
+        :returns: False if spans were still queued after ``timeout``
+                  seconds
+        """
+        # A marker wakes the writer up without waiting for a full batch;
+        # a full queue already makes full batches.
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        deadline = time.time() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout=WAIT_TIMEOUT):
+        """Write the queued spans and stop the thread."""
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            LOG.warning("Database trace writer is stuck, %s may miss spans",
+                        self.path)
+            return
+        self._thread.join(timeout)
+
+
+def enable(path, flush_interval=1.0):
+    """Start appending spans to ``path``.
+
+    :raises OSError: if ``path`` cannot be opened for appending
+    """
+    global enabled, _writer
+    with _lock:
+        if _writer is not None and _writer.path == path and not _writer.failed:
+            return
+        enabled = False
+        if _writer is not None:
+            _writer.close()
+            _writer = None
+        _writer = TraceWriter(path, flush_interval)
+        enabled = True
+
+
+def disable():
+    """Write the queued spans and stop tracing."""
+    global enabled, _writer
+    with _lock:
+        enabled = False
+        if _writer is not None:
+            _writer.close()
+            _writer = None
+
+
+def flush(timeout=WAIT_TIMEOUT):
+    writer = _writer
+    if writer is not None and not writer.flush(timeout):
+        LOG.warning("Database trace spans were not written to %s within "
+                    "%s seconds", writer.path, timeout)
+
+
+def span(start, duration, method, url, resp, size):
+    """Record a request to a URL template and its response."""
+    writer = _writer
+    if writer is None:
+        return
+    request_id = None
+    for header in REQUEST_ID_HEADERS:
+        request_id = resp.get(header)
+        if request_id:
+            break
+    test_id, idempotent_id = context.current_test()
+    writer.emit((start, duration, method, url, resp.status, size,
+                 request_id, test_id, idempotent_id))
+
+
+atexit.register(disable)
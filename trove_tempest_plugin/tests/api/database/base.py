@@ -13,15 +13,56 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import time
+
+from oslo_log import log as logging
 from tempest import config
+from tempest.lib.common.utils import data_utils
 import tempest.test
 
+from trove_tempest_plugin.common import cleanup
+from trove_tempest_plugin.common import durations
+from trove_tempest_plugin.common import waiters
+from trove_tempest_plugin.services.database import auth_cache
+from trove_tempest_plugin.services.database import cache
+from trove_tempest_plugin.services.database import context
+from trove_tempest_plugin.services.database import discovery
+from trove_tempest_plugin.services.database import http
+from trove_tempest_plugin.services.database import memory
+from trove_tempest_plugin.services.database import metrics
+from trove_tempest_plugin.services.database import retry
+from trove_tempest_plugin.services.database import throttle
+from trove_tempest_plugin.services.database import tracing
 from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import instances_client
 from trove_tempest_plugin.services.database.json import limits_client
 from trove_tempest_plugin.services.database.json import versions_client
 
 
 CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+
+class _lazy_client(object):
+    """Class attribute holding a client that is built on first access.
+
+    The client is cached per test class, so a class only pays for the
+    endpoint resolution and authentication of the clients it uses.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.name = build.__name__
+        self.__doc__ = build.__doc__
+
+    def __get__(self, instance, owner):
+        clients = owner.__dict__.get('_lazy_clients')
+        if clients is None:
+            clients = {}
+            setattr(owner, '_lazy_clients', clients)
+        if self.name not in clients:
+            clients[self.name] = self.build(owner)
+        return clients[self.name]
 
 
 class BaseDatabaseTest(tempest.test.BaseTestCase):
@@ -37,33 +78,110 @@ class BaseDatabaseTest(tempest.test.BaseTestCase):
             raise cls.skipException(skip_msg)
 
     @classmethod
-    def setup_clients(cls):
-        super(BaseDatabaseTest, cls).setup_clients()
-        default_params = config.service_client_config()
+    def setup_credentials(cls):
+        # The class setup is timed from here to the setUp of its first
+        # test, which tempest runs right after resource_setup, so the
+        # resource_setup of subclasses is included but the skip checks and
+        # any wait for the serial lock are not.
+        cls._setup_started = time.time()
+        super(BaseDatabaseTest, cls).setup_credentials()
+
+    @_lazy_client
+    def database_flavors_client(cls):
+        return cls.get_database_client(flavors_client.DatabaseFlavorsClient)
+
+    @_lazy_client
+    def os_flavors_client(cls):
+        # The compute client shares the provider, and so the cached token.
+        cls._auth_provider()
+        return cls.os_primary.flavors_client
+
+    @_lazy_client
+    def database_instances_client(cls):
+        return cls.get_database_client(
+            instances_client.DatabaseInstancesClient)
+
+    @_lazy_client
+    def database_limits_client(cls):
+        return cls.get_database_client(limits_client.DatabaseLimitsClient)
+
+    @_lazy_client
+    def database_versions_client(cls):
+        return cls.get_database_client(
+            versions_client.DatabaseVersionsClient)
+
+    @classmethod
+    def get_database_client(cls, client_class, **kwargs):
+        """Build a database client for the primary credentials.
 
-        # NOTE: Tempest uses timeout values of compute API if project specific
-        # timeout values don't exist.
-        default_params_with_timeout_values = {
-            'build_interval': CONF.compute.build_interval,
-            'build_timeout': CONF.compute.build_timeout
+        Every client built here draws its connections from the same
+        process-wide keep-alive pool, whichever test class asks for it.
+        Keyword arguments override the client parameters from the
+        configuration.
+        """
+        params = {
+            'build_interval': CONF.database.build_interval,
+            'build_timeout': CONF.database.build_timeout,
+            'pool_maxsize': CONF.database.http_pool_maxsize,
+            'json_decoder': CONF.database.json_decoder,
+            'typed_records': CONF.database.typed_records,
         }
-        default_params_with_timeout_values.update(default_params)
-        cls.database_flavors_client = flavors_client.DatabaseFlavorsClient(
-            cls.os_primary.auth_provider,
-            CONF.database.catalog_type,
-            CONF.identity.region,
-            **default_params_with_timeout_values)
-        cls.os_flavors_client = cls.os_primary.flavors_client
-        cls.database_limits_client = limits_client.DatabaseLimitsClient(
-            cls.os_primary.auth_provider,
+        params.update(config.service_client_config())
+        params.update(kwargs)
+        if 'response_cache' not in params:
+            params['response_cache'] = cls._response_cache()
+        if 'rate_limiter' not in params:
+            params['rate_limiter'] = cls._rate_limiter()
+        if 'retry_policy' not in params:
+            params['retry_policy'] = cls._retry_policy()
+        return client_class(
+            cls._auth_provider(),
             CONF.database.catalog_type,
             CONF.identity.region,
-            **default_params_with_timeout_values)
-        cls.database_versions_client = versions_client.DatabaseVersionsClient(
-            cls.os_primary.auth_provider,
-            CONF.database.catalog_type,
-            CONF.identity.region,
-            **default_params_with_timeout_values)
+            **params)
+
+    @classmethod
+    def _auth_provider(cls):
+        provider = cls.os_primary.auth_provider
+        # NOTE: Dynamic credentials are created for each test class, so
+        # their tokens are never shared between classes.
+        shared = not CONF.auth.use_dynamic_credentials
+        if CONF.database.auth_cache and shared:
+            auth_cache.shared_cache(
+                CONF.database.auth_cache_expiry_margin).install(provider)
+        return provider
+
+    @classmethod
+    def _rate_limiter(cls):
+        if not CONF.database.client_rate_limiting:
+            return None
+        limiter = throttle.shared_limiter(CONF.database.rate_limit_share)
+        if not limiter.seeded:
+            # The limits are fetched by an unthrottled client on the first
+            # throttled request.
+            limits = cls.get_database_client(
+                limits_client.DatabaseLimitsClient, rate_limiter=None)
+            limiter.set_seeder(
+                lambda: limits.list_db_limits()['limits'])
+        return limiter
+
+    @classmethod
+    def _retry_policy(cls):
+        if CONF.database.retry_attempts <= 0:
+            return None
+        return retry.shared_policy(
+            status_codes=CONF.database.retry_status_codes,
+            attempts=CONF.database.retry_attempts,
+            backoff=CONF.database.retry_backoff,
+            max_backoff=CONF.database.retry_max_backoff,
+            honour_retry_after=CONF.database.retry_honour_retry_after)
+
+    @classmethod
+    def _response_cache(cls):
+        if CONF.database.response_cache_ttl <= 0:
+            return None
+        return cache.shared_cache(CONF.database.response_cache_size,
+                                  CONF.database.response_cache_ttl)
 
     @classmethod
     def resource_setup(cls):
@@ -72,3 +190,166 @@ class BaseDatabaseTest(tempest.test.BaseTestCase):
         cls.catalog_type = CONF.database.catalog_type
         cls.db_flavor_ref = CONF.database.db_flavor_ref
         cls.db_current_version = CONF.database.db_current_version
+        cls.volume_size = CONF.database.volume_size
+
+        if CONF.database.request_metrics_file:
+            metrics.enable()
+        if CONF.database.trace_file:
+            tracing.enable(CONF.database.trace_file)
+        cls._memory_mark = None
+        if CONF.database.memory_profile_file:
+            if memory.enable(CONF.database.memory_profile_frames):
+                cls._memory_mark = memory.class_start()
+            else:
+                LOG.warning("tracemalloc is not available, database memory "
+                            "profiling is disabled")
+        context.set_test(cls._class_test_id())
+
+    @classmethod
+    def resource_cleanup(cls):
+        try:
+            if '_cleanup_registry' in cls.__dict__:
+                registry = cls._cleanup_registry
+                del cls._cleanup_registry
+                registry.cleanup()
+        finally:
+            cls._release_resources()
+            super(BaseDatabaseTest, cls).resource_cleanup()
+
+    @classmethod
+    def _release_resources(cls):
+        LOG.debug("Database connection pool usage after %s: %s",
+                  cls.__name__, http.connection_stats())
+        if auth_cache.shared_stats():
+            LOG.debug("Auth cache usage after %s: %s",
+                      cls.__name__, auth_cache.shared_stats())
+        if discovery.shared_stats():
+            LOG.debug("Database version cache usage after %s: %s",
+                      cls.__name__, discovery.shared_stats())
+        if cache.shared_stats():
+            LOG.debug("Database response cache usage after %s: %s",
+                      cls.__name__, cache.shared_stats())
+        if throttle.shared_stats():
+            LOG.debug("Database rate limiter usage after %s: %s",
+                      cls.__name__, throttle.shared_stats())
+        if retry.shared_stats():
+            LOG.info("Database requests retried after transient failures "
+                     "up to %s: %s", cls.__name__, retry.shared_stats())
+        context.clear()
+        if CONF.database.request_metrics_file:
+            metrics.flush(CONF.database.request_metrics_file)
+        if CONF.database.test_durations_file:
+            durations.shared_store(CONF.database.test_durations_file).flush()
+        if CONF.database.trace_file:
+            tracing.flush()
+        if getattr(cls, '_memory_mark', None) is not None:
+            memory.flush(CONF.database.memory_profile_file,
+                         cls._class_test_id(), cls._memory_mark,
+                         CONF.database.memory_profile_top)
+            cls._memory_mark = None
+        if '_lazy_clients' in cls.__dict__:
+            del cls._lazy_clients
+
+    @classmethod
+    def resolve_db_current_version(cls):
+        """Return the current API version of the database endpoint.
+
+        The versions are listed once per endpoint and cache lifetime, then
+        served from the version cache without a request. Falls back to
+        ``[database] db_current_version`` when the cache is disabled or no
+        version is CURRENT.
+        """
+        if CONF.database.version_cache_ttl <= 0:
+            return CONF.database.db_current_version
+        versions = discovery.shared_cache(
+            CONF.database.version_cache_ttl,
+            CONF.database.version_cache_file).discover(
+                cls.database_versions_client)
+        current = discovery.current_version(versions)
+        return current or CONF.database.db_current_version
+
+    @classmethod
+    def create_db_instances(cls, count, **kwargs):
+        """Create ``count`` instances concurrently and wait for them.
+
+        The instances use the configured flavor and volume size unless
+        given otherwise in ``kwargs``. Each instance is tracked for deletion
+        as soon as its create request returns, so it is deleted at class
+        cleanup even if the wait for its status fails.
+        """
+        kwargs.setdefault('flavor_ref', cls.db_flavor_ref)
+        kwargs.setdefault('volume_size', cls.volume_size)
+        wait_status = kwargs.pop('wait_status', 'ACTIVE')
+        max_interval = kwargs.pop('max_interval',
+                                  CONF.database.max_build_interval)
+        client = cls.database_instances_client
+        instances = waiters.create_db_instances(
+            client, count, data_utils.rand_name(cls.__name__),
+            wait_status=None,
+            on_created=lambda instance: cls.track_db_resource(
+                'instance', instance['id']),
+            **kwargs)
+        if wait_status:
+            found = waiters.wait_for_db_instances_status(
+                client, [i['id'] for i in instances], wait_status,
+                max_interval=max_interval)
+            instances = [found.get(i['id'], i) for i in instances]
+        return instances
+
+    @classmethod
+    def cleanup_registry(cls):
+        """Return the registry of resources deleted at class cleanup.
+
+        Database instances are known to it; subclasses register further
+        kinds of resources with ``register_kind``.
+        """
+        if '_cleanup_registry' not in cls.__dict__:
+            registry = cleanup.CleanupRegistry()
+            client = cls.database_instances_client
+            registry.register_kind(
+                'instance', client.delete_db_instance,
+                lambda ids: waiters.wait_for_db_instances_deletion(
+                    client, ids,
+                    max_interval=CONF.database.max_build_interval))
+            cls._cleanup_registry = registry
+        return cls._cleanup_registry
+
+    @classmethod
+    def track_db_resource(cls, kind, resource_id, before=()):
+        """Delete a resource at class cleanup.
+
+        :param before: ``(kind, id)`` pairs of tracked resources that can
+                       only be deleted once this one is gone
+        """
+        cls.cleanup_registry().track(kind, resource_id, before=before)
+
+    @classmethod
+    def _class_test_id(cls):
+        return '%s.%s' % (cls.__module__, cls.__name__)
+
+    @classmethod
+    def _record_class_setup(cls):
+        if '_setup_started' not in cls.__dict__:
+            return
+        started = cls._setup_started
+        del cls._setup_started
+        if CONF.database.test_durations_file:
+            # Flushed with the test durations at class cleanup.
+            durations.shared_store(
+                CONF.database.test_durations_file).record_setup(
+                    cls._class_test_id(), time.time() - started)
+
+    def setUp(self):
+        self._record_class_setup()
+        super(BaseDatabaseTest, self).setUp()
+        idempotent_id = context.idempotent_id(self)
+        if CONF.database.test_durations_file and idempotent_id:
+            # Cleanups run in reverse order, so the duration covers the
+            # cleanups the test adds as well.
+            self.addCleanup(self._record_duration, idempotent_id, time.time())
+        context.set_test(self.id(), idempotent_id)
+        self.addCleanup(context.set_test, self._class_test_id())
+
+    def _record_duration(self, idempotent_id, started):
+        durations.shared_store(CONF.database.test_durations_file).record(
+            idempotent_id, self.id(), time.time() - started)
@@ -17,6 +17,7 @@ from tempest.lib import decorators
 from tempest import test
 from testtools import testcase as testtools
 
+from trove_tempest_plugin.common import flavors
 from trove_tempest_plugin.tests.api.database import base
 
 
@@ -44,19 +45,11 @@ class DatabaseFlavorsTest(base.BaseDatabaseTest):
         flavor = (self.client.show_db_flavor(self.db_flavor_ref)
                   ['flavor'])
         # List of all flavors should contain the expected flavor
-        flavors = self.client.list_db_flavors()['flavors']
-        self.assertIn(flavor, flavors)
-
-    def _check_values(self, names, db_flavor, os_flavor, in_db=True):
-        for name in names:
-            self.assertIn(name, os_flavor)
-            if in_db:
-                self.assertIn(name, db_flavor)
-                self.assertEqual(str(db_flavor[name]), str(os_flavor[name]),
-                                 "DB flavor differs from OS on '%s' value"
-                                 % name)
-            else:
-                self.assertNotIn(name, db_flavor)
+        db_flavor = flavors.find_db_flavor(self.client.iter_db_flavors(),
+                                           self.db_flavor_ref)
+        self.assertIsNotNone(db_flavor, "Flavor %s is not listed"
+                             % self.db_flavor_ref)
+        self.assertEqual(flavor, db_flavor)
 
     @testtools.attr('smoke')
     @decorators.idempotent_id('afb2667f-4ec2-4925-bcb7-313fdcffb80d')
@@ -65,24 +58,6 @@ class DatabaseFlavorsTest(base.BaseDatabaseTest):
         db_flavors = self.client.list_db_flavors()['flavors']
         os_flavors = (self.os_flavors_client.list_flavors(detail=True)
                       ['flavors'])
-        self.assertEqual(len(os_flavors), len(db_flavors),
-                         "OS flavors %s do not match DB flavors %s" %
-                         (os_flavors, db_flavors))
-        for os_flavor in os_flavors:
-            db_flavor =\
-                self.client.show_db_flavor(os_flavor['id'])['flavor']
-            if db_flavor['id']:
-                self.assertIn('id', db_flavor)
-                self.assertEqual(str(db_flavor['id']), str(os_flavor['id']),
-                                 "DB flavor id differs from OS flavor id value"
-                                 )
-            else:
-                self.assertIn('str_id', db_flavor)
-                self.assertEqual(db_flavor['str_id'], str(os_flavor['id']),
-                                 "DB flavor id differs from OS flavor id value"
-                                 )
-
-            self._check_values(['name', 'ram', 'vcpus',
-                                'disk'], db_flavor, os_flavor)
-            self._check_values(['swap'], db_flavor, os_flavor,
-                               in_db=False)
+        diff = flavors.diff_flavors(db_flavors, os_flavors)
+        self.assertFalse(diff, "DB flavors differ from OS flavors: %s"
+                         % diff)
@@ -0,0 +1,91 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslo_log import log as logging
+from tempest import config
+from tempest.lib import decorators
+from testtools import testcase as testtools
+
+from trove_tempest_plugin.common import benchmark
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import limits_client
+from trove_tempest_plugin.services.database.json import versions_client
+from trove_tempest_plugin.tests.api.database import base
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+
+class DatabaseLatencyTest(base.BaseDatabaseTest):
+    """Check the p95 latency of the Trove read endpoints against budgets.
+
+    The clients used here neither cache responses nor pace or retry
+    requests, so every sample is one plain request.
+    """
+
+    @classmethod
+    def skip_checks(cls):
+        super(DatabaseLatencyTest, cls).skip_checks()
+        if not CONF.database_performance.enabled:
+            skip_msg = ("%s skipped as [database_performance] enabled is "
+                        "not set" % cls.__name__)
+            raise cls.skipException(skip_msg)
+
+    @classmethod
+    def resource_setup(cls):
+        super(DatabaseLatencyTest, cls).resource_setup()
+        params = {'response_cache': None, 'rate_limiter': None,
+                  'retry_policy': None}
+        cls.db_flavors_client = cls.get_database_client(
+            flavors_client.DatabaseFlavorsClient, **params)
+        cls.db_limits_client = cls.get_database_client(
+            limits_client.DatabaseLimitsClient, **params)
+        cls.db_versions_client = cls.get_database_client(
+            versions_client.DatabaseVersionsClient, **params)
+
+    def _check_latency(self, name, operation):
+        budget = getattr(CONF.database_performance, name + '_p95')
+        latency = benchmark.sample(
+            operation, getattr(CONF.database_performance, name + '_samples'),
+            warmup=CONF.database_performance.warmup_requests)
+        LOG.info("%s latency in ms: %s", name, latency)
+        self.assertLessEqual(
+            latency['p95'], budget,
+            "p95 latency of %s is %s ms, over its budget of %s ms "
+            "(latency: %s)" % (name, latency['p95'], budget, latency))
+
+    @testtools.attr('performance')
+    @decorators.idempotent_id('bc81db29-303e-4b97-b855-32efa8246bfe')
+    def test_list_db_flavors_latency(self):
+        self._check_latency('list_db_flavors',
+                            self.db_flavors_client.list_db_flavors)
+
+    @testtools.attr('performance')
+    @decorators.idempotent_id('ee6ec80e-1ecc-40da-afca-c8ffa1fe9ce6')
+    def test_show_db_flavor_latency(self):
+        self._check_latency(
+            'show_db_flavor',
+            lambda: self.db_flavors_client.show_db_flavor(self.db_flavor_ref))
+
+    @testtools.attr('performance')
+    @decorators.idempotent_id('c3b64650-5851-4149-b2d5-8c49050a5983')
+    def test_list_db_limits_latency(self):
+        self._check_latency('list_db_limits',
+                            self.db_limits_client.list_db_limits)
+
+    @testtools.attr('performance')
+    @decorators.idempotent_id('9819a4a8-0447-4b6c-9850-78c232ea3a2d')
+    def test_list_db_versions_latency(self):
+        self._check_latency('list_db_versions',
+                            self.db_versions_client.list_db_versions)
@@ -0,0 +1,89 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import threading
+
+from oslo_log import log as logging
+from tempest import config
+from tempest.lib import decorators
+from testtools import testcase as testtools
+
+from trove_tempest_plugin.common import benchmark
+from trove_tempest_plugin.services.database.json import limits_client
+from trove_tempest_plugin.tests.api.database import base
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+
+class DatabaseLimitsScalingTest(base.BaseDatabaseTest):
+    """Read the limits with a growing number of concurrent clients."""
+
+    @classmethod
+    def skip_checks(cls):
+        super(DatabaseLimitsScalingTest, cls).skip_checks()
+        if not CONF.database.run_scaling_tests:
+            skip_msg = ("%s skipped as [database] run_scaling_tests is not "
+                        "set" % cls.__name__)
+            raise cls.skipException(skip_msg)
+
+    @classmethod
+    def resource_setup(cls):
+        super(DatabaseLimitsScalingTest, cls).resource_setup()
+        cls.steps = sorted(CONF.database.scaling_concurrency)
+        # One connection per client thread, so the pool does not cap the
+        # concurrency being measured.
+        cls.client = cls.get_database_client(
+            limits_client.DatabaseLimitsClient,
+            pool_maxsize=max(cls.steps))
+
+    @testtools.attr('slow')
+    @decorators.idempotent_id('abc8f8de-492d-4693-b142-8347fe9b9b9d')
+    def test_list_db_limits_scaling(self):
+        absolute_limits = set()
+        lock = threading.Lock()
+
+        def read_absolute_limits():
+            limits = self.client.list_db_limits()['limits']
+            absolute = [lim for lim in limits if lim['verb'] == 'ABSOLUTE']
+            with lock:
+                absolute_limits.update(
+                    tuple(sorted(lim.items())) for lim in absolute)
+
+        results = []
+        for concurrency in self.steps:
+            result = benchmark.measure(
+                read_absolute_limits, concurrency=concurrency,
+                duration=CONF.database.scaling_step_duration)
+            latency = result['latency_ms']
+            LOG.info("list_db_limits with %d clients: %.1f requests/s, "
+                     "p50 %s ms, p95 %s ms, p99 %s ms, %d errors",
+                     concurrency, result['requests_per_second'],
+                     latency['p50'], latency['p95'], latency['p99'],
+                     result['errors'])
+            results.append(result)
+        LOG.info("list_db_limits scaling results: %s",
+                 json.dumps(results, sort_keys=True))
+
+        for result in results:
+            self.assertEqual(
+                {}, result['errors_by_type'],
+                "Reading the limits failed with %d concurrent clients" %
+                result['concurrency'])
+            self.assertGreater(result['requests'], 0)
+        self.assertEqual(
+            1, len(absolute_limits),
+            "The ABSOLUTE limits changed between concurrent reads: %s" %
+            [dict(lim) for lim in absolute_limits])
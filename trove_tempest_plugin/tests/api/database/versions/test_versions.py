@@ -39,3 +39,13 @@ class DatabaseVersionsTest(base.BaseDatabaseTest):
                 current_versions.append(version['id'])
         self.assertEqual(1, len(current_versions))
         self.assertIn(self.db_current_version, current_versions)
+
+    @decorators.idempotent_id('8a0495d8-fc0a-4365-9e7f-4c644d5ddb5c')
+    def test_resolve_db_current_version(self):
+        # The version cache must agree with a fresh listing, and a warm
+        # cache must resolve the version without listing it again.
+        versions = self.client.list_db_versions()['versions']
+        current = [version['id'] for version in versions
+                   if version['status'] == 'CURRENT']
+        self.assertEqual(current, [self.resolve_db_current_version()])
+        self.assertEqual(current, [self.resolve_db_current_version()])
@@ -0,0 +1,37 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from trove_tempest_plugin.common import auth
+from trove_tempest_plugin.common import fake_server
+
+
+class FakeServerTestCase(testtools.TestCase):
+    """Run each test against a fresh fake Trove API."""
+
+    catalog_size = 20
+    # Route names mapped to fake_server.RouteProfile.
+    profiles = None
+
+    def setUp(self):
+        super(FakeServerTestCase, self).setUp()
+        self.server = fake_server.FakeTroveServer(
+            catalog_size=self.catalog_size, profiles=self.profiles).start()
+        self.addCleanup(self.server.stop)
+        self.auth_provider = auth.StaticAuthProvider(self.server.endpoint)
+
+    def client(self, client_class, **kwargs):
+        return client_class(self.auth_provider, 'database', 'RegionOne',
+                            **kwargs)
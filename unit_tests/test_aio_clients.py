@@ -0,0 +1,113 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from tempest.lib import exceptions as lib_exc
+import testtools
+
+from trove_tempest_plugin.common import fake_server
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import limits_client
+from trove_tempest_plugin.services.database.json import versions_client
+from unit_tests import base
+
+try:
+    import asyncio
+
+    from trove_tempest_plugin.services.database.json import aio_clients
+except (ImportError, SyntaxError):
+    # Python 2, or the asyncio extra is not installed.
+    aio_clients = None
+
+
+@testtools.skipIf(aio_clients is None, 'aiohttp is not installed')
+class TestAsyncClients(base.FakeServerTestCase):
+
+    profiles = {'limits': fake_server.RouteProfile(error_rate=1.0)}
+
+    def setUp(self):
+        super(TestAsyncClients, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def async_client(self, client_class, **kwargs):
+        client = self.client(client_class, **kwargs)
+        self.addCleanup(self.run_async, client.close())
+        return client
+
+    def test_request_async(self):
+        client = self.async_client(aio_clients.AsyncDatabaseFlavorsClient)
+        resp, body = self.run_async(client.request_async('GET', 'flavors/3'))
+        self.assertEqual(200, resp.status)
+        self.assertEqual('200', resp['status'])
+        self.assertIn('/flavors/3', resp['content-location'])
+        self.assertIn(b'"flavor"', body)
+        self.assertEqual(1, self.server.api.requests['show_flavor'])
+
+    def test_same_bodies_as_sync_clients(self):
+        for async_class, sync_class, call in (
+                (aio_clients.AsyncDatabaseFlavorsClient,
+                 flavors_client.DatabaseFlavorsClient, 'list_db_flavors'),
+                (aio_clients.AsyncDatabaseVersionsClient,
+                 versions_client.DatabaseVersionsClient,
+                 'list_db_versions')):
+            client = self.async_client(async_class)
+            body = self.run_async(getattr(client, call)())
+            self.assertEqual(getattr(self.client(sync_class), call)(), body)
+            self.assertEqual(200, body.response.status)
+        client = self.async_client(aio_clients.AsyncDatabaseFlavorsClient)
+        self.assertEqual(
+            self.client(flavors_client.DatabaseFlavorsClient).show_db_flavor(
+                5), self.run_async(client.show_db_flavor(5)))
+
+    def test_errors_raise_tempest_exceptions(self):
+        client = self.async_client(aio_clients.AsyncDatabaseFlavorsClient)
+        self.assertRaises(lib_exc.NotFound, self.run_async,
+                          client.show_db_flavor(999))
+        limits = self.async_client(aio_clients.AsyncDatabaseLimitsClient)
+        # The same status raises the same exception as the sync client.
+        sync_error = self.assertRaises(
+            lib_exc.UnexpectedResponseCode,
+            self.client(limits_client.DatabaseLimitsClient).list_db_limits)
+        async_error = self.assertRaises(
+            lib_exc.UnexpectedResponseCode, self.run_async,
+            limits.list_db_limits())
+        self.assertEqual(sync_error.resp.status, async_error.resp.status)
+
+    def test_owned_session_closed(self):
+        client = self.client(aio_clients.AsyncDatabaseFlavorsClient)
+        self.assertIs(client, self.run_async(client.__aenter__()))
+        self.run_async(client.show_db_flavor(1))
+        session = client._session
+        self.run_async(client.show_db_flavor(2))
+        self.assertIs(session, client._session)
+        self.run_async(client.__aexit__(None, None, None))
+        self.assertTrue(session.closed)
+        self.assertIsNone(client._session)
+        # A closed client opens a new session on its next request.
+        self.run_async(client.show_db_flavor(3))
+        self.assertIsNot(session, client._session)
+        self.run_async(client.close())
+        self.assertEqual(3, self.server.api.requests['show_flavor'])
+
+    def test_given_session_left_open(self):
+        session = mock.Mock()
+        client = self.client(aio_clients.AsyncDatabaseFlavorsClient,
+                             session=session)
+        self.assertIs(session, client._get_session())
+        self.run_async(client.close())
+        self.assertFalse(session.close.called)
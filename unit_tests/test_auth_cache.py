@@ -0,0 +1,152 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+import threading
+
+from oslo_utils import timeutils
+from tempest.lib import auth
+import testtools
+
+from trove_tempest_plugin.common import auth as static_auth
+from trove_tempest_plugin.services.database import auth_cache
+
+AUTH_URL = 'http://keystone:5000/v3'
+DOMAIN = {'id': 'default', 'name': 'Default'}
+
+
+def _expires_at(seconds):
+    expiry = timeutils.utcnow() + datetime.timedelta(seconds=seconds)
+    return expiry.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class FakeProvider(auth.KeystoneV3AuthProvider):
+    """Keystone v3 provider that hands out numbered tokens."""
+
+    lifetime = 3600
+
+    def __init__(self, counter, **credentials):
+        super(FakeProvider, self).__init__(
+            auth.KeystoneV3Credentials(**credentials), AUTH_URL)
+        self.counter = counter
+        self.resolved = 0
+
+    def _get_auth(self):
+        with self.counter['lock']:
+            self.counter['tokens'] += 1
+            token = 'token-%d' % self.counter['tokens']
+        return token, {
+            'expires_at': _expires_at(self.lifetime),
+            'user': {'id': 'u1', 'name': 'demo', 'domain': DOMAIN},
+            'project': {'id': 'p1', 'name': 'demo', 'domain': DOMAIN},
+            'catalog': [{'type': 'database', 'name': 'trove',
+                         'endpoints': [{'region': 'RegionOne',
+                                        'interface': 'public',
+                                        'url': 'http://trove/v1.0/p'}]}],
+        }
+
+    def base_url(self, filters, auth_data=None):
+        self.resolved += 1
+        return super(FakeProvider, self).base_url(filters, auth_data)
+
+
+CREDENTIALS = {'username': 'demo', 'password': 'secret',
+               'project_name': 'demo', 'user_domain_name': 'Default',
+               'project_domain_name': 'Default'}
+FILTERS = {'service': 'database', 'region': 'RegionOne'}
+
+
+class TestAuthCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestAuthCache, self).setUp()
+        self.counter = {'tokens': 0, 'lock': threading.Lock()}
+        self.cache = auth_cache.AuthCache(margin=300)
+
+    def _provider(self, **overrides):
+        provider = FakeProvider(self.counter,
+                                **dict(CREDENTIALS, **overrides))
+        return self.cache.install(provider)
+
+    def test_same_credentials_share_a_token(self):
+        first = self._provider()
+        second = self._provider()
+        self.assertEqual('token-1', first.get_token())
+        self.assertEqual('token-1', second.get_token())
+        self.assertEqual(1, self.counter['tokens'])
+        self.assertEqual({'tokens': 1, 'endpoints': 0, 'hits': 1,
+                          'misses': 1}, self.cache.stats())
+
+    def test_other_credentials_get_their_own_token(self):
+        self.assertEqual('token-1', self._provider().get_token())
+        self.assertEqual('token-2',
+                         self._provider(username='alt').get_token())
+
+    def test_token_replaced_within_margin(self):
+        FakeProvider.lifetime = 60
+        self.addCleanup(setattr, FakeProvider, 'lifetime', 3600)
+        self._provider().get_token()
+        self.assertEqual('token-2', self._provider().get_token())
+
+    def test_endpoints_resolved_once_per_token(self):
+        first = self._provider()
+        second = self._provider()
+        self.assertEqual('http://trove/v1.0/p', first.base_url(FILTERS))
+        self.assertEqual('http://trove/v1.0/p', second.base_url(FILTERS))
+        self.assertEqual(1, first.resolved + second.resolved)
+        self.assertEqual(1, self.cache.stats()['endpoints'])
+
+    def test_invalidate(self):
+        provider = self._provider()
+        provider.base_url(FILTERS)
+        self.cache.invalidate(auth_cache.credentials_key(provider))
+        self.assertEqual({'tokens': 0, 'endpoints': 0, 'hits': 0,
+                          'misses': 1}, self.cache.stats())
+        self.assertEqual('token-2', self._provider().get_token())
+
+    def test_concurrent_callers_authenticate_once(self):
+        providers = [self._provider() for _ in range(8)]
+        tokens = []
+        threads = [threading.Thread(
+            target=lambda p=p: tokens.append(p.get_token()))
+            for p in providers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(['token-1'] * 8, tokens)
+        self.assertEqual(1, self.counter['tokens'])
+
+    def test_install_once(self):
+        provider = self._provider()
+        get_auth = provider._get_auth
+        self.assertIs(provider, self.cache.install(provider))
+        self.assertIs(get_auth, provider._get_auth)
+
+    def test_provider_without_credentials_left_alone(self):
+        provider = static_auth.StaticAuthProvider('http://trove/v1.0/p')
+        self.cache.install(provider)
+        self.assertFalse(hasattr(provider, '_auth_cache'))
+
+
+class TestCredentialsKey(testtools.TestCase):
+
+    def test_password_hashed(self):
+        provider = FakeProvider({}, **CREDENTIALS)
+        key = auth_cache.credentials_key(provider)
+        self.assertNotIn('secret', repr(key))
+        self.assertEqual(key, auth_cache.credentials_key(
+            FakeProvider({}, **CREDENTIALS)))
+        self.assertNotEqual(key, auth_cache.credentials_key(
+            FakeProvider({}, **dict(CREDENTIALS, password='other'))))
@@ -0,0 +1,99 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+
+import fixtures
+import six
+import testtools
+
+from trove_tempest_plugin.cmd import benchmark as benchmark_cmd
+from trove_tempest_plugin.common import benchmark
+from trove_tempest_plugin.common import stats
+
+
+class TestStats(testtools.TestCase):
+
+    def test_percentile_interpolates(self):
+        self.assertEqual(1.5, stats.percentile([1, 2], 50))
+        self.assertEqual(2, stats.percentile([1, 2, 3], 50))
+        self.assertIsNone(stats.percentile([], 50))
+
+    def test_summarize_in_milliseconds(self):
+        summary = stats.summarize([0.003, 0.001, 0.002])
+        self.assertEqual(3, summary['count'])
+        self.assertEqual(1.0, summary['min'])
+        self.assertEqual(3.0, summary['max'])
+        self.assertEqual(2.0, summary['p50'])
+        self.assertEqual({'count': 0}, stats.summarize([]))
+
+
+class TestBenchmark(testtools.TestCase):
+
+    def test_measure_counts_errors_by_type(self):
+        calls = []
+
+        def operation():
+            calls.append(None)
+            if len(calls) % 2:
+                raise ValueError()
+
+        result = benchmark.measure(operation, concurrency=2, duration=0.05)
+        self.assertEqual(len(calls), result['requests'])
+        self.assertEqual(result['errors'],
+                         result['errors_by_type']['ValueError'])
+        self.assertEqual(2, result['concurrency'])
+
+    def test_sample_leaves_warmup_out(self):
+        calls = []
+        summary = benchmark.sample(lambda: calls.append(None), 5, warmup=2)
+        self.assertEqual(7, len(calls))
+        self.assertEqual(5, summary['count'])
+
+
+class TestBenchmarkCommand(testtools.TestCase):
+
+    def setUp(self):
+        super(TestBenchmarkCommand, self).setUp()
+        self.output = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'report.json')
+
+    def _run(self, *argv):
+        status = benchmark_cmd.main(['--output', self.output] + list(argv))
+        with open(self.output) as f:
+            return status, json.load(f)
+
+    def test_api_against_fake_server(self):
+        status, report = self._run(
+            'api', '--fake', '--duration', '0.1',
+            '--operations', 'list_db_flavors,list_db_limits')
+        self.assertEqual(0, status)
+        self.assertEqual({'list_db_flavors', 'list_db_limits'}, set(report))
+        for result in report.values():
+            self.assertGreater(result['requests'], 0)
+            self.assertEqual(0, result['errors'])
+
+    def test_soak_against_fake_server(self):
+        self.useFixture(fixtures.MonkeyPatch('sys.stderr', six.StringIO()))
+        # A zero window closes one window per iteration, so the trend tests
+        # run on 5 windows after the warmup one.
+        status, report = self._run('soak', '--fake', '--iterations', '6',
+                                   '--window', '0')
+        self.assertEqual(6, len(report['windows']))
+        for name, result in report['trends'].items():
+            self.assertEqual(5, result['windows'], name)
+            self.assertIn('p_value', result)
+        # Real latencies may happen to trend; the status must say so.
+        self.assertEqual(1 if report['drift_detected'] else 0, status)
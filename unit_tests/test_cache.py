@@ -0,0 +1,125 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+import testtools
+
+from trove_tempest_plugin.services.database import cache
+from trove_tempest_plugin.services.database import decoders
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import versions_client
+from trove_tempest_plugin.services.database import records
+from unit_tests import base
+
+
+class ClockTestCase(testtools.TestCase):
+
+    def setUp(self):
+        super(ClockTestCase, self).setUp()
+        self.now = 1000.0
+        # Only the cache's clock is moved, not the one of the fake server.
+        patcher = mock.patch.object(cache, 'time')
+        patcher.start().time.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+
+
+class TestResponseCache(ClockTestCase):
+
+    def test_fresh_hit_and_expiry(self):
+        response_cache = cache.ResponseCache(ttl=60)
+        self.assertEqual((None, False), response_cache.lookup('key'))
+        response_cache.store('key', {'etag': '"1"'}, {'a': 1})
+        entry, fresh = response_cache.lookup('key')
+        self.assertTrue(fresh)
+        self.assertEqual({'a': 1}, entry.body)
+        self.now += 60
+        self.assertEqual((entry, False), response_cache.lookup('key'))
+        response_cache.revalidated(entry)
+        self.assertEqual((entry, True), response_cache.lookup('key'))
+        self.assertEqual({'hits': 2, 'revalidations': 1, 'misses': 1,
+                          'size': 1}, response_cache.stats())
+
+    def test_least_recently_used_evicted(self):
+        response_cache = cache.ResponseCache(maxsize=2)
+        response_cache.store('a', {}, 'A')
+        response_cache.store('b', {}, 'B')
+        response_cache.lookup('a')
+        response_cache.store('c', {}, 'C')
+        self.assertEqual((None, False), response_cache.lookup('b'))
+        self.assertEqual('A', response_cache.lookup('a')[0].body)
+        self.assertEqual('C', response_cache.lookup('c')[0].body)
+        self.assertEqual(2, response_cache.stats()['size'])
+
+    def test_validators(self):
+        entry = cache.Entry({'etag': '"1"', 'last-modified': 'Mon'}, {})
+        self.assertEqual({'If-None-Match': '"1"', 'If-Modified-Since': 'Mon'},
+                         entry.validators())
+        self.assertEqual({}, cache.Entry({}, {}).validators())
+
+
+class TestCachedClients(base.FakeServerTestCase, ClockTestCase):
+
+    def setUp(self):
+        super(TestCachedClients, self).setUp()
+        self.cache = cache.ResponseCache(ttl=60)
+
+    def flavors(self, **kwargs):
+        return self.client(flavors_client.DatabaseFlavorsClient,
+                           response_cache=self.cache, **kwargs)
+
+    def test_fresh_response_served_without_request(self):
+        client = self.flavors()
+        first = client.list_db_flavors()
+        second = client.list_db_flavors()
+        self.assertEqual(first, second)
+        self.assertEqual(1, self.server.api.requests['list_flavors'])
+        self.assertEqual({'hits': 1, 'revalidations': 0, 'misses': 1,
+                          'size': 1}, self.cache.stats())
+
+    def test_stale_response_reused_on_not_modified(self):
+        client = self.flavors()
+        first = client.list_db_flavors()['flavors']
+        self.now += 60
+        second = client.list_db_flavors()['flavors']
+        self.assertIs(first, second)
+        self.assertEqual(2, self.server.api.requests['list_flavors'])
+        self.assertEqual(1, self.server.api.not_modified)
+        self.assertEqual(1, self.cache.stats()['revalidations'])
+        # Revalidation makes the entry fresh again.
+        client.list_db_flavors()
+        self.assertEqual(2, self.server.api.requests['list_flavors'])
+
+    def test_urls_cached_apart(self):
+        client = self.flavors()
+        client.list_db_flavors()
+        client.list_db_flavors({'limit': 5})
+        self.client(versions_client.DatabaseVersionsClient,
+                    response_cache=self.cache).list_db_versions()
+        self.assertEqual({'hits': 0, 'revalidations': 0, 'misses': 3,
+                          'size': 3}, self.cache.stats())
+
+    def test_decoding_settings_cached_apart(self):
+        plain = self.flavors().list_db_flavors()['flavors']
+        typed = self.flavors(typed_records=True).list_db_flavors()['flavors']
+        self.assertNotIsInstance(plain[0], records.Flavor)
+        self.assertIsInstance(typed[0], records.Flavor)
+        self.assertEqual(2, self.server.api.requests['list_flavors'])
+
+    def test_decoders_cached_apart(self):
+        names = decoders.available()
+        if len(names) < 2:
+            self.skipTest('only one JSON decoder is installed')
+        for name in names:
+            self.flavors(json_decoder=name).list_db_flavors()
+        self.assertEqual(len(names), self.cache.stats()['misses'])
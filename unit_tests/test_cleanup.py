@@ -0,0 +1,210 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import argparse
+import threading
+
+import fixtures
+import mock
+from tempest.lib import exceptions as lib_exc
+import testtools
+
+from trove_tempest_plugin.common import cleanup
+from trove_tempest_plugin.common import waiters
+from trove_tempest_plugin import exceptions
+from trove_tempest_plugin.tests.api.database import base
+
+
+class FakeInstancesClient(object):
+    """Instances client whose instances reach ``final_status`` at once."""
+
+    build_interval = 0.01
+    build_timeout = 1
+
+    def __init__(self, final_status='ACTIVE', fail_create=()):
+        self.final_status = final_status
+        self.fail_create = fail_create
+        self.instances = {}
+        self.deleted = []
+        self._lock = threading.Lock()
+
+    def create_db_instance(self, name, flavor_ref, volume_size=None,
+                           **kwargs):
+        if name in self.fail_create:
+            raise lib_exc.BadRequest()
+        with self._lock:
+            instance_id = 'id-%s' % name
+            self.instances[instance_id] = self.final_status
+        return {'instance': {'id': instance_id, 'status': 'BUILD'}}
+
+    def iter_db_instances(self):
+        with self._lock:
+            return [{'id': i, 'status': s}
+                    for i, s in self.instances.items()]
+
+    def delete_db_instance(self, instance_id):
+        with self._lock:
+            if self.instances.pop(instance_id, None) is None:
+                raise lib_exc.NotFound()
+            self.deleted.append(instance_id)
+
+
+class TestCleanupRegistry(testtools.TestCase):
+
+    def setUp(self):
+        super(TestCleanupRegistry, self).setUp()
+        self.deleted = []
+        self.waited = []
+        self.registry = cleanup.CleanupRegistry()
+        for kind in ('instance', 'backup'):
+            self.registry.register_kind(
+                kind, lambda i, kind=kind: self.deleted.append((kind, i)),
+                lambda ids, kind=kind: self.waited.append(
+                    (kind, sorted(ids))))
+
+    def test_levels_follow_dependencies(self):
+        self.registry.track('instance', 'i1')
+        self.registry.track('instance', 'i2')
+        self.registry.track('backup', 'b1', before=[('instance', 'i1')])
+        # i2 does not wait for anything, i1 waits for b1.
+        self.assertEqual([[('instance', 'i2'), ('backup', 'b1')],
+                          [('instance', 'i1')]],
+                         self.registry.levels())
+
+    def test_cycle_detected(self):
+        self.registry.track('instance', 'i1', before=[('backup', 'b1')])
+        self.registry.track('backup', 'b1', before=[('instance', 'i1')])
+        self.assertRaises(ValueError, self.registry.levels)
+
+    def test_unknown_kind(self):
+        self.assertRaises(ValueError, self.registry.track, 'volume', 'v1')
+
+    def test_cleanup_level_by_level(self):
+        self.registry.track('instance', 'i1')
+        self.registry.track('backup', 'b1', before=[('instance', 'i1')])
+        self.registry.track('backup', 'b2', before=[('instance', 'i1')])
+        self.registry.cleanup()
+        self.assertEqual(('instance', 'i1'), self.deleted[-1])
+        self.assertEqual([('backup', ['b1', 'b2']), ('instance', ['i1'])],
+                         self.waited)
+        self.assertEqual(0, len(self.registry))
+
+    def test_untracked_resource_kept(self):
+        self.registry.track('instance', 'i1')
+        self.registry.untrack('instance', 'i1')
+        self.registry.cleanup()
+        self.assertEqual([], self.deleted)
+
+    def test_deletes_sent_in_parallel(self):
+        count = 4
+        barrier = threading.Barrier(count, timeout=5)
+        registry = cleanup.CleanupRegistry(max_workers=count)
+        # Every delete waits for all the others to have started.
+        registry.register_kind('instance', lambda i: barrier.wait())
+        for i in range(count):
+            registry.track('instance', i)
+        registry.cleanup()
+        self.assertFalse(barrier.broken)
+
+    def test_failures_reported_after_all_attempts(self):
+        def delete(resource_id):
+            if resource_id == 'bad':
+                raise lib_exc.Conflict()
+            if resource_id == 'gone':
+                raise lib_exc.NotFound()
+            self.deleted.append(resource_id)
+
+        self.useFixture(fixtures.FakeLogger(name=cleanup.__name__))
+        registry = cleanup.CleanupRegistry()
+        registry.register_kind('instance', delete)
+        for resource_id in ('bad', 'gone', 'good'):
+            registry.track('instance', resource_id)
+        e = self.assertRaises(exceptions.DatabaseCleanupException,
+                              registry.cleanup)
+        self.assertIn('instance bad', str(e))
+        self.assertNotIn('gone', str(e))
+        self.assertEqual(['good'], self.deleted)
+
+
+class TestCreateDbInstances(testtools.TestCase):
+
+    def test_on_created_called_per_instance(self):
+        client = FakeInstancesClient()
+        seen = []
+        instances = waiters.create_db_instances(
+            client, 3, 'db', 'flavor', on_created=seen.append)
+        self.assertEqual(sorted(i['id'] for i in instances),
+                         sorted(i['id'] for i in seen))
+        self.assertEqual(['ACTIVE'] * 3, [i['status'] for i in instances])
+
+    def test_failed_create_rolls_back(self):
+        client = FakeInstancesClient(fail_create=['db-1'])
+        self.assertRaises(lib_exc.BadRequest, waiters.create_db_instances,
+                          client, 3, 'db', 'flavor')
+        self.assertEqual({}, client.instances)
+
+    def test_failed_create_left_to_on_created(self):
+        client = FakeInstancesClient(fail_create=['db-1'])
+        seen = []
+        self.assertRaises(lib_exc.BadRequest, waiters.create_db_instances,
+                          client, 3, 'db', 'flavor', on_created=seen.append)
+        self.assertEqual(2, len(client.instances))
+        self.assertEqual(2, len(seen))
+
+
+class TestBaseDatabaseTestCleanup(testtools.TestCase):
+
+    def setUp(self):
+        super(TestBaseDatabaseTestCleanup, self).setUp()
+        conf = argparse.Namespace(
+            database=argparse.Namespace(max_build_interval=0.01))
+        patcher = mock.patch.object(base, 'CONF', conf)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _test_class(self, client):
+        return type('FakeDatabaseTest', (base.BaseDatabaseTest,), {
+            'database_instances_client': client,
+            'db_flavor_ref': '1',
+            'volume_size': 1,
+        })
+
+    def test_instances_deleted_when_wait_fails(self):
+        client = FakeInstancesClient(final_status='ERROR')
+        cls = self._test_class(client)
+        self.assertRaises(exceptions.DatabaseInstanceErrorException,
+                          cls.create_db_instances, 3)
+        self.assertEqual(3, len(cls.cleanup_registry()))
+        cls.cleanup_registry().cleanup()
+        self.assertEqual({}, client.instances)
+        self.assertEqual(3, len(client.deleted))
+
+    def test_instances_tracked_when_a_create_fails(self):
+        client = FakeInstancesClient()
+        cls = self._test_class(client)
+        with mock.patch.object(base.data_utils, 'rand_name',
+                               return_value='db'):
+            client.fail_create = ['db-2']
+            self.assertRaises(lib_exc.BadRequest, cls.create_db_instances, 3)
+        cls.cleanup_registry().cleanup()
+        self.assertEqual({}, client.instances)
+        self.assertEqual(2, len(client.deleted))
+
+    def test_active_instances_returned(self):
+        client = FakeInstancesClient()
+        cls = self._test_class(client)
+        instances = cls.create_db_instances(2)
+        self.assertEqual(['ACTIVE', 'ACTIVE'],
+                         [i['status'] for i in instances])
+        self.assertEqual(2, len(cls.cleanup_registry()))
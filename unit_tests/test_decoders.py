@@ -0,0 +1,119 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import fixtures
+import mock
+import testtools
+
+from trove_tempest_plugin.services.database import decoders
+
+BODY = json.dumps({
+    'flavors': [{'id': 1, 'ram': 512, 'links': [{'rel': 'self'}]},
+                {'id': 2, 'ram': 1.5, 'extra': None}],
+    'links': [{'rel': 'next', 'href': 'http://trove/flavors?marker=2'}],
+})
+
+
+class TestGetDecoder(testtools.TestCase):
+
+    def setUp(self):
+        super(TestGetDecoder, self).setUp()
+        self.useFixture(fixtures.MockPatchObject(decoders, '_logged', set()))
+        self.log = self.useFixture(fixtures.FakeLogger(
+            name=decoders.__name__))
+
+    def test_fastest_by_default(self):
+        name, loads = decoders.get_decoder()
+        self.assertEqual(decoders.available()[0], name)
+        self.assertEqual({'a': 1}, loads('{"a": 1}'))
+
+    def test_auto_falls_back_to_jsonutils(self):
+        def missing():
+            raise ImportError()
+
+        loaders = dict((name, missing) for name in decoders.PREFERRED)
+        loaders['jsonutils'] = decoders._load_jsonutils
+        self.useFixture(fixtures.MockPatchObject(decoders, '_LOADERS',
+                                                 loaders))
+        self.assertEqual('jsonutils', decoders.get_decoder()[0])
+        self.assertIn('Decoding database responses with jsonutils '
+                      '(requested: auto)', self.log.output)
+
+    def test_auto_picks_first_available(self):
+        name, loads = decoders.get_decoder(decoders.AUTO)
+        self.assertEqual(decoders.available()[0], name)
+        self.assertEqual({'a': 1}, loads('{"a": 1}'))
+
+    def test_unknown_decoder(self):
+        self.assertRaises(ValueError, decoders.get_decoder, 'yaml')
+
+    def test_selection_logged_once(self):
+        decoders.get_decoder('jsonutils')
+        decoders.get_decoder('jsonutils')
+        self.assertEqual(1, self.log.output.count(
+            'Decoding database responses with jsonutils'))
+
+
+class IterItemsMixin(object):
+
+    def test_items_and_rest(self):
+        rest = {}
+        items = list(decoders.iter_items(BODY, 'flavors', rest=rest))
+        self.assertEqual(json.loads(BODY)['flavors'], items)
+        self.assertEqual({'links': json.loads(BODY)['links']}, rest)
+
+    def test_bytes_body(self):
+        items = list(decoders.iter_items(BODY.encode('utf-8'), 'flavors'))
+        self.assertEqual([1, 2], [item['id'] for item in items])
+
+    def test_missing_key(self):
+        rest = {}
+        self.assertEqual([], list(decoders.iter_items('{"a": [1]}',
+                                                      'flavors', rest=rest)))
+        self.assertEqual({'a': [1]}, rest)
+
+    def test_list_of_scalars(self):
+        self.assertEqual([1, 'a', None], list(decoders.iter_items(
+            '{"ids": [1, "a", null]}', 'ids')))
+
+
+class TestIterItemsIjson(IterItemsMixin, testtools.TestCase):
+
+    def setUp(self):
+        super(TestIterItemsIjson, self).setUp()
+        if decoders.ijson is None:
+            self.skipTest("ijson is not installed")
+
+    def test_body_not_decoded_at_once(self):
+        loads = mock.Mock(side_effect=json.loads)
+        items = list(decoders.iter_items(BODY, 'flavors', loads=loads))
+        self.assertFalse(loads.called)
+        self.assertEqual(2, len(items))
+
+
+class TestIterItemsFallback(IterItemsMixin, testtools.TestCase):
+
+    def setUp(self):
+        super(TestIterItemsFallback, self).setUp()
+        patcher = mock.patch.object(decoders, 'ijson', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_custom_loads(self):
+        loads = mock.Mock(side_effect=json.loads)
+        items = list(decoders.iter_items(BODY, 'flavors', loads=loads))
+        loads.assert_called_once_with(BODY)
+        self.assertEqual(2, len(items))
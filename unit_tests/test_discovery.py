@@ -0,0 +1,153 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import argparse
+import json
+import os
+
+import fixtures
+import mock
+import testtools
+
+from trove_tempest_plugin.services.database import discovery
+from trove_tempest_plugin.services.database.json import versions_client
+from trove_tempest_plugin.tests.api.database import base as test_base
+from unit_tests import base
+
+ENDPOINT = 'http://trove:8779/v1.0/tenant'
+VERSIONS = [{'id': 'v1.0', 'status': 'CURRENT', 'links': []}]
+
+
+class TestVersionCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestVersionCache, self).setUp()
+        self.now = 1000.0
+        patcher = mock.patch.object(discovery.time, 'time',
+                                    side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'versions.json')
+
+    def test_store_and_lookup(self):
+        cache = discovery.VersionCache(ttl=60)
+        self.assertIsNone(cache.lookup(ENDPOINT))
+        cache.store(ENDPOINT, VERSIONS)
+        self.assertEqual(VERSIONS, cache.lookup(ENDPOINT))
+        self.assertIsNone(cache.lookup(ENDPOINT + '/other'))
+        self.assertEqual({'endpoints': 1, 'hits': 1, 'misses': 2},
+                         cache.stats())
+
+    def test_expires_after_ttl(self):
+        cache = discovery.VersionCache(ttl=60)
+        cache.store(ENDPOINT, VERSIONS)
+        self.now += 59
+        self.assertEqual(VERSIONS, cache.lookup(ENDPOINT))
+        self.now += 1
+        self.assertIsNone(cache.lookup(ENDPOINT))
+
+    def test_shared_through_file(self):
+        discovery.VersionCache(ttl=60, path=self.path).store(
+            ENDPOINT, VERSIONS)
+        other = discovery.VersionCache(ttl=60, path=self.path)
+        self.assertEqual(VERSIONS, other.lookup(ENDPOINT))
+        self.now += 60
+        self.assertIsNone(other.lookup(ENDPOINT))
+
+    def test_expired_entries_dropped_from_file(self):
+        cache = discovery.VersionCache(ttl=60, path=self.path)
+        cache.store(ENDPOINT, VERSIONS)
+        self.now += 60
+        cache.store(ENDPOINT + '/other', VERSIONS)
+        with open(self.path) as f:
+            self.assertEqual([ENDPOINT + '/other'], list(json.load(f)))
+
+    def _write(self, data):
+        with open(self.path, 'w') as f:
+            f.write(data)
+
+    def test_corrupt_entries_are_misses(self):
+        for entry in ({'versions': VERSIONS},
+                      {'stored_at': 'soon', 'versions': VERSIONS},
+                      {'stored_at': self.now},
+                      {'stored_at': self.now, 'versions': 'v1.0'},
+                      [self.now, VERSIONS],
+                      None):
+            self._write(json.dumps({ENDPOINT: entry}))
+            cache = discovery.VersionCache(ttl=60, path=self.path)
+            self.assertIsNone(cache.lookup(ENDPOINT))
+            cache.store(ENDPOINT, VERSIONS)
+            self.assertEqual(
+                VERSIONS,
+                discovery.VersionCache(ttl=60, path=self.path).lookup(
+                    ENDPOINT))
+
+    def test_corrupt_file_is_a_miss(self):
+        for data in ('{"truncated', '[1, 2]', ''):
+            self._write(data)
+            cache = discovery.VersionCache(ttl=60, path=self.path)
+            self.assertIsNone(cache.lookup(ENDPOINT))
+            cache.store(ENDPOINT, VERSIONS)
+            self.assertEqual(VERSIONS, cache.lookup(ENDPOINT))
+
+    def test_current_version(self):
+        self.assertEqual('v1.0', discovery.current_version(VERSIONS))
+        self.assertIsNone(discovery.current_version(
+            [{'id': 'v1.0', 'status': 'DEPRECATED'}]))
+
+
+class TestDiscover(base.FakeServerTestCase):
+
+    def test_discover_lists_once(self):
+        client = self.client(versions_client.DatabaseVersionsClient)
+        cache = discovery.VersionCache()
+        first = cache.discover(client)
+        self.assertEqual(client.list_db_versions()['versions'],
+                         cache.discover(client))
+        self.assertEqual(first, cache.discover(client))
+        self.assertEqual(2, self.server.api.requests['versions'])
+
+    def test_typed_records_stored_as_dicts(self):
+        client = self.client(versions_client.DatabaseVersionsClient,
+                             typed_records=True)
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'versions.json')
+        discovery.VersionCache(path=path).discover(client)
+        self.assertEqual('v1.0', discovery.current_version(
+            discovery.VersionCache(path=path).lookup(client.base_url)))
+
+    def _test_class(self, ttl):
+        conf = argparse.Namespace(database=argparse.Namespace(
+            db_current_version='v0.9', version_cache_ttl=ttl,
+            version_cache_file=None))
+        for target, attribute, value in ((test_base, 'CONF', conf),
+                                         (discovery, '_shared', None)):
+            patcher = mock.patch.object(target, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return type('FakeDatabaseTest', (test_base.BaseDatabaseTest,), {
+            'database_versions_client': self.client(
+                versions_client.DatabaseVersionsClient)})
+
+    def test_resolve_db_current_version(self):
+        cls = self._test_class(ttl=60)
+        self.assertEqual('v1.0', cls.resolve_db_current_version())
+        self.assertEqual('v1.0', cls.resolve_db_current_version())
+        self.assertEqual(1, self.server.api.requests['versions'])
+
+    def test_resolve_db_current_version_without_cache(self):
+        cls = self._test_class(ttl=0)
+        self.assertEqual('v0.9', cls.resolve_db_current_version())
+        self.assertEqual(0, self.server.api.requests['versions'])
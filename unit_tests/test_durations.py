@@ -0,0 +1,204 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import argparse
+import json
+import os
+
+import fixtures
+import mock
+import tempest.test
+import testtools
+
+from trove_tempest_plugin.cmd import schedule
+from trove_tempest_plugin.common import durations
+from trove_tempest_plugin.tests.api.database import base
+
+ID_A = '00000000-0000-0000-0000-00000000000a'
+ID_B = '00000000-0000-0000-0000-00000000000b'
+ID_C = '00000000-0000-0000-0000-00000000000c'
+ID_D = '00000000-0000-0000-0000-00000000000d'
+
+
+def _test_id(cls, name, idempotent_id):
+    return 'pkg.%s.%s[id-%s,smoke]' % (cls, name, idempotent_id)
+
+
+TESTS = [
+    _test_id('Slow', 'test_a', ID_A),
+    _test_id('Slow', 'test_b', ID_B),
+    _test_id('Fast', 'test_c', ID_C),
+    _test_id('Other', 'test_d', ID_D),
+]
+
+
+class TestSplitTestId(testtools.TestCase):
+
+    def test_with_idempotent_id(self):
+        self.assertEqual(('pkg.Slow.test_a', ID_A),
+                         durations.split_test_id(TESTS[0]))
+        self.assertEqual('pkg.Slow', durations.class_id(TESTS[0]))
+
+    def test_without_attributes(self):
+        self.assertEqual(('pkg.Cls.test_x', None),
+                         durations.split_test_id('pkg.Cls.test_x'))
+
+
+class TestDurationStore(testtools.TestCase):
+
+    def setUp(self):
+        super(TestDurationStore, self).setUp()
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'durations.json')
+
+    def test_moving_average_over_runs(self):
+        store = durations.DurationStore(self.path)
+        store.record(ID_A, TESTS[0], 10.0)
+        store.flush()
+        store.record(ID_A, TESTS[0], 20.0)
+        store.flush()
+        entry = store.load()[ID_A]
+        self.assertEqual(2, entry['runs'])
+        self.assertEqual(13.0, entry['duration'])
+        self.assertEqual(TESTS[0], entry['test'])
+
+    def test_workers_merge_into_one_file(self):
+        first = durations.DurationStore(self.path)
+        second = durations.DurationStore(self.path)
+        first.record(ID_A, TESTS[0], 1.0)
+        second.record(ID_B, TESTS[1], 2.0)
+        first.flush()
+        second.flush()
+        self.assertEqual({ID_A: 1.0, ID_B: 2.0}, first.durations())
+
+    def test_setup_durations_kept_apart(self):
+        store = durations.DurationStore(self.path)
+        store.record(ID_A, TESTS[0], 1.0)
+        store.record_setup('pkg.Slow', 30.0)
+        store.flush()
+        self.assertEqual({ID_A: 1.0}, store.durations())
+        self.assertEqual({'pkg.Slow': 30.0}, store.setup_durations())
+
+    def test_missing_or_corrupt_file(self):
+        store = durations.DurationStore(self.path)
+        self.assertEqual({}, store.durations())
+        with open(self.path, 'w') as f:
+            f.write('{')
+        self.assertEqual({}, store.durations())
+
+
+class TestClassSetupDuration(testtools.TestCase):
+
+    def setUp(self):
+        super(TestClassSetupDuration, self).setUp()
+        self.now = 100.0
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'durations.json')
+        conf = argparse.Namespace(database=argparse.Namespace(
+            test_durations_file=self.path))
+        for target, attribute, value in (
+                (base, 'CONF', conf), (durations, '_shared', None),
+                (tempest.test.BaseTestCase, 'setup_credentials',
+                 mock.Mock())):
+            patcher = mock.patch.object(target, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(base, 'time')
+        patcher.start().time.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+        self.cls = type('FakeDatabaseTest', (base.BaseDatabaseTest,), {})
+
+    def test_timed_from_credentials_to_first_test(self):
+        self.cls.setup_credentials()
+        self.now += 12.5
+        self.cls._record_class_setup()
+        # Later tests of the class record nothing.
+        self.now += 30
+        self.cls._record_class_setup()
+        store = durations.shared_store(self.path)
+        store.flush()
+        class_id = '%s.FakeDatabaseTest' % __name__
+        self.assertEqual({class_id: 12.5}, store.setup_durations())
+
+    def test_not_recorded_without_setup(self):
+        self.cls._record_class_setup()
+        self.assertEqual({}, durations.shared_store(self.path)._pending)
+
+
+class TestPartition(testtools.TestCase):
+
+    def _workers(self, groups):
+        return [set(durations.class_id(t) for t in tests)
+                for _, tests in groups]
+
+    def test_classes_are_not_split(self):
+        groups = durations.partition(
+            TESTS, 2, {ID_A: 10.0, ID_B: 10.0, ID_C: 1.0, ID_D: 1.0})
+        self.assertEqual([{'pkg.Slow'}, {'pkg.Fast', 'pkg.Other'}],
+                         self._workers(groups))
+        self.assertEqual([20.0, 2.0], [load for load, _ in groups])
+
+    def test_setup_time_counts(self):
+        groups = durations.partition(
+            TESTS, 2, {ID_A: 10.0, ID_B: 10.0, ID_C: 1.0, ID_D: 1.0},
+            {'pkg.Fast': 25.0})
+        self.assertEqual([{'pkg.Fast'}, {'pkg.Slow', 'pkg.Other'}],
+                         self._workers(groups))
+        self.assertEqual([26.0, 21.0], [load for load, _ in groups])
+
+    def test_unknown_tests_take_the_median(self):
+        groups = durations.partition(TESTS[2:], 1, {ID_A: 4.0, ID_B: 6.0,
+                                                    ID_C: 2.0})
+        self.assertEqual(6.0, groups[0][0])
+
+    def test_more_workers_than_classes(self):
+        groups = durations.partition(TESTS[:2], 3, {})
+        self.assertEqual(2, len(groups[0][1]))
+        self.assertEqual([[], []], [tests for _, tests in groups[1:]])
+
+    def test_worker_file_has_one_regex_per_class(self):
+        groups = [(2.0, TESTS[:2]), (0.0, []), (1.0, TESTS[2:])]
+        self.assertEqual(
+            '- worker:\n'
+            '  - "^pkg\\\\.Slow\\\\."\n'
+            '- worker:\n'
+            '  - "^pkg\\\\.Fast\\\\."\n'
+            '  - "^pkg\\\\.Other\\\\."\n',
+            durations.worker_file(groups))
+
+
+class TestScheduleCommand(testtools.TestCase):
+
+    def test_writes_worker_file(self):
+        tmp = self.useFixture(fixtures.TempDir()).path
+        store = durations.DurationStore(os.path.join(tmp, 'durations.json'))
+        store.record(ID_A, TESTS[0], 10.0)
+        store.record_setup('pkg.Fast', 5.0)
+        store.flush()
+        tests = os.path.join(tmp, 'tests.txt')
+        with open(tests, 'w') as f:
+            f.write('\n'.join(TESTS) + '\n')
+        worker_file = os.path.join(tmp, 'workers.yaml')
+        stdout = self.useFixture(fixtures.StringStream('stdout'))
+        self.useFixture(fixtures.MonkeyPatch('sys.stdout', stdout.stream))
+        self.assertEqual(0, schedule.main([
+            '--durations', store.path, '--workers', '2',
+            '--worker-file', worker_file, tests]))
+        with open(worker_file) as f:
+            self.assertEqual(2, f.read().count('- worker:'))
+        stdout.stream.seek(0)
+        report = json.loads(stdout.stream.read())
+        self.assertEqual([(20.0, 2), (25.0, 2)],
+                         [(w['expected_seconds'], w['tests'])
+                          for w in report['workers']])
@@ -0,0 +1,136 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import testtools
+
+from trove_tempest_plugin.common import flavors
+
+
+def _os_flavor(flavor_id, **fields):
+    flavor = {'id': flavor_id, 'name': 'f%s' % flavor_id, 'ram': 512,
+              'vcpus': 1, 'disk': 10, 'swap': ''}
+    flavor.update(fields)
+    return flavor
+
+
+def _db_flavor(flavor_id, **fields):
+    flavor = {'id': flavor_id, 'str_id': str(flavor_id),
+              'name': 'f%s' % flavor_id, 'ram': 512, 'vcpus': 1, 'disk': 10}
+    flavor.update(fields)
+    return flavor
+
+
+class TestIndexDbFlavors(testtools.TestCase):
+
+    def test_indexed_by_string_id(self):
+        index = flavors.index_db_flavors([_db_flavor(1), _db_flavor(2)])
+        self.assertEqual(['1', '2'], sorted(index))
+        self.assertEqual(1, index['1']['id'])
+
+    def test_str_id_used_without_id(self):
+        flavor = _db_flavor(None, str_id='m1.small')
+        index = flavors.index_db_flavors([flavor])
+        self.assertIs(flavor, index['m1.small'])
+
+    def test_duplicates_collected(self):
+        first = _db_flavor(1)
+        duplicates = []
+        index = flavors.index_db_flavors(
+            [first, _db_flavor(1, ram=1024), _db_flavor(2), _db_flavor(1)],
+            duplicates)
+        self.assertIs(first, index['1'])
+        self.assertEqual(['1'], duplicates)
+
+    def test_find_stops_at_match(self):
+        seen = []
+
+        def listed():
+            for i in range(1, 10):
+                seen.append(i)
+                yield _db_flavor(i)
+
+        self.assertEqual(3, flavors.find_db_flavor(listed(), 3)['id'])
+        self.assertEqual([1, 2, 3], seen)
+        self.assertIsNone(flavors.find_db_flavor([], 3))
+
+
+class TestDiffFlavors(testtools.TestCase):
+
+    def test_matching_lists(self):
+        diff = flavors.diff_flavors(
+            [_db_flavor(1), _db_flavor(2)],
+            [_os_flavor(2), _os_flavor(1)])
+        self.assertFalse(diff)
+        self.assertEqual('no differences', str(diff))
+
+    def test_values_compared_as_strings(self):
+        diff = flavors.diff_flavors([_db_flavor(1, ram='512')],
+                                    [_os_flavor(1)])
+        self.assertFalse(diff)
+
+    def test_missing_and_extra(self):
+        diff = flavors.diff_flavors([_db_flavor(1), _db_flavor(3)],
+                                    [_os_flavor(1), _os_flavor(2)])
+        self.assertTrue(diff)
+        self.assertEqual(['2'], diff.missing)
+        self.assertEqual(['3'], diff.extra)
+        self.assertEqual([], diff.mismatched)
+        self.assertEqual('missing from DB: 2; not in OS: 3', str(diff))
+
+    def test_mismatched_fields(self):
+        diff = flavors.diff_flavors(
+            [_db_flavor(1, ram=1024, swap=0)],
+            [_os_flavor(1)])
+        self.assertEqual(
+            [flavors.Mismatch('1', 'ram', 1024, 512),
+             flavors.Mismatch('1', 'swap', 0, '')],
+            diff.mismatched)
+        self.assertIn("flavor 1 differs on 'ram': DB 1024, OS 512",
+                      str(diff))
+
+    def test_field_absent_from_db(self):
+        db_flavor = _db_flavor(1)
+        del db_flavor['disk']
+        diff = flavors.diff_flavors([db_flavor], [_os_flavor(1)])
+        self.assertEqual(
+            [flavors.Mismatch('1', 'disk', flavors.ABSENT, 10)],
+            diff.mismatched)
+        self.assertEqual("flavor 1 differs on 'disk': DB absent, OS 10",
+                         str(diff))
+
+    def test_absent_does_not_match_placeholder_value(self):
+        diff = flavors.diff_flavors([_db_flavor(1, name='<absent>')],
+                                    [_os_flavor(1, name='<absent>')])
+        self.assertFalse(diff)
+
+    def test_duplicates_reported(self):
+        diff = flavors.diff_flavors(
+            [_db_flavor(1), _db_flavor(1), _db_flavor(2)],
+            [_os_flavor(1), _os_flavor(2), _os_flavor(2)])
+        self.assertTrue(diff)
+        self.assertEqual(['1'], diff.db_duplicates)
+        self.assertEqual(['2'], diff.os_duplicates)
+        self.assertEqual([], diff.missing)
+        self.assertEqual([], diff.extra)
+        self.assertEqual('listed more than once in DB: 1; '
+                         'listed more than once in OS: 2', str(diff))
+
+    def test_compare_values(self):
+        self.assertEqual(
+            [], flavors.compare_values('1', ['name'], _db_flavor(1),
+                                       _os_flavor(1)))
+        self.assertEqual(
+            [flavors.Mismatch('1', 'swap', flavors.ABSENT, flavors.ABSENT)],
+            flavors.compare_values('1', ['swap'], _db_flavor(1), {},
+                                   in_db=False))
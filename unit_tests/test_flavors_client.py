@@ -0,0 +1,100 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from tempest.lib import exceptions as lib_exc
+
+from trove_tempest_plugin.services.database.json import flavors_client
+from unit_tests import base
+
+
+class TestShowDbFlavors(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(TestShowDbFlavors, self).setUp()
+        self.flavors = self.client(flavors_client.DatabaseFlavorsClient)
+
+    def test_bodies_in_request_order(self):
+        bodies, not_found = self.flavors.show_db_flavors([5, 1, 3],
+                                                         max_workers=2)
+        self.assertEqual({}, not_found)
+        self.assertEqual([5, 1, 3], [b['flavor']['id'] for b in bodies])
+        self.assertEqual(3, self.server.api.requests['show_flavor'])
+
+    def test_missing_flavors_do_not_abort(self):
+        bodies, not_found = self.flavors.show_db_flavors([2, 999, 4])
+        self.assertEqual(2, bodies[0]['flavor']['id'])
+        self.assertIsNone(bodies[1])
+        self.assertEqual(4, bodies[2]['flavor']['id'])
+        self.assertEqual([999], list(not_found))
+        self.assertIsInstance(not_found[999], lib_exc.NotFound)
+
+    def test_no_ids(self):
+        self.assertEqual(([], {}), self.flavors.show_db_flavors([]))
+        self.assertEqual(0, self.server.api.requests['show_flavor'])
+
+
+class TestIterDbFlavors(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(TestIterDbFlavors, self).setUp()
+        self.flavors = self.client(flavors_client.DatabaseFlavorsClient)
+        self.urls = []
+        get = self.flavors.get
+
+        def recording_get(url, *args, **kwargs):
+            self.urls.append(url)
+            return get(url, *args, **kwargs)
+
+        patcher = mock.patch.object(self.flavors, 'get',
+                                    side_effect=recording_get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _ids(self, **kwargs):
+        return [f['id'] for f in self.flavors.iter_db_flavors(**kwargs)]
+
+    def test_follows_every_next_link(self):
+        for incremental in (False, True):
+            del self.urls[:]
+            self.assertEqual(list(range(1, 21)),
+                             self._ids(page_size=7, incremental=incremental))
+            self.assertEqual(['flavors?limit=7',
+                              'flavors?limit=7&marker=7',
+                              'flavors?limit=7&marker=14'], self.urls)
+        self.assertEqual(6, self.server.api.requests['list_flavors'])
+
+    def test_last_full_page_ends_iteration(self):
+        self.assertEqual(list(range(1, 21)), self._ids(page_size=10))
+        self.assertEqual(2, self.server.api.requests['list_flavors'])
+
+    def test_unpaginated_server(self):
+        # A server that ignores limit returns everything in one page.
+        self.assertEqual(list(range(1, 21)), self._ids(page_size=100))
+        self.assertEqual(1, self.server.api.requests['list_flavors'])
+
+    def test_repeated_marker_stops(self):
+        # A server that ignores the marker keeps sending the first page
+        # with the same next link.
+        list_flavors = self.server.api._list_flavors
+
+        def ignore_marker(match, params):
+            return list_flavors(match, {'limit': params['limit']})
+
+        with mock.patch.object(self.server.api, '_list_flavors',
+                               side_effect=ignore_marker):
+            ids = self._ids(page_size=5)
+        self.assertEqual(list(range(1, 6)) * 2, ids)
+        self.assertEqual(['flavors?limit=5', 'flavors?limit=5&marker=5'],
+                         self.urls)
@@ -0,0 +1,86 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from tempest.lib.common import http as tempest_http
+
+from trove_tempest_plugin.services.database import http
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import limits_client
+from unit_tests import base
+
+
+class TestSharedPools(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(TestSharedPools, self).setUp()
+        # Count the TCP connections the fake server accepts.
+        self.accepted = []
+        httpd = self.server._httpd
+        process_request = httpd.process_request
+
+        def counting_process_request(request, client_address):
+            self.accepted.append(client_address)
+            return process_request(request, client_address)
+
+        httpd.process_request = counting_process_request
+
+    def _stats(self):
+        endpoint = 'http://%s:%s' % (self.server.host, self.server.port)
+        return [entry for entry in http.connection_stats()
+                if entry['endpoint'] == endpoint]
+
+    def test_one_manager_per_settings(self):
+        self.assertIs(http.get_http(), http.get_http())
+        self.assertIs(http.get_http(),
+                      http.get_http(maxsize=http.DEFAULT_POOL_MAXSIZE))
+        self.assertIsNot(http.get_http(), http.get_http(timeout=5))
+        self.assertIsNot(http.get_http(), http.get_http(
+            disable_ssl_certificate_validation=True))
+        self.assertIsNot(http.get_http(), http.get_http(maxsize=2))
+
+    def test_clients_share_a_manager(self):
+        flavors = self.client(flavors_client.DatabaseFlavorsClient)
+        limits = self.client(limits_client.DatabaseLimitsClient)
+        self.assertIsInstance(flavors.http_obj, http.KeepAliveHttp)
+        self.assertIs(flavors.http_obj, limits.http_obj)
+        other = self.client(flavors_client.DatabaseFlavorsClient,
+                            pool_maxsize=2)
+        self.assertIsNot(flavors.http_obj, other.http_obj)
+
+    def test_sequential_requests_reuse_one_connection(self):
+        flavors = self.client(flavors_client.DatabaseFlavorsClient)
+        limits = self.client(limits_client.DatabaseLimitsClient)
+        for flavor_id in range(1, 6):
+            flavors.show_db_flavor(flavor_id)
+            limits.list_db_limits()
+        self.assertEqual(1, len(self.accepted))
+        self.assertEqual([{'endpoint': self._stats()[0]['endpoint'],
+                           'connections': 1, 'requests': 10, 'reused': 9}],
+                         self._stats())
+
+    def test_concurrent_requests_bounded_by_workers(self):
+        flavors = self.client(flavors_client.DatabaseFlavorsClient)
+        flavors.show_db_flavors(range(1, 21), max_workers=4)
+        flavors.show_db_flavors(range(1, 21), max_workers=4)
+        [stats] = self._stats()
+        self.assertEqual(40, stats['requests'])
+        self.assertLessEqual(stats['connections'], 4)
+        self.assertEqual(len(self.accepted), stats['connections'])
+        self.assertEqual(40 - stats['connections'], stats['reused'])
+
+    def test_proxy_falls_back_to_tempest_http(self):
+        flavors = self.client(flavors_client.DatabaseFlavorsClient,
+                              proxy_url='http://proxy.example.com:3128')
+        self.assertIsInstance(flavors.http_obj, tempest_http.ClosingProxyHttp)
+        self.assertNotIsInstance(flavors.http_obj, http.KeepAliveHttp)
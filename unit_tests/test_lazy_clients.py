@@ -0,0 +1,83 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+import argparse
+
+import mock
+import testtools
+
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import limits_client
+from trove_tempest_plugin.tests.api.database import base
+
+
+class TestLazyClient(testtools.TestCase):
+
+    def setUp(self):
+        super(TestLazyClient, self).setUp()
+        conf = argparse.Namespace(database=argparse.Namespace(
+            request_metrics_file=None, test_durations_file=None,
+            trace_file=None, memory_profile_file=None))
+        patcher = mock.patch.object(base, 'CONF', conf)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _test_class(self, name='FakeDatabaseTest', bases=None):
+        get_client = mock.Mock(side_effect=lambda client_class: object())
+        cls = type(name, bases or (base.BaseDatabaseTest,), {
+            'get_database_client': get_client})
+        return cls, get_client
+
+    def test_built_on_first_access_only(self):
+        cls, get_client = self._test_class()
+        client = cls.database_flavors_client
+        self.assertIs(client, cls.database_flavors_client)
+        get_client.assert_called_once_with(
+            flavors_client.DatabaseFlavorsClient)
+
+    def test_unused_clients_never_built(self):
+        cls, get_client = self._test_class()
+        cls.database_limits_client
+        get_client.assert_called_once_with(
+            limits_client.DatabaseLimitsClient)
+        self.assertEqual(['database_limits_client'],
+                         list(cls._lazy_clients))
+
+    def test_cached_per_class(self):
+        first, _ = self._test_class('FirstTest')
+        second, _ = self._test_class('SecondTest')
+        self.assertIsNot(first.database_flavors_client,
+                         second.database_flavors_client)
+        self.assertNotIn('_lazy_clients', base.BaseDatabaseTest.__dict__)
+
+    def test_subclass_does_not_share_parent_cache(self):
+        parent, get_client = self._test_class()
+        child = type('ChildTest', (parent,), {})
+        self.assertIsNot(parent.database_flavors_client,
+                         child.database_flavors_client)
+        self.assertEqual(2, get_client.call_count)
+        self.assertIsNot(parent._lazy_clients, child._lazy_clients)
+
+    def test_cleared_at_resource_cleanup(self):
+        cls, get_client = self._test_class()
+        client = cls.database_flavors_client
+        cls.resource_cleanup()
+        self.assertNotIn('_lazy_clients', cls.__dict__)
+        self.assertIsNot(client, cls.database_flavors_client)
+        self.assertEqual(2, get_client.call_count)
+
+    def test_cleanup_without_clients(self):
+        cls, get_client = self._test_class()
+        cls.resource_cleanup()
+        self.assertNotIn('_lazy_clients', cls.__dict__)
+        get_client.assert_not_called()
@@ -0,0 +1,170 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+
+import fixtures
+import mock
+import testtools
+
+from trove_tempest_plugin.cmd import benchmark as benchmark_cmd
+from trove_tempest_plugin.services.database import context
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database import memory
+from unit_tests import base
+
+
+class MemoryFixture(fixtures.Fixture):
+    """Trace allocations, and stop tracing afterwards."""
+
+    def _setUp(self):
+        if not memory.enable(frames=1):
+            raise testtools.TestCase.skipException(
+                'tracemalloc is not available')
+        self.addCleanup(memory.disable)
+        self.addCleanup(context.clear)
+
+
+class TestCallAccounting(testtools.TestCase):
+
+    def setUp(self):
+        super(TestCallAccounting, self).setUp()
+        self.useFixture(MemoryFixture())
+        self.mark = memory.class_start()
+
+    def _call(self, endpoint, *traced):
+        # traced: (current, peak) at the start, after the response is read
+        # and after it is decoded.
+        with mock.patch.object(memory, '_traced', side_effect=traced):
+            sample = memory.start_call(endpoint)
+            memory.response_received(sample)
+            memory.body_decoded(sample)
+
+    def test_bytes_per_endpoint(self):
+        context.set_test('unit.Test.test_a', 'id-a')
+        self._call('GET flavors', (1000, 1000), (1500, 1800), (3000, 3200))
+        self._call('GET flavors', (3000, 3000), (3100, 3100), (3300, 3400))
+        self._call('GET limits', (3000, 3000), (3010, 3010), (3020, 3020))
+        report = memory.class_report('unit.Test', self.mark)
+        [calls] = report['calls']
+        self.assertEqual('id-a', calls['id'])
+        self.assertEqual('unit.Test.test_a', calls['test'])
+        self.assertEqual({
+            'count': 2,
+            # The peak is relative to the start of each call.
+            'peak_bytes': {'max': 2200, 'mean': 1300},
+            'response_bytes': {'max': 500, 'mean': 300},
+            'decoded_bytes': {'max': 2000, 'mean': 1150},
+        }, calls['endpoints']['GET flavors'])
+        self.assertEqual(1, calls['endpoints']['GET limits']['count'])
+
+    def test_without_peak_reset(self):
+        # Before Python 3.9 the peak of a call cannot be isolated.
+        self._call('GET flavors', (1000, None), (1500, None), (3000, None))
+        endpoint = memory.class_report('unit.Test', self.mark)['calls'][0][
+            'endpoints']['GET flavors']
+        self.assertEqual({}, endpoint['peak_bytes'])
+        self.assertEqual({'max': 2000, 'mean': 2000},
+                         endpoint['decoded_bytes'])
+
+    def test_report_resets_the_calls(self):
+        self._call('GET flavors', (1000, 1000), (1500, 1800), (3000, 3200))
+        memory.class_report('unit.Test', self.mark)
+        self.assertEqual([], memory.class_report('unit.Test',
+                                                 self.mark)['calls'])
+
+
+class TestClassReport(testtools.TestCase):
+
+    def setUp(self):
+        super(TestClassReport, self).setUp()
+        self.useFixture(MemoryFixture())
+
+    def test_retained_allocations_reported(self):
+        mark = memory.class_start()
+        retained = [bytearray(1024) for _ in range(1024)]
+        report = memory.class_report('unit.Test', mark, limit=3)
+        self.assertEqual('unit.Test', report['test'])
+        self.assertGreaterEqual(report['retained_bytes'], 1 << 20)
+        if report['peak_bytes'] is not None:
+            self.assertGreaterEqual(report['peak_bytes'],
+                                    report['retained_bytes'])
+        top = report['top_allocations'][0]
+        self.assertGreaterEqual(top['size_diff'], 1 << 20)
+        self.assertIn(__file__.rstrip('c'), top['traceback'][0])
+        self.assertLessEqual(len(report['top_allocations']), 3)
+        del retained
+
+    def test_flush_appends_a_line(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'memory.ndjson')
+        for test_id in ('unit.TestA', 'unit.TestB'):
+            memory.flush(path, test_id, memory.class_start())
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(['unit.TestA', 'unit.TestB'],
+                         [line['test'] for line in lines])
+
+
+class TestClientCalls(base.FakeServerTestCase):
+
+    catalog_size = 200
+
+    def test_flavors_calls_profiled(self):
+        self.useFixture(MemoryFixture())
+        client = self.client(flavors_client.DatabaseFlavorsClient)
+        mark = memory.class_start()
+        flavors = client.list_db_flavors()['flavors']
+        client.show_db_flavor(1)
+        report = memory.class_report('unit.Test', mark)
+        endpoints = report['calls'][0]['endpoints']
+        self.assertEqual({'GET flavors', 'GET flavors/{id}'}, set(endpoints))
+        listed = endpoints['GET flavors']
+        self.assertEqual(1, listed['count'])
+        # 200 decoded flavors take more than their JSON.
+        self.assertGreater(listed['decoded_bytes']['max'],
+                           listed['response_bytes']['max'])
+        self.assertGreater(report['retained_bytes'], 0)
+        self.assertEqual(200, len(flavors))
+
+
+class TestMemoryCommand(testtools.TestCase):
+
+    def test_report(self):
+        if memory.tracemalloc is None:
+            self.skipTest('tracemalloc is not available')
+        self.addCleanup(context.clear)
+        output = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                              'report.json')
+        status = benchmark_cmd.main(['--output', output, 'memory',
+                                     '--catalog-size', '250', '--top', '2'])
+        self.assertEqual(0, status)
+        self.assertFalse(memory.enabled)
+        with open(output) as f:
+            report = json.load(f)
+        self.assertEqual(250, report['catalog_size'])
+        operations = report['operations']
+        self.assertEqual(set(benchmark_cmd.MEMORY_OPERATIONS),
+                         set(operations))
+        for name, result in operations.items():
+            self.assertEqual(name, result['test'])
+            self.assertLessEqual(len(result['top_allocations']), 2)
+            self.assertIn('GET flavors', result['calls'][0]['endpoints'])
+        # Pages of 100 flavors: three requests to iterate over 250.
+        for name in ('iter_db_flavors', 'iter_db_flavors_incremental'):
+            self.assertEqual(3, operations[name]['calls'][0]['endpoints'][
+                'GET flavors']['count'])
+        self.assertEqual(1, operations['list_db_flavors']['calls'][0][
+            'endpoints']['GET flavors']['count'])
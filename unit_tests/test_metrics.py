@@ -0,0 +1,166 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+
+import fixtures
+import testtools
+
+from trove_tempest_plugin.services.database import context
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database import metrics
+from unit_tests import base
+
+
+class MetricsFixture(fixtures.Fixture):
+    """Enable the metrics and forget them afterwards."""
+
+    def _setUp(self):
+        metrics.reset()
+        metrics.enable()
+        self.addCleanup(metrics.reset)
+        self.addCleanup(metrics.disable)
+        self.addCleanup(context.clear)
+
+
+class TestUrlTemplate(testtools.TestCase):
+
+    def test_ids_replaced(self):
+        for url, template in (
+                ('flavors', 'flavors'),
+                ('flavors/7', 'flavors/{id}'),
+                ('/flavors/7/', 'flavors/{id}'),
+                ('flavors?limit=5&marker=7', 'flavors'),
+                ('flavors/7?detail=1', 'flavors/{id}'),
+                ('instances/abc/databases/db1',
+                 'instances/{id}/databases/{id}'),
+                ('', '/'),
+                ('?limit=1', '/')):
+            self.assertEqual(template, metrics.url_template(url), url)
+
+
+class TestHistograms(testtools.TestCase):
+
+    def setUp(self):
+        super(TestHistograms, self).setUp()
+        self.useFixture(MetricsFixture())
+
+    def _endpoint(self, endpoint='GET flavors'):
+        entries = metrics.histograms()
+        self.assertEqual(1, len(entries))
+        return entries[0]['endpoints'][endpoint]
+
+    def test_latency_buckets(self):
+        for wall in (0.001, 0.005, 0.0051, 0.3, 6.0):
+            metrics.record('GET flavors', wall, 10, 200)
+        buckets = dict(self._endpoint()['latency_buckets_ms'])
+        # Bucket bounds are inclusive.
+        self.assertEqual({5: 2, 10: 1, 25: 0, 50: 0, 100: 0, 250: 0,
+                          500: 1, 1000: 0, 2500: 0, 5000: 0, 'inf': 1},
+                         buckets)
+
+    def test_statuses_sizes_and_throttling(self):
+        metrics.record('GET flavors', 0.01, 100, 200)
+        metrics.record('GET flavors', 0.01, 300, 200, throttled=0.5)
+        metrics.record('GET flavors', 0.01, 50, 503)
+        histogram = self._endpoint()
+        self.assertEqual(3, histogram['count'])
+        self.assertEqual({'200': 2, '503': 1}, histogram['status'])
+        self.assertEqual({'total': 450, 'max': 300}, histogram['bytes'])
+        self.assertEqual(1, histogram['throttle_wait_ms']['count'])
+        self.assertEqual(500.0, histogram['throttle_wait_ms']['max'])
+        self.assertEqual({'count': 0}, histogram['decode_ms'])
+
+    def test_decode_time_of_sampled_requests(self):
+        metrics.record('GET flavors', 0.01, 100, 200).decode = 0.002
+        metrics.record('GET flavors', 0.01, 100, 200)
+        decode = self._endpoint()['decode_ms']
+        self.assertEqual(1, decode['count'])
+        self.assertEqual(2.0, decode['max'])
+
+    def test_grouped_by_test(self):
+        context.set_test('unit.Test.test_a', 'id-a')
+        metrics.record('GET flavors', 0.01, 100, 200)
+        context.set_test('unit.Test.test_b', 'id-b')
+        metrics.record('GET flavors', 0.01, 100, 200)
+        metrics.record('GET limits', 0.01, 100, 200)
+        entries = dict((entry['id'], entry)
+                       for entry in metrics.histograms())
+        self.assertEqual({'id-a', 'id-b'}, set(entries))
+        self.assertEqual('unit.Test.test_b', entries['id-b']['test'])
+        self.assertEqual({'GET flavors', 'GET limits'},
+                         set(entries['id-b']['endpoints']))
+
+
+class TestFlush(testtools.TestCase):
+
+    def setUp(self):
+        super(TestFlush, self).setUp()
+        self.useFixture(MetricsFixture())
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'metrics.ndjson')
+
+    def _read(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_one_line_per_test_keyed_by_idempotent_id(self):
+        for test_id, idempotent_id in (('unit.Test.test_a', 'id-a'),
+                                       ('unit.Test.test_b', 'id-b')):
+            context.set_test(test_id, idempotent_id)
+            metrics.record('GET flavors', 0.01, 100, 200)
+        metrics.flush(self.path)
+        lines = self._read()
+        self.assertEqual(['id-a', 'id-b'],
+                         sorted(line['id'] for line in lines))
+        self.assertEqual([1, 1], [line['endpoints']['GET flavors']['count']
+                                  for line in lines])
+        self.assertEqual([], metrics.histograms())
+
+    def test_appends(self):
+        context.set_test('unit.Test.test_a', 'id-a')
+        metrics.record('GET flavors', 0.01, 100, 200)
+        metrics.flush(self.path)
+        metrics.record('GET flavors', 0.01, 100, 200)
+        metrics.flush(self.path)
+        metrics.flush(self.path)
+        self.assertEqual(['id-a', 'id-a'],
+                         [line['id'] for line in self._read()])
+
+
+class TestClientMetrics(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(TestClientMetrics, self).setUp()
+        self.useFixture(MetricsFixture())
+        self.flavors = self.client(flavors_client.DatabaseFlavorsClient)
+
+    def test_requests_recorded_per_endpoint(self):
+        context.set_test('unit.Test.test_a', 'id-a')
+        self.flavors.list_db_flavors()
+        self.flavors.show_db_flavor(3)
+        self.flavors.show_db_flavor(4)
+        [entry] = metrics.histograms()
+        self.assertEqual('id-a', entry['id'])
+        endpoints = entry['endpoints']
+        self.assertEqual({'GET flavors', 'GET flavors/{id}'},
+                         set(endpoints))
+        self.assertEqual(2, endpoints['GET flavors/{id}']['count'])
+        self.assertEqual({'200': 2}, endpoints['GET flavors/{id}']['status'])
+        # Every decoded response has its decode time sampled.
+        self.assertEqual(1, endpoints['GET flavors']['decode_ms']['count'])
+        self.assertEqual(2,
+                         endpoints['GET flavors/{id}']['decode_ms']['count'])
+        self.assertGreater(endpoints['GET flavors']['bytes']['total'], 0)
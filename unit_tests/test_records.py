@@ -0,0 +1,146 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import testtools
+
+from trove_tempest_plugin.services.database.json import flavors_client
+from trove_tempest_plugin.services.database.json import limits_client
+from trove_tempest_plugin.services.database.json import versions_client
+from trove_tempest_plugin.services.database import records
+from unit_tests import base
+
+FLAVOR = {
+    'id': 1, 'str_id': '1', 'name': 'small', 'ram': 512, 'vcpus': 1,
+    'disk': 10, 'links': [{'href': 'http://trove/flavors/1', 'rel': 'self'},
+                          {'href': 'http://trove/f/1', 'rel': 'bookmark'}],
+    'swap': '',
+}
+
+
+def _decoded(data):
+    # Strings decoded from JSON are new objects, as in a response body.
+    return json.loads(json.dumps(data))
+
+
+class TestRecord(testtools.TestCase):
+
+    def test_mapping_access(self):
+        flavor = records.Flavor.from_dict(_decoded(FLAVOR))
+        self.assertEqual('small', flavor['name'])
+        self.assertEqual(512, flavor.get('ram'))
+        self.assertIn('swap', flavor)
+        self.assertNotIn('ephemeral', flavor)
+        self.assertIsNone(flavor.get('ephemeral'))
+        self.assertRaises(KeyError, lambda: flavor['ephemeral'])
+        self.assertEqual(sorted(FLAVOR), sorted(flavor))
+        self.assertEqual(len(FLAVOR), len(flavor))
+        self.assertEqual(FLAVOR['name'], dict(flavor.items())['name'])
+
+    def test_equal_to_dict(self):
+        flavor = records.Flavor.from_dict(_decoded(FLAVOR))
+        self.assertEqual(FLAVOR, flavor.to_dict())
+        self.assertTrue(flavor == FLAVOR)
+        self.assertFalse(flavor != FLAVOR)
+        self.assertEqual(flavor, records.Flavor.from_dict(_decoded(FLAVOR)))
+        self.assertNotEqual(flavor, dict(FLAVOR, ram=1024))
+        self.assertFalse(flavor == 'small')
+
+    def test_links_are_records(self):
+        flavor = records.Flavor.from_dict(_decoded(FLAVOR))
+        self.assertIsInstance(flavor['links'], tuple)
+        self.assertIsInstance(flavor['links'][0], records.Link)
+        self.assertEqual('bookmark', flavor['links'][1]['rel'])
+
+    def test_unhashable_and_slotted(self):
+        flavor = records.Flavor.from_dict(_decoded(FLAVOR))
+        self.assertRaises(TypeError, hash, flavor)
+        self.assertFalse(hasattr(flavor, '__dict__'))
+
+    def test_from_record_is_identity(self):
+        flavor = records.Flavor.from_dict(_decoded(FLAVOR))
+        self.assertIs(flavor, records.Flavor.from_dict(flavor))
+
+    def test_only_repeated_values_interned(self):
+        first = records.Flavor.from_dict(_decoded(FLAVOR))
+        second = records.Flavor.from_dict(_decoded(FLAVOR))
+        self.assertIs(first['links'][0]['rel'], second['links'][0]['rel'])
+        self.assertIsNot(first['links'][0]['href'],
+                         second['links'][0]['href'])
+
+    def test_version_fields_interned(self):
+        version = {'id': 'v1.0', 'status': 'CURRENT',
+                   'updated': '2012-08-01T00:00:00Z', 'links': []}
+        first = records.Version.from_dict(_decoded(version))
+        second = records.Version.from_dict(_decoded(version))
+        for key in ('id', 'status', 'updated'):
+            self.assertIs(first[key], second[key])
+
+    def test_intern_text(self):
+        value = records._intern(u''.join([u'sel', u'f']))
+        self.assertIs(value, records._intern(u''.join([u'se', u'lf'])))
+        self.assertEqual(u'self', value)
+        self.assertIsInstance(value, str)
+        # Not ASCII: a native str on Python 3, kept as unicode on Python 2.
+        self.assertEqual(u'r\xe9gion', records._intern(u'r\xe9gion'))
+        self.assertIsNone(records._intern(None))
+
+    def test_convert(self):
+        body = {'flavors': [_decoded(FLAVOR)], 'flavor': _decoded(FLAVOR),
+                'links': []}
+        records.convert(body, {'flavors': records.Flavor,
+                               'flavor': records.Flavor})
+        self.assertIsInstance(body['flavors'][0], records.Flavor)
+        self.assertIsInstance(body['flavor'], records.Flavor)
+        self.assertEqual([], body['links'])
+        self.assertEqual('text', records.convert('text', {}))
+
+
+class TestTypedRecordsClients(base.FakeServerTestCase):
+
+    def _clients(self, client_class):
+        return (self.client(client_class),
+                self.client(client_class, typed_records=True))
+
+    def test_flavors(self):
+        plain, typed = self._clients(flavors_client.DatabaseFlavorsClient)
+        flavors = typed.list_db_flavors()['flavors']
+        self.assertIsInstance(flavors[0], records.Flavor)
+        self.assertEqual(plain.list_db_flavors()['flavors'], flavors)
+        flavor = typed.show_db_flavor(1)['flavor']
+        self.assertIsInstance(flavor, records.Flavor)
+        self.assertEqual(plain.show_db_flavor(1)['flavor'], flavor)
+
+    def test_iter_flavors(self):
+        plain, typed = self._clients(flavors_client.DatabaseFlavorsClient)
+        for incremental in (False, True):
+            flavors = list(typed.iter_db_flavors(page_size=7,
+                                                 incremental=incremental))
+            self.assertTrue(all(isinstance(f, records.Flavor)
+                                for f in flavors))
+            self.assertEqual(list(plain.iter_db_flavors(page_size=7)),
+                             flavors)
+
+    def test_limits(self):
+        plain, typed = self._clients(limits_client.DatabaseLimitsClient)
+        limits = typed.list_db_limits()['limits']
+        self.assertIsInstance(limits[0], records.Limit)
+        self.assertEqual(plain.list_db_limits()['limits'], limits)
+
+    def test_versions(self):
+        plain, typed = self._clients(versions_client.DatabaseVersionsClient)
+        versions = typed.list_db_versions()['versions']
+        self.assertIsInstance(versions[0], records.Version)
+        self.assertEqual(plain.list_db_versions()['versions'], versions)
@@ -0,0 +1,109 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import email.utils
+import time
+
+from tempest.lib import exceptions as lib_exc
+import testtools
+
+from trove_tempest_plugin.common import fake_server
+from trove_tempest_plugin.services.database.json import versions_client
+from trove_tempest_plugin.services.database import retry
+from unit_tests import base
+
+
+class TestParseRetryAfter(testtools.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(5.0, retry.parse_retry_after('5'))
+        self.assertEqual(0.5, retry.parse_retry_after('0.5'))
+        self.assertEqual(0.0, retry.parse_retry_after('-3'))
+
+    def test_http_date(self):
+        value = email.utils.formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(60, retry.parse_retry_after(value), delta=2)
+
+    def test_past_http_date(self):
+        value = email.utils.formatdate(time.time() - 60, usegmt=True)
+        self.assertEqual(0.0, retry.parse_retry_after(value))
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(retry.parse_retry_after(None))
+        self.assertIsNone(retry.parse_retry_after('soon'))
+
+
+class TestRetryPolicy(testtools.TestCase):
+
+    def test_should_retry(self):
+        policy = retry.RetryPolicy(attempts=2)
+        self.assertTrue(policy.should_retry('get', 503, 0))
+        self.assertTrue(policy.should_retry('HEAD', 429, 1))
+        self.assertFalse(policy.should_retry('GET', 503, 2))
+        self.assertFalse(policy.should_retry('POST', 503, 0))
+        self.assertFalse(policy.should_retry('GET', 500, 0))
+
+    def test_413_left_to_tempest(self):
+        policy = retry.RetryPolicy(status_codes=[413, 503])
+        self.assertFalse(policy.should_retry('GET', 413, 0))
+        self.assertEqual(frozenset([503]), policy.status_codes)
+
+    def test_jitter_bounds(self):
+        policy = retry.RetryPolicy(backoff=0.5, max_backoff=3.0)
+        for attempt, ceiling in ((0, 0.5), (1, 1.0), (2, 2.0), (5, 3.0)):
+            delays = [policy.delay(attempt, {}) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= ceiling for d in delays))
+            # Full jitter spreads the delays over the whole range.
+            self.assertGreater(max(delays) - min(delays), ceiling / 2)
+
+    def test_retry_after_honoured_and_capped(self):
+        policy = retry.RetryPolicy(backoff=100, max_backoff=10.0)
+        self.assertEqual(2.0, policy.delay(0, {'retry-after': '2'}))
+        self.assertEqual(10.0, policy.delay(0, {'retry-after': '60'}))
+
+    def test_retry_after_ignored(self):
+        policy = retry.RetryPolicy(backoff=0.1, honour_retry_after=False)
+        self.assertLessEqual(policy.delay(0, {'retry-after': '60'}), 0.1)
+
+    def test_invalid_retry_after_falls_back_to_backoff(self):
+        policy = retry.RetryPolicy(backoff=0.1)
+        self.assertLessEqual(policy.delay(0, {'retry-after': 'soon'}), 0.1)
+
+    def test_stats(self):
+        policy = retry.RetryPolicy()
+        policy.record('GET /flavors')
+        policy.record('GET /flavors')
+        policy.record('GET /limits')
+        self.assertEqual({'GET /flavors': 2, 'GET /limits': 1},
+                         policy.stats())
+
+
+class TestClientRetries(base.FakeServerTestCase):
+
+    profiles = {'versions': fake_server.RouteProfile(error_rate=1.0)}
+
+    def test_gives_up_after_attempts(self):
+        policy = retry.RetryPolicy(attempts=2, backoff=0)
+        client = self.client(versions_client.DatabaseVersionsClient,
+                             retry_policy=policy)
+        self.assertRaises(lib_exc.UnexpectedResponseCode,
+                          client.list_db_versions)
+        self.assertEqual(3, self.server.api.requests['versions'])
+        self.assertEqual([2], list(policy.stats().values()))
+
+    def test_no_policy_no_retry(self):
+        client = self.client(versions_client.DatabaseVersionsClient)
+        self.assertRaises(lib_exc.UnexpectedResponseCode,
+                          client.list_db_versions)
+        self.assertEqual(1, self.server.api.requests['versions'])
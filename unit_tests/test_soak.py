@@ -0,0 +1,156 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+import testtools
+
+from trove_tempest_plugin.common import soak
+
+
+class TestMannKendall(testtools.TestCase):
+
+    def test_increasing(self):
+        s, z, p = soak.mann_kendall([1, 2, 3, 4, 5])
+        # Every one of the 10 pairs increases; Var(S) = 5 * 4 * 15 / 18.
+        self.assertEqual(10, s)
+        self.assertAlmostEqual(9 / (50 / 3.0) ** 0.5, z)
+        self.assertAlmostEqual(0.01374, p, places=5)
+
+    def test_decreasing(self):
+        s, z, p = soak.mann_kendall([5, 4, 3, 2, 1])
+        self.assertEqual(-10, s)
+        self.assertAlmostEqual(-9 / (50 / 3.0) ** 0.5, z)
+        self.assertAlmostEqual(1 - 0.01374, p, places=5)
+
+    def test_flat(self):
+        self.assertEqual((0, 0.0, 1.0), soak.mann_kendall([3, 3, 3, 3, 3]))
+
+    def test_no_trend(self):
+        s, z, p = soak.mann_kendall([1, 3, 3, 1])
+        self.assertEqual(0, s)
+        self.assertEqual(0.0, z)
+        self.assertEqual(0.5, p)
+
+    def test_ties_reduce_the_variance(self):
+        s, z, p = soak.mann_kendall([1, 2, 2, 3])
+        # 5 of the 6 pairs increase, one is tied; the tie of two values
+        # takes 2 * 1 * 9 from 4 * 3 * 13.
+        self.assertEqual(5, s)
+        self.assertAlmostEqual(4 / ((156 - 18) / 18.0) ** 0.5, z)
+
+
+class TestTheilSen(testtools.TestCase):
+
+    def test_linear(self):
+        self.assertEqual(2.0, soak.theil_sen([0, 2, 4, 6]))
+        self.assertEqual(-0.5, soak.theil_sen([3, 2.5, 2, 1.5]))
+
+    def test_flat(self):
+        self.assertEqual(0.0, soak.theil_sen([7, 7, 7]))
+
+    def test_robust_to_an_outlier(self):
+        self.assertEqual(1.0, soak.theil_sen([1, 2, 3, 100, 5]))
+
+    def test_too_short(self):
+        self.assertIsNone(soak.theil_sen([5]))
+        self.assertIsNone(soak.theil_sen([]))
+
+
+class TestTrend(testtools.TestCase):
+
+    def test_upward_drift(self):
+        result = soak.trend([100, 110, 120, 130, 140, 150])
+        self.assertTrue(result['drift'])
+        self.assertEqual(15, result['s'])
+        self.assertEqual(10.0, result['slope_per_window'])
+        self.assertLess(result['p_value'], soak.DEFAULT_ALPHA)
+        self.assertEqual(6, result['windows'])
+
+    def test_flat_series(self):
+        result = soak.trend([100, 101, 100, 101, 100, 101])
+        self.assertFalse(result['drift'])
+        self.assertEqual(0.0, result['slope_per_window'])
+
+    def test_downward_trend_is_not_drift(self):
+        result = soak.trend([150, 140, 130, 120, 110, 100])
+        self.assertFalse(result['drift'])
+        self.assertEqual(-15, result['s'])
+
+    def test_tiny_slope_is_not_drift(self):
+        series = [1000 + 0.01 * i for i in range(8)]
+        result = soak.trend(series)
+        self.assertLess(result['p_value'], soak.DEFAULT_ALPHA)
+        self.assertFalse(result['drift'])
+        self.assertTrue(soak.trend(series, min_slope=0)['drift'])
+
+    def test_too_few_windows(self):
+        self.assertEqual({'windows': 3, 'drift': False},
+                         soak.trend([1, 2, 3, None]))
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+
+class TestRun(testtools.TestCase):
+
+    def setUp(self):
+        super(TestRun, self).setUp()
+        self.clock = FakeClock()
+        for attribute, kwargs in (('time', {'new': self.clock}),
+                                  ('current_rss', {'return_value': 1 << 20})):
+            patcher = mock.patch.object(soak, attribute, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _operation(self, latencies):
+        latencies = iter(latencies)
+
+        def operation():
+            self.clock.now += next(latencies)
+        return operation
+
+    def test_detects_the_drifting_operation(self):
+        calls = []
+        result = soak.run({
+            'steady': self._operation([0.01] * 10),
+            'slowing': self._operation([0.01 * i for i in range(1, 11)]),
+        }, iterations=10, window=0.0, on_window=calls.append)
+        # One window per iteration; the first one is left out as warmup.
+        self.assertEqual(10, len(result['windows']))
+        self.assertEqual(result['windows'], calls)
+        self.assertEqual(['slowing'], result['drift_detected'])
+        self.assertEqual(36, result['trends']['slowing']['s'])
+        self.assertEqual(10.0, result['trends']['slowing']['slope_per_window'])
+        self.assertEqual(0, result['trends']['steady']['s'])
+        self.assertFalse(result['trends']['rss']['drift'])
+
+    def test_errors_counted_per_window(self):
+        def failing():
+            raise ValueError()
+
+        result = soak.run({'failing': failing}, iterations=3, window=60.0)
+        self.assertEqual(1, len(result['windows']))
+        self.assertEqual(3, result['windows'][0]['operations']['failing'][
+            'errors'])
+        self.assertEqual({'windows': 0, 'drift': False},
+                         result['trends']['failing'])
+
+    def test_duration_or_iterations_needed(self):
+        self.assertRaises(ValueError, soak.run, {})
@@ -0,0 +1,63 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import subprocess
+
+import mock
+import testtools
+
+from trove_tempest_plugin.common import startup
+
+
+class TestStartupMeasure(testtools.TestCase):
+
+    @mock.patch.object(subprocess, 'check_output')
+    def test_median_and_budget(self, check_output):
+        check_output.side_effect = [b'0.030\n', b'0.010\n', b'0.020\n']
+        result = startup.measure('list-plugins', repeat=3)
+        self.assertEqual(20.0, result['median'])
+        self.assertEqual([30.0, 10.0, 20.0], result['samples'])
+        self.assertFalse(result['over_budget'])
+
+    @mock.patch.object(subprocess, 'check_output')
+    def test_over_budget_is_reported(self, check_output):
+        check_output.return_value = b'0.2\n'
+        result = startup.measure('list-plugins', repeat=1)
+        self.assertTrue(result['over_budget'])
+
+    @mock.patch.object(subprocess, 'check_output')
+    def test_error_is_reported(self, check_output):
+        check_output.side_effect = subprocess.CalledProcessError(
+            1, 'python', stderr=b'Traceback\nImportError: no module\n')
+        result = startup.measure('list-tests', repeat=3)
+        self.assertEqual('ImportError: no module', result['error'])
+        self.assertEqual(1, check_output.call_count)
+
+    def test_list_plugins_runs(self):
+        result = startup.measure('list-plugins', repeat=1)
+        self.assertNotIn('error', result)
+        self.assertEqual(1, len(result['samples']))
+
+
+class TestStartupModules(testtools.TestCase):
+    """Gate the plugin's startup on what it imports, not on timings."""
+
+    def test_loading_the_plugin_imports_no_options(self):
+        self.assertEqual(
+            ['trove_tempest_plugin', 'trove_tempest_plugin.plugin'],
+            startup.loaded_modules('list-plugins'))
+
+    def test_registering_options_imports_no_clients_or_tests(self):
+        self.assertEqual(['trove_tempest_plugin.config'],
+                         startup.loaded_modules('register-opts'))
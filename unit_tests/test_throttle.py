@@ -0,0 +1,157 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+import fixtures
+import testtools
+
+from trove_tempest_plugin.services.database import throttle
+
+URL = 'http://trove:8779/v1.0/project/flavors'
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+
+
+def _limit(verb, value, unit='MINUTE', regex='.*', **kwargs):
+    return dict(kwargs, verb=verb, value=value, unit=unit, regex=regex)
+
+
+class ClockTestCase(testtools.TestCase):
+
+    def setUp(self):
+        super(ClockTestCase, self).setUp()
+        self.clock = FakeClock()
+        self.useFixture(fixtures.MockPatchObject(throttle, 'time',
+                                                 self.clock))
+
+
+class TestTokenBucket(ClockTestCase):
+
+    def test_full_bucket_does_not_wait(self):
+        bucket = throttle.TokenBucket(rate=1, capacity=2)
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertEqual(0.0, bucket.reserve())
+
+    def test_reservations_queue_up(self):
+        bucket = throttle.TokenBucket(rate=2, capacity=1, tokens=0)
+        self.assertEqual(0.5, bucket.reserve())
+        self.assertEqual(1.0, bucket.reserve())
+
+    def test_refill_capped_at_capacity(self):
+        bucket = throttle.TokenBucket(rate=1, capacity=2, tokens=0)
+        self.clock.now += 100
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertEqual(1.0, bucket.reserve())
+
+
+class TestRateLimiter(ClockTestCase):
+
+    def test_seed_skips_absolute_and_unknown_units(self):
+        limiter = throttle.RateLimiter()
+        limiter.seed([_limit('GET', 10), _limit('ABSOLUTE', 5),
+                      _limit('POST', 10, unit='FORTNIGHT')])
+        self.assertTrue(limiter.seeded)
+        self.assertEqual(1, limiter.stats()['limits'])
+
+    def test_waits_once_remaining_is_used(self):
+        limiter = throttle.RateLimiter()
+        limiter.seed([_limit('GET', 60, remaining=1)])
+        self.assertEqual(0.0, limiter.acquire('get', URL))
+        self.assertEqual(1.0, limiter.acquire('get', URL))
+        self.assertEqual([1.0], self.clock.slept)
+        stats = limiter.stats()
+        self.assertEqual(1, stats['throttled_requests'])
+        self.assertEqual(1.0, stats['max_wait_seconds'])
+
+    def test_share_scales_the_limits(self):
+        limiter = throttle.RateLimiter(share=0.5)
+        limiter.seed([_limit('GET', 60, remaining=0)])
+        self.assertEqual(2.0, limiter.acquire('GET', URL))
+
+    def test_verb_and_path_must_match(self):
+        limiter = throttle.RateLimiter()
+        limiter.seed([_limit('GET', 1, remaining=0, regex='.*/limits'),
+                      _limit('POST', 1, remaining=0)])
+        self.assertEqual(0.0, limiter.acquire('GET', URL))
+        self.assertEqual(60.0, limiter.acquire('GET', URL[:-7] + 'limits'))
+
+    def test_seeded_from_seeder_once(self):
+        calls = []
+
+        def seeder():
+            calls.append(None)
+            return [_limit('GET', 60, remaining=0)]
+
+        limiter = throttle.RateLimiter()
+        limiter.set_seeder(seeder)
+        limiter.set_seeder(lambda: self.fail("second seeder used"))
+        self.assertEqual(1.0, limiter.acquire('GET', URL))
+        self.assertEqual(2.0, limiter.acquire('GET', URL))
+        self.assertEqual(1, len(calls))
+
+    def test_seeder_failure_disables_throttling(self):
+        def seeder():
+            raise RuntimeError()
+
+        log = self.useFixture(fixtures.FakeLogger(name=throttle.__name__))
+        limiter = throttle.RateLimiter()
+        limiter.set_seeder(seeder)
+        self.assertEqual(0.0, limiter.acquire('GET', URL))
+        self.assertTrue(limiter.seeded)
+        self.assertIn("requests will not be throttled", log.output)
+
+
+class TestRateLimiterSeeding(testtools.TestCase):
+
+    def test_requests_wait_for_seeding(self):
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def seeder():
+            fetching.set()
+            release.wait(10)
+            return [_limit('GET', 600, remaining=0)]
+
+        limiter = throttle.RateLimiter()
+        limiter.set_seeder(seeder)
+        waits = []
+        first = threading.Thread(
+            target=lambda: waits.append(limiter.acquire('GET', URL)))
+        first.start()
+        self.assertTrue(fetching.wait(10))
+        second = threading.Thread(
+            target=lambda: waits.append(limiter.acquire('GET', URL)))
+        second.start()
+        second.join(0.2)
+        self.assertTrue(second.is_alive())
+        self.assertEqual([], waits)
+        release.set()
+        first.join(10)
+        second.join(10)
+        # Both requests were throttled by the seeded bucket.
+        self.assertEqual(2, len(waits))
+        self.assertTrue(all(wait > 0 for wait in waits))
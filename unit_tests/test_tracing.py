@@ -0,0 +1,144 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+import threading
+
+import fixtures
+import mock
+import testtools
+
+from trove_tempest_plugin.services.database import context
+from trove_tempest_plugin.services.database import http
+from trove_tempest_plugin.services.database import tracing
+from unit_tests import base
+
+try:
+    import asyncio
+
+    from trove_tempest_plugin.services.database.json import aio_clients
+except (ImportError, SyntaxError):
+    # Python 2, or the asyncio extra is not installed.
+    aio_clients = None
+
+
+def _response(status=200):
+    return http.Response(status, 'OK', 11,
+                         {'X-OpenStack-Request-Id': 'req-1'}, 'url')
+
+
+def _read(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TracingTestCase(testtools.TestCase):
+
+    def setUp(self):
+        super(TracingTestCase, self).setUp()
+        self.addCleanup(tracing.disable)
+        self.addCleanup(context.clear)
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'trace.ndjson')
+
+
+class TestTracing(TracingTestCase):
+
+    def test_spans_written(self):
+        tracing.enable(self.path, flush_interval=0.01)
+        context.set_test('unit.Test.test_a', 'abc')
+        tracing.span(10.0, 0.5, 'GET', 'flavors/{id}', _response(), 42)
+        tracing.flush()
+        self.assertEqual([{
+            'start': 10.0, 'duration': 0.5, 'method': 'GET',
+            'url': 'flavors/{id}', 'status': 200, 'bytes': 42,
+            'request_id': 'req-1', 'test': 'unit.Test.test_a', 'id': 'abc',
+        }], _read(self.path))
+
+    def test_bad_path_fails_in_enable(self):
+        self.assertRaises(OSError, tracing.enable,
+                          os.path.join(self.path, 'missing', 'trace'))
+        self.assertFalse(tracing.enabled)
+        tracing.span(10.0, 0.5, 'GET', 'flavors', _response(), 42)
+        tracing.flush()
+
+    def test_write_failure_disables_tracing(self):
+        self.useFixture(fixtures.FakeLogger(name=tracing.__name__))
+        tracing.enable(self.path, flush_interval=0.01)
+        writer = tracing._writer
+        with mock.patch.object(writer, '_write', side_effect=OSError):
+            tracing.span(10.0, 0.5, 'GET', 'flavors', _response(), 42)
+            self.assertTrue(writer.flush(timeout=5))
+        self.assertTrue(writer.failed)
+        self.assertFalse(tracing.enabled)
+        tracing.span(10.0, 0.5, 'GET', 'flavors', _response(), 42)
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual([], _read(self.path))
+        tracing.enable(self.path, flush_interval=0.01)
+        self.assertIsNot(writer, tracing._writer)
+        self.assertTrue(tracing.enabled)
+
+
+class TestTraceWriter(TracingTestCase):
+
+    def test_full_queue_drops_and_flush_times_out(self):
+        patcher = mock.patch.object(tracing, 'MAX_QUEUED', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        writer = tracing.TraceWriter(self.path, flush_interval=0)
+        writing = threading.Event()
+        release = threading.Event()
+        write = writer._write
+
+        def blocked_write(batch):
+            writing.set()
+            release.wait(5)
+            write(batch)
+
+        span = (10.0, 0.5, 'GET', 'flavors', 200, 42, None, None, None)
+        with mock.patch.object(writer, '_write', side_effect=blocked_write):
+            writer.emit(span)
+            self.assertTrue(writing.wait(5))
+            for _ in range(3):
+                writer.emit(span)
+            self.assertEqual(1, writer.dropped)
+            self.assertFalse(writer.flush(timeout=0.05))
+            release.set()
+            self.assertTrue(writer.flush(timeout=5))
+        writer.close(timeout=5)
+        self.assertEqual(3, len(_read(self.path)))
+
+
+@testtools.skipIf(aio_clients is None, 'aiohttp is not installed')
+class TestAsyncTracing(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(TestAsyncTracing, self).setUp()
+        self.addCleanup(tracing.disable)
+        self.path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                                 'trace.ndjson')
+
+    def test_async_requests_traced(self):
+        tracing.enable(self.path, flush_interval=0.01)
+        client = self.client(aio_clients.AsyncDatabaseFlavorsClient)
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop.run_until_complete(client.show_db_flavor(3))
+        loop.run_until_complete(client.close())
+        tracing.flush()
+        spans = _read(self.path)
+        self.assertEqual(1, len(spans))
+        self.assertEqual('flavors/{id}', spans[0]['url'])
+        self.assertEqual(200, spans[0]['status'])
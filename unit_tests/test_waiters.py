@@ -0,0 +1,158 @@
+# Copyright 2026 OpenStack Contributors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+import itertools
+
+import mock
+from tempest.lib import exceptions as lib_exc
+import testtools
+
+from trove_tempest_plugin.common import waiters
+from trove_tempest_plugin import exceptions
+
+
+class ScriptedInstancesClient(object):
+    """Instances client listing one scripted status map per poll.
+
+    The last status map is listed again once the script runs out.
+    """
+
+    build_interval = 1
+    build_timeout = 10
+
+    def __init__(self, *polls):
+        self.polls = list(polls)
+        self.listed = 0
+
+    def iter_db_instances(self):
+        statuses = self.polls[min(self.listed, len(self.polls) - 1)]
+        self.listed += 1
+        return [{'id': i, 'status': s} for i, s in sorted(statuses.items())]
+
+
+class TestBackoffIntervals(testtools.TestCase):
+
+    def test_doubles_up_to_cap(self):
+        self.assertEqual(
+            [1.0, 2.0, 4.0, 8.0, 10, 10],
+            list(itertools.islice(waiters.backoff_intervals(1, 10), 6)))
+
+    def test_factor(self):
+        self.assertEqual(
+            [0.5, 1.5, 4.5, 5],
+            list(itertools.islice(
+                waiters.backoff_intervals(0.5, 5, factor=3), 4)))
+
+    def test_first_interval_above_cap_is_kept(self):
+        self.assertEqual(
+            [20.0, 10, 10],
+            list(itertools.islice(waiters.backoff_intervals(20, 10), 3)))
+
+
+class TestWaitForDbInstancesStatus(testtools.TestCase):
+
+    def setUp(self):
+        super(TestWaitForDbInstancesStatus, self).setUp()
+        self.now = 1000.0
+        self.sleeps = []
+        patcher = mock.patch.object(waiters, 'time')
+        fake_time = patcher.start()
+        self.addCleanup(patcher.stop)
+        fake_time.time.side_effect = lambda: self.now
+        fake_time.sleep.side_effect = self._sleep
+
+    def _sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def test_returns_once_all_reach_status(self):
+        client = ScriptedInstancesClient(
+            {'a': 'BUILD', 'b': 'BUILD'},
+            {'a': 'ACTIVE', 'b': 'BUILD'},
+            {'a': 'ACTIVE', 'b': 'ACTIVE'})
+        found = waiters.wait_for_db_instances_status(
+            client, ['a', 'b'], 'ACTIVE')
+        self.assertEqual(['ACTIVE', 'ACTIVE'],
+                         [found[i]['status'] for i in ('a', 'b')])
+        self.assertEqual(3, client.listed)
+        self.assertEqual([1.0, 2.0], self.sleeps)
+
+    def test_polls_back_off_to_max_interval(self):
+        client = ScriptedInstancesClient({'a': 'BUILD'}, {'a': 'BUILD'},
+                                         {'a': 'BUILD'}, {'a': 'BUILD'},
+                                         {'a': 'ACTIVE'})
+        waiters.wait_for_db_instances_status(
+            client, ['a'], 'ACTIVE', interval=1, max_interval=3)
+        self.assertEqual([1.0, 2.0, 3, 3], self.sleeps)
+
+    def test_error_status_raises(self):
+        client = ScriptedInstancesClient({'a': 'BUILD'}, {'a': 'ERROR'})
+        e = self.assertRaises(exceptions.DatabaseInstanceErrorException,
+                              waiters.wait_for_db_instances_status,
+                              client, ['a'], 'ACTIVE')
+        self.assertIn('went to status ERROR while waiting for ACTIVE',
+                      str(e))
+        self.assertEqual(2, client.listed)
+
+    def test_timeout(self):
+        client = ScriptedInstancesClient({'a': 'ACTIVE', 'b': 'BUILD'})
+        e = self.assertRaises(lib_exc.TimeoutException,
+                              waiters.wait_for_db_instances_status,
+                              client, ['a', 'b', 'c'], 'ACTIVE',
+                              interval=2, max_interval=4, timeout=9)
+        self.assertIn('within the required time (9 s)', str(e))
+        self.assertIn('Current statuses: b: BUILD, c: not listed', str(e))
+        # The last sleep is cut short so the wait ends on the timeout.
+        self.assertEqual([2.0, 4.0, 3.0], self.sleeps)
+        self.assertEqual(1009.0, self.now)
+        self.assertEqual(4, client.listed)
+
+    def test_timeout_defaults_to_build_timeout(self):
+        client = ScriptedInstancesClient({'a': 'BUILD'})
+        e = self.assertRaises(lib_exc.TimeoutException,
+                              waiters.wait_for_db_instances_status,
+                              client, ['a'], 'ACTIVE', max_interval=4)
+        self.assertIn('within the required time (10 s)', str(e))
+        self.assertEqual([1.0, 2.0, 4, 3.0], self.sleeps)
+        self.assertEqual(1010.0, self.now)
+
+
+class TestWaitForDbInstancesDeletion(testtools.TestCase):
+
+    def setUp(self):
+        super(TestWaitForDbInstancesDeletion, self).setUp()
+        self.now = 0.0
+        patcher = mock.patch.object(waiters, 'time')
+        fake_time = patcher.start()
+        self.addCleanup(patcher.stop)
+        fake_time.time.side_effect = lambda: self.now
+        fake_time.sleep.side_effect = self._sleep
+
+    def _sleep(self, seconds):
+        self.now += seconds
+
+    def test_returns_once_not_listed(self):
+        client = ScriptedInstancesClient({'a': 'SHUTDOWN', 'b': 'ACTIVE'},
+                                         {'b': 'ACTIVE'})
+        waiters.wait_for_db_instances_deletion(client, ['a'])
+        self.assertEqual(2, client.listed)
+        self.assertEqual(1.0, self.now)
+
+    def test_timeout(self):
+        client = ScriptedInstancesClient({'a': 'SHUTDOWN'})
+        e = self.assertRaises(lib_exc.TimeoutException,
+                              waiters.wait_for_db_instances_deletion,
+                              client, ['a', 'b'])
+        self.assertIn('Database instances a were not deleted within the '
+                      'required time (10 s)', str(e))
+        self.assertEqual(10.0, self.now)